@@ -0,0 +1,214 @@
+"""
+Benchmark of `KiranCaller` against a local stub Bot API server.
+
+Measures the calls per second of `get_chat` and `send_message` when every
+request is encoded once into a JSON body and every response is decoded once
+through the cached `Response[T]` decoders, next to the previous path which
+encoded each argument into the query string and parsed each response three
+times.
+
+Run with `python -m benchmarks.caller_throughput` from the repository root.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+
+import httpx
+import msgspec
+
+import kiran
+from kiran.abc.dependent import ChatFullInfo
+from kiran.abc.dependent import Message
+from kiran.abc.userinterface import InlineKeyboardButton
+from kiran.abc.userinterface import InlineKeyboardMarkup
+from kiran.core.payloads import SendMessagePayload
+from kiran.core.ratelimit import RateLimiter
+
+CALLS = 3_000
+CONCURRENCY = 8
+
+CHAT = {
+    "id": -1001234567890,
+    "type": "supergroup",
+    "title": "Benchmark",
+    "username": "kiran_benchmark",
+    "accent_color_id": 3,
+    "max_reaction_count": 11,
+    "description": "A chat served by the stub server.",
+}
+MESSAGE = {
+    "message_id": 42,
+    "date": 1720000000,
+    "chat": CHAT,
+    "from": {"id": 1, "is_bot": True, "first_name": "Kiran"},
+    "text": "Hello from the stub server.",
+    "entities": [{"type": "bold", "offset": 0, "length": 5}],
+}
+BODIES = {
+    b"getChat": msgspec.json.encode({"ok": True, "result": CHAT}),
+    b"sendMessage": msgspec.json.encode({"ok": True, "result": MESSAGE}),
+}
+
+
+async def serve_stub(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            path = head.split(b" ", 2)[1].split(b"?", 1)[0]
+            body = BODIES.get(path.rsplit(b"/", 1)[-1], BODIES[b"getChat"])
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+            )
+            await writer.drain()
+    except (
+        asyncio.IncompleteReadError,
+        asyncio.CancelledError,
+        ConnectionError,
+    ):
+        writer.close()
+
+
+def legacy_params(**kwargs: typing.Any) -> typing.Dict[str, str]:
+    return {
+        name: msgspec.json.encode(argument)
+        .decode()
+        .strip('"')
+        .replace("\\n", "\n")
+        for name, argument in kwargs.items()
+        if argument is not None
+    }
+
+
+def legacy_decode(response: httpx.Response, result_type: typing.Any) -> None:
+    if response.json()["ok"] is True:
+        msgspec.json.decode(
+            msgspec.json.encode(response.json()["result"]),
+            type=result_type,
+            strict=False,
+        )
+
+
+async def measure(
+    call: typing.Callable[[], typing.Awaitable[typing.Any]],
+) -> float:
+    remaining = CALLS
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    return CALLS / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    server = await asyncio.start_server(serve_stub, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    bot = kiran.KiranBot(
+        token="0:benchmark",
+        logging_settings=kiran.LoggerSettings("no-error"),
+        rate_limiter=RateLimiter(
+            global_rate=float("inf"), chat_rate=float("inf")
+        ),
+    )
+    bot.session = httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}/bot0:benchmark",
+        limits=httpx.Limits(
+            max_connections=CONCURRENCY,
+            max_keepalive_connections=CONCURRENCY,
+        ),
+    )
+    caller = bot.caller
+
+    async def legacy_get_chat() -> None:
+        response = await bot.session.get(
+            "getChat", params=legacy_params(chat_id=1)
+        )
+        legacy_decode(response, ChatFullInfo)
+
+    async def legacy_send_message() -> None:
+        response = await bot.session.get(
+            "sendMessage", params=legacy_params(chat_id=1, text="Hello")
+        )
+        legacy_decode(response, Message)
+
+    for _ in range(10):
+        await asyncio.gather(
+            *(caller.get_chat(chat_id=1) for _ in range(CONCURRENCY)),
+            *(legacy_get_chat() for _ in range(CONCURRENCY)),
+        )
+    results = {
+        "get_chat (single pass)": await measure(
+            lambda: caller.get_chat(chat_id=1)
+        ),
+        "get_chat (legacy)": await measure(legacy_get_chat),
+        "send_message (single pass)": await measure(
+            lambda: caller.send_message(chat_id=1, text="Hello")
+        ),
+        "send_message (legacy)": await measure(legacy_send_message),
+    }
+    for name, calls_per_second in results.items():
+        print(f"{name:<36} {calls_per_second:10.0f} calls/s")
+
+    content = BODIES[b"sendMessage"]
+    response = httpx.Response(200, content=content)
+    decoder = caller.decoders.get(Message)
+    iterations = 20_000
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decoder.decode(response.content)
+    once = (time.perf_counter() - start) / iterations * 1e6
+    start = time.perf_counter()
+    for _ in range(iterations):
+        legacy_decode(response, Message)
+    legacy = (time.perf_counter() - start) / iterations * 1e6
+    print(f"decode only: {once:.2f} us once, {legacy:.2f} us three times")
+
+    text = "Hello from the benchmark.\n" * 40
+    markup = InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text=str(row * 4 + column),
+                    callback_data=f"b:{row}:{column}",
+                )
+                for column in range(4)
+            ]
+            for row in range(4)
+        ]
+    )
+    start = time.perf_counter()
+    for _ in range(iterations):
+        caller._encode(
+            SendMessagePayload(chat_id=1, text=text, reply_markup=markup)
+        )
+    once = (time.perf_counter() - start) / iterations * 1e6
+    start = time.perf_counter()
+    for _ in range(iterations):
+        legacy_params(chat_id=1, text=text, reply_markup=markup)
+    legacy = (time.perf_counter() - start) / iterations * 1e6
+    print(
+        f"encode only: {once:.2f} us single pass, {legacy:.2f} us per argument"
+    )
+
+    await bot.session.aclose()
+    server.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+"""
+Benchmark of the composed middleware chain.
+
+Compares awaiting a handler directly, through middlewares composed by
+`kiran.compose_middlewares` and through hand written wrapper closures.
+
+Run with `python -m benchmarks.middleware_chain` from the repository root.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+
+from kiran.components.middleware import compose_middlewares
+
+ITERATIONS = 200_000
+LAYERS = (1, 3, 5)
+
+
+async def handler(context: typing.Any) -> None:
+    return None
+
+
+async def passthrough(call_next: typing.Any, context: typing.Any) -> None:
+    await call_next(context)
+
+
+def wrap_by_hand(func: typing.Any) -> typing.Any:
+    async def wrapper(context: typing.Any) -> None:
+        await passthrough(func, context)
+
+    return wrapper
+
+
+async def measure(func: typing.Any) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await func(None)
+    return (time.perf_counter() - start) / ITERATIONS * 1e9
+
+
+async def nested(context: typing.Any) -> None:
+    await handler(context)
+
+
+async def main() -> None:
+    direct = await measure(handler)
+    direct_call = await measure(nested) - direct
+    print(f"direct handler call: {direct:8.1f} ns")
+    print(f"one extra direct call: {direct_call:6.1f} ns")
+    for layers in LAYERS:
+        composed = compose_middlewares(handler, [passthrough] * layers)
+        by_hand = handler
+        for _ in range(layers):
+            by_hand = wrap_by_hand(by_hand)
+        composed_ns = await measure(composed)
+        by_hand_ns = await measure(by_hand)
+        print(
+            f"{layers} layer(s): composed {composed_ns:8.1f} ns "
+            f"({(composed_ns - direct) / layers:6.1f} ns/layer), "
+            f"hand wrapped {by_hand_ns:8.1f} ns "
+            f"({(by_hand_ns - direct) / layers:6.1f} ns/layer)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -11,3 +11,4 @@ from .components import *
 from .core import *
 from .impl import *
 from .logger import *
+from .transport import *
@@ -1144,3 +1144,36 @@ class ChatFullInfo(Chat):
     Primary invite link, for groups, supergroups and channel chats
     """
     pinned_message: typing.Optional[Message] = None
+
+
+class CallbackQuery(msgspec.Struct):
+    """This object represents an incoming callback query from a callback button in an [inline keyboard](https://core.telegram.org/bots/features#inline-keyboards)."""
+
+    id: str
+    """
+    Unique identifier for this query.
+    """
+    from_user: User = msgspec.field(name="from")
+    """
+    Sender of the query.
+    """
+    chat_instance: str
+    """
+    Global identifier, uniquely corresponding to the chat to which the message with the callback button was sent. Useful for high scores in games.
+    """
+    message: typing.Optional[Message] = None
+    """
+    Message sent by the bot with the callback button that originated the query.
+    """
+    inline_message_id: typing.Optional[str] = None
+    """
+    Identifier of the message sent via the bot in inline mode, that originated the query.
+    """
+    data: typing.Optional[str] = None
+    """
+    Data associated with the callback button. Be aware that the message originated the query can contain no callback buttons with this data.
+    """
+    game_short_name: typing.Optional[str] = None
+    """
+    Short name of a Game to be returned, serves as the unique identifier for the game.
+    """
@@ -23,4 +23,5 @@ class File(msgspec.Struct):
     file_path: typing.Optional[str] = None
     """
     File path. Use `https://api.telegram.org/file/bot<token>/<file_path>` to get the file.
+    With a Bot API server started with `--local`, the absolute path of the file on its file system.
     """
@@ -4,6 +4,11 @@ import typing
 
 import msgspec
 
+from ..core.enums import ParseMode
+
+if typing.TYPE_CHECKING:
+    from .dependent import MessageEntity
+
 
 class PhotoSize(msgspec.Struct):
     """A class representing the photo size."""
@@ -234,3 +239,161 @@ class Voice(msgspec.Struct):
     """
     File size in bytes
     """
+
+
+class InputMediaPhoto(
+    msgspec.Struct, tag_field="type", tag="photo", omit_defaults=True
+):
+    """A photo to be sent in a media group."""
+
+    media: typing.Any
+    """
+    File to send: a file id, an HTTP URL, or a path, file object or `InputFile` to upload
+    """
+    caption: typing.Optional[str] = None
+    """
+    Caption of the photo, 0-1024 characters after entities parsing
+    """
+    parse_mode: typing.Optional[ParseMode] = None
+    """
+    Mode for parsing entities in the photo caption
+    """
+    caption_entities: typing.Optional[typing.List[MessageEntity]] = None
+    """
+    Special entities that appear in the caption, instead of parse_mode
+    """
+    show_caption_above_media: typing.Optional[bool] = None
+    """
+    Pass True, if the caption must be shown above the message media
+    """
+    has_spoiler: typing.Optional[bool] = None
+    """
+    Pass True if the photo needs to be covered with a spoiler animation
+    """
+
+
+class InputMediaVideo(
+    msgspec.Struct, tag_field="type", tag="video", omit_defaults=True
+):
+    """A video to be sent in a media group."""
+
+    media: typing.Any
+    """
+    File to send: a file id, an HTTP URL, or a path, file object or `InputFile` to upload
+    """
+    thumbnail: typing.Any = None
+    """
+    Thumbnail of the file, a path, file object or `InputFile` to upload
+    """
+    caption: typing.Optional[str] = None
+    """
+    Caption of the video, 0-1024 characters after entities parsing
+    """
+    parse_mode: typing.Optional[ParseMode] = None
+    """
+    Mode for parsing entities in the video caption
+    """
+    caption_entities: typing.Optional[typing.List[MessageEntity]] = None
+    """
+    Special entities that appear in the caption, instead of parse_mode
+    """
+    show_caption_above_media: typing.Optional[bool] = None
+    """
+    Pass True, if the caption must be shown above the message media
+    """
+    width: typing.Optional[int] = None
+    """
+    Video width
+    """
+    height: typing.Optional[int] = None
+    """
+    Video height
+    """
+    duration: typing.Optional[int] = None
+    """
+    Video duration in seconds
+    """
+    supports_streaming: typing.Optional[bool] = None
+    """
+    Pass True if the uploaded video is suitable for streaming
+    """
+    has_spoiler: typing.Optional[bool] = None
+    """
+    Pass True if the video needs to be covered with a spoiler animation
+    """
+
+
+class InputMediaAudio(
+    msgspec.Struct, tag_field="type", tag="audio", omit_defaults=True
+):
+    """An audio file to be sent in a media group."""
+
+    media: typing.Any
+    """
+    File to send: a file id, an HTTP URL, or a path, file object or `InputFile` to upload
+    """
+    thumbnail: typing.Any = None
+    """
+    Thumbnail of the file, a path, file object or `InputFile` to upload
+    """
+    caption: typing.Optional[str] = None
+    """
+    Caption of the audio, 0-1024 characters after entities parsing
+    """
+    parse_mode: typing.Optional[ParseMode] = None
+    """
+    Mode for parsing entities in the audio caption
+    """
+    caption_entities: typing.Optional[typing.List[MessageEntity]] = None
+    """
+    Special entities that appear in the caption, instead of parse_mode
+    """
+    duration: typing.Optional[int] = None
+    """
+    Duration of the audio in seconds
+    """
+    performer: typing.Optional[str] = None
+    """
+    Performer of the audio
+    """
+    title: typing.Optional[str] = None
+    """
+    Title of the audio
+    """
+
+
+class InputMediaDocument(
+    msgspec.Struct, tag_field="type", tag="document", omit_defaults=True
+):
+    """A general file to be sent in a media group."""
+
+    media: typing.Any
+    """
+    File to send: a file id, an HTTP URL, or a path, file object or `InputFile` to upload
+    """
+    thumbnail: typing.Any = None
+    """
+    Thumbnail of the file, a path, file object or `InputFile` to upload
+    """
+    caption: typing.Optional[str] = None
+    """
+    Caption of the document, 0-1024 characters after entities parsing
+    """
+    parse_mode: typing.Optional[ParseMode] = None
+    """
+    Mode for parsing entities in the document caption
+    """
+    caption_entities: typing.Optional[typing.List[MessageEntity]] = None
+    """
+    Special entities that appear in the caption, instead of parse_mode
+    """
+    disable_content_type_detection: typing.Optional[bool] = None
+    """
+    Disables automatic server-side content type detection for uploaded files
+    """
+
+
+InputMedia = typing.Union[
+    InputMediaPhoto, InputMediaVideo, InputMediaAudio, InputMediaDocument
+]
+"""An item of a media group."""
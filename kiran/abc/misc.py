@@ -130,3 +130,16 @@ class LoginUrl(msgspec.Struct):
     """
     Pass True to request the permission for your bot to send messages to the user.
     """
+
+
+class ResponseParameters(msgspec.Struct):
+    """Describes why a request was unsuccessful."""
+
+    migrate_to_chat_id: typing.Optional[int] = None
+    """
+    The group has been migrated to a supergroup with the specified identifier.
+    """
+    retry_after: typing.Optional[int] = None
+    """
+    In case of exceeding flood control, the number of seconds left to wait before the request can be repeated.
+    """
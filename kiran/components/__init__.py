@@ -1,4 +1,7 @@
 from __future__ import annotations
 
+from .callbacks import *
 from .commands import *
 from .context import *
+from .middleware import *
+from .triggers import *
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import typing
+
+CallbackKey = typing.TypeVar("CallbackKey", bound=typing.Hashable)
+
+MAX_CALLBACK_DATA_BYTES: typing.Final = 64
+"""Maximum size of `InlineKeyboardButton.callback_data` accepted by Telegram."""
+
+DEFAULT_ACK_AFTER: typing.Final = 0.5
+"""
+Seconds a handler has to answer its callback query with a notification or an
+alert of its own before the query is acknowledged without text.
+"""
+
+
+class CallbackRoute(typing.NamedTuple, typing.Generic[CallbackKey]):
+    """A route resolved from the data of a callback query."""
+
+    key: CallbackKey
+    """The value registered for the prefix."""
+    prefix: typing.Tuple[str, ...]
+    """The segments of the prefix that matched."""
+    args: typing.Tuple[str, ...]
+    """The remaining segments of the data, passed to the handler."""
+    ack_after: float
+    """Grace period in seconds before the query is acknowledged automatically."""
+
+
+class CallbackRouter(typing.Generic[CallbackKey]):
+    """
+    Routes callback queries on structured `callback_data`.
+
+    The data is expected to be made of segments joined with a separator, for
+    example `vote:poll42:yes`. Prefixes are stored in a trie of hash tables,
+    one level per segment, so resolving a route costs one dictionary lookup per
+    segment of the data whatever the number of registered prefixes. The
+    longest registered prefix wins and the remaining segments become the
+    arguments of the handler.
+
+    Parameters
+    ----------
+    separator : str
+        The separator between the segments of the data. Defaults to `:`.
+    ack_after : float
+        Default grace period in seconds before a query is acknowledged when
+        its handler did not answer it. Defaults to 0.5, leaving the handler
+        time to answer with a notification or an alert. A handler returning
+        without answering is acknowledged at once.
+    """
+
+    def __init__(
+        self, separator: str = ":", ack_after: float = DEFAULT_ACK_AFTER
+    ) -> None:
+        if not separator:
+            raise ValueError("Callback data separator can not be empty.")
+        self.separator = separator
+        self.ack_after = ack_after
+        self._root: typing.Dict[str, typing.Any] = {}
+        self._routes: typing.Dict[
+            typing.Tuple[str, ...],
+            typing.Tuple[CallbackKey, typing.Optional[float]],
+        ] = {}
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def _segments(self, prefix: str) -> typing.Tuple[str, ...]:
+        return tuple(prefix.split(self.separator)) if prefix else ()
+
+    def add(
+        self,
+        prefix: str,
+        key: CallbackKey,
+        ack_after: typing.Optional[float] = None,
+    ) -> None:
+        """
+        Register a prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            The leading segments of the data, an empty prefix catches every
+            query no other prefix matches.
+        key : CallbackKey
+            The value returned when the prefix matches.
+        ack_after : typing.Optional[float]
+            Grace period in seconds before the query is acknowledged
+            automatically, None to use the router default.
+        """
+        segments = self._segments(prefix)
+        if segments in self._routes:
+            raise ValueError(f"Callback prefix already registered: {prefix!r}")
+        node = self._root
+        for segment in segments:
+            node = node.setdefault(segment, {})
+        self._routes[segments] = (key, ack_after)
+
+    def remove(self, prefix: str) -> None:
+        """
+        Unregister a prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            The prefix given to `add`.
+        """
+        del self._routes[self._segments(prefix)]
+
+    def resolve(
+        self, data: typing.Optional[str]
+    ) -> typing.Optional[CallbackRoute[CallbackKey]]:
+        """
+        Find the route of the data of a callback query.
+
+        Parameters
+        ----------
+        data : typing.Optional[str]
+            The `callback_data` of the query.
+
+        Returns
+        -------
+        typing.Optional[CallbackRoute[CallbackKey]]
+            The route of the longest matching prefix, None if nothing matched.
+        """
+        segments = self._segments(data or "")
+        node = self._root
+        matched = 0 if () in self._routes else -1
+        for depth, segment in enumerate(segments, start=1):
+            next_node = node.get(segment)
+            if next_node is None:
+                break
+            node = next_node
+            if segments[:depth] in self._routes:
+                matched = depth
+        if matched < 0:
+            return None
+        key, ack_after = self._routes[segments[:matched]]
+        return CallbackRoute(
+            key,
+            segments[:matched],
+            segments[matched:],
+            self.ack_after if ack_after is None else ack_after,
+        )
+
+    def pack(self, prefix: str, *args: typing.Any) -> str:
+        """
+        Build the `callback_data` of a button routed to a prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            The registered prefix.
+        *args : typing.Any
+            The arguments appended to the prefix, converted with `str`.
+
+        Returns
+        -------
+        str
+            The data to use as `InlineKeyboardButton.callback_data`.
+        """
+        arguments = [str(arg) for arg in args]
+        for argument in arguments:
+            if self.separator in argument:
+                raise ValueError(
+                    f"Callback argument contains the separator: {argument!r}"
+                )
+        data = self.separator.join(
+            [prefix, *arguments] if prefix else arguments
+        )
+        if len(data.encode()) > MAX_CALLBACK_DATA_BYTES:
+            raise ValueError(
+                f"Callback data is longer than {MAX_CALLBACK_DATA_BYTES} bytes: {data!r}"
+            )
+        return data
@@ -10,6 +10,8 @@ if typing.TYPE_CHECKING:
 
 
 if typing.TYPE_CHECKING:
+    from ..abc.dependent import CallbackQuery
+    from ..abc.dependent import Message
     from ..core.methods import KiranCaller
     from ..impl import KiranBot
 
@@ -124,3 +126,193 @@ class CommandContext(KiranContext):
 
     @staticmethod
     async def respond(**krwags: typing.Any): ...
+
+
+class TriggerContext(KiranContext):
+    def __init__(
+        self,
+        message: "Message",
+        caller: "KiranCaller",
+        client: "KiranBot",
+        context_time: datetime.datetime,
+    ) -> None:
+        self._message = message
+        super().__init__(caller, client, context_time)
+
+    @property
+    def message(self) -> "Message":
+        """
+        Message that matched the trigger.
+
+        Returns
+        -------
+        message: Message
+            Message that matched the trigger.
+        """
+        return self._message
+
+    @property
+    def text(self) -> str:
+        """
+        Text of the message that matched the trigger.
+
+        Returns
+        -------
+        text: str
+            Text of the message that matched the trigger.
+        """
+        return self._message.text or ""
+
+    @property
+    def message_id(self) -> int:
+        """
+        Message ID of the message that matched the trigger.
+
+        Returns
+        -------
+        message_id: int
+            Message ID of the message that matched the trigger.
+        """
+        return self._message.message_id
+
+    @property
+    def chat_id(self) -> int:
+        """
+        Chat ID of the chat the message was sent in.
+
+        Returns
+        -------
+        chat_id: int
+            Chat ID of the chat the message was sent in.
+        """
+        return self._message.chat.id
+
+
+class CallbackContext(KiranContext):
+    def __init__(
+        self,
+        query: "CallbackQuery",
+        args: typing.Tuple[str, ...],
+        caller: "KiranCaller",
+        client: "KiranBot",
+        context_time: datetime.datetime,
+    ) -> None:
+        self._query = query
+        self._args = args
+        self._answered = False
+        super().__init__(caller, client, context_time)
+
+    @property
+    def query(self) -> "CallbackQuery":
+        """
+        Callback query that invoked the handler.
+
+        Returns
+        -------
+        query: CallbackQuery
+            Callback query that invoked the handler.
+        """
+        return self._query
+
+    @property
+    def data(self) -> str:
+        """
+        Callback data of the button that was pressed.
+
+        Returns
+        -------
+        data: str
+            Callback data of the button that was pressed.
+        """
+        return self._query.data or ""
+
+    @property
+    def args(self) -> typing.Tuple[str, ...]:
+        """
+        Segments of the callback data following the routed prefix.
+
+        Returns
+        -------
+        args: typing.Tuple[str, ...]
+            Segments of the callback data following the routed prefix.
+        """
+        return self._args
+
+    @property
+    def chat_id(self) -> typing.Optional[int]:
+        """
+        Chat ID of the message carrying the button, if available.
+
+        Returns
+        -------
+        chat_id: typing.Optional[int]
+            Chat ID of the message carrying the button.
+        """
+        message = self._query.message
+        return message.chat.id if message is not None else None
+
+    @property
+    def message_id(self) -> typing.Optional[int]:
+        """
+        Message ID of the message carrying the button, if available.
+
+        Returns
+        -------
+        message_id: typing.Optional[int]
+            Message ID of the message carrying the button.
+        """
+        message = self._query.message
+        return message.message_id if message is not None else None
+
+    @property
+    def answered(self) -> bool:
+        """
+        Whether the callback query has already been answered.
+
+        Returns
+        -------
+        answered: bool
+            Whether the callback query has already been answered.
+        """
+        return self._answered
+
+    async def answer(
+        self,
+        text: typing.Optional[str] = None,
+        show_alert: typing.Optional[bool] = None,
+        url: typing.Optional[str] = None,
+        cache_time: typing.Optional[int] = None,
+    ) -> bool:
+        """
+        Answer the callback query, stopping the spinner of the user.
+
+        A query can only be answered once, later calls do nothing. Queries not
+        answered by their handler are acknowledged by Kiran after the grace
+        period of their route.
+
+        Parameters
+        ----------
+        text : typing.Optional[str]
+            Text of the notification, 0-200 characters.
+        show_alert : typing.Optional[bool]
+            Whether an alert is shown instead of a notification.
+        url : typing.Optional[str]
+            URL opened by the client of the user.
+        cache_time : typing.Optional[int]
+            Seconds the result may be cached client side.
+
+        Returns
+        -------
+        bool
+            True if this call answered the query.
+        """
+        if self._answered:
+            return False
+        self._answered = True
+        return await self.call.answer_callback_query(
+            callback_query_id=self._query.id,
+            text=text,
+            show_alert=show_alert,
+            url=url,
+            cache_time=cache_time,
+        )
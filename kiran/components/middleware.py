@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import types
+import typing
+
+if typing.TYPE_CHECKING:
+    from .context import KiranContext
+
+MiddlewareHandler = typing.Callable[["KiranContext"], typing.Awaitable[None]]
+"""A coroutine function taking a context, the innermost command handler."""
+
+Middleware = typing.Callable[..., typing.Awaitable[None]]
+"""
+A coroutine function wrapping a handler, called as `middleware(call_next, context)`.
+
+The middleware runs its pre-processing, then awaits `call_next(context)` to
+hand over to the next layer, and runs its post-processing afterwards. Not
+awaiting `call_next` short-circuits the chain and the handler never runs.
+
+Examples
+--------
+```python
+async def only_admins(call_next, context: kiran.CommandContext) -> None:
+    if context.chat_id in ADMIN_CHATS:
+        await call_next(context)
+```
+"""
+
+
+def compose_middlewares(
+    handler: MiddlewareHandler,
+    middlewares: typing.Sequence[Middleware],
+) -> MiddlewareHandler:
+    """
+    Compose the middlewares around the handler into a single callable.
+
+    The first middleware is the outermost layer. Each layer is bound to the
+    next one as a method object, so the composed chain does not add any Python
+    frame apart from the middlewares themselves.
+
+    Parameters
+    ----------
+    handler : MiddlewareHandler
+        The innermost handler of the chain.
+    middlewares : typing.Sequence[Middleware]
+        The middlewares to wrap the handler with, outermost first.
+
+    Returns
+    -------
+    MiddlewareHandler
+        The composed handler, or the handler itself when no middleware is set.
+    """
+    composed = handler
+    for middleware in reversed(middlewares):
+        composed = types.MethodType(middleware, composed)
+    return composed
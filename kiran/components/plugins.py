@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import ast
+import typing
+
+from ..abc.bots import BotCommandScope
+from ..abc.bots import BotCommandScopeDefault
+from ..errors import CommandImplementationError
+from .commands import CallableBotCommandDetails
+from .commands import CommandImplements
+from .commands import LanguageCode
+
+if typing.TYPE_CHECKING:
+    from ..core.events import KiranEvent
+    from .context import CommandContext
+
+
+class Plugin:
+    """
+    A group of commands and listeners living in their own module.
+
+    A plugin module creates a `Plugin` at module level and registers its
+    commands and listeners on it instead of on the bot. The bot then loads,
+    reloads or unloads the whole module at runtime with
+    `KiranBot.load_plugin`, `KiranBot.reload_plugin` and
+    `KiranBot.unload_plugin`, or discovers every plugin of a package with
+    `KiranBot.discover_plugins`.
+
+    Parameters
+    ----------
+    name : str
+        The name of the plugin, used in logs.
+
+    Examples
+    --------
+    ```python
+    plugin = kiran.Plugin("greetings")
+
+
+    @plugin.command(name="hello", description="Says hello.")
+    @kiran.implements(kiran.CommandImplements.SLASH_COMMAND)
+    async def hello(command: kiran.CommandContext) -> None: ...
+    ```
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.commands: typing.Dict[
+            CallableBotCommandDetails,
+            typing.Tuple[
+                CommandImplements,
+                typing.Callable[["CommandContext"], typing.Awaitable[None]],
+            ],
+        ] = {}
+        self.listeners: typing.List[
+            typing.Tuple[
+                typing.Type["KiranEvent"],
+                typing.Callable[["KiranEvent"], typing.Awaitable[None]],
+            ]
+        ] = []
+
+    def __repr__(self) -> str:
+        return f"Plugin(name={self.name!r})"
+
+    def command(
+        self,
+        name: str,
+        description: str,
+        scopes: typing.Optional[BotCommandScope] = BotCommandScopeDefault(),
+        language_code: typing.Optional[typing.Union[LanguageCode, str]] = None,
+    ) -> typing.Callable[
+        [typing.Callable[["CommandContext"], typing.Awaitable[None]]],
+        typing.Callable[["CommandContext"], typing.Awaitable[None]],
+    ]:
+        def decorator(
+            func: typing.Callable[["CommandContext"], typing.Awaitable[None]],
+        ) -> typing.Callable[["CommandContext"], typing.Awaitable[None]]:
+            if not hasattr(func, "__implements__"):
+                raise CommandImplementationError(
+                    message=f"Implementation method not specified. Command: {name}, plugin: {self.name}",
+                )
+            self.commands[
+                CallableBotCommandDetails(
+                    name=name,
+                    description=description,
+                    scope=scopes,
+                    language_code=language_code,
+                )
+            ] = (func.__implements__, func)  # type: ignore
+            return func
+
+        return decorator
+
+    def listen(
+        self, event_type: typing.Type["KiranEvent"]
+    ) -> typing.Callable[
+        [typing.Callable[["KiranEvent"], typing.Awaitable[None]]],
+        typing.Callable[["KiranEvent"], typing.Awaitable[None]],
+    ]:
+        def decorator(
+            func: typing.Callable[["KiranEvent"], typing.Awaitable[None]],
+        ) -> typing.Callable[["KiranEvent"], typing.Awaitable[None]]:
+            self.listeners.append((event_type, func))
+            return func
+
+        return decorator
+
+
+class PluginManifest(typing.NamedTuple):
+    """What a plugin module registers, read from its source without importing it."""
+
+    commands: typing.Tuple[
+        typing.Tuple[CallableBotCommandDetails, CommandImplements], ...
+    ]
+    """The commands of the module with their implementation method."""
+    listener_names: typing.FrozenSet[str]
+    """The class names of the events the module listens to."""
+
+
+def _constant(node: typing.Optional[ast.expr]) -> typing.Any:
+    if node is None:
+        return None
+    if isinstance(node, ast.Constant):
+        return node.value
+    raise ValueError("Not a constant.")
+
+
+def _decorator_name(decorator: ast.Call) -> typing.Optional[str]:
+    if isinstance(decorator.func, ast.Attribute):
+        return decorator.func.attr
+    if isinstance(decorator.func, ast.Name):
+        return decorator.func.id
+    return None
+
+
+def _command_details(decorator: ast.Call) -> CallableBotCommandDetails:
+    arguments = dict(zip(("name", "description"), decorator.args))
+    for keyword in decorator.keywords:
+        if keyword.arg not in ("name", "description", "language_code"):
+            raise ValueError("Command scopes are resolved at import.")
+        arguments[keyword.arg] = keyword.value
+    name = _constant(arguments.get("name"))
+    description = _constant(arguments.get("description"))
+    if not isinstance(name, str) or not isinstance(description, str):
+        raise ValueError("Command name and description are required.")
+    return CallableBotCommandDetails(
+        name=name,
+        description=description,
+        language_code=_constant(arguments.get("language_code")),
+    )
+
+
+def _command_manifest(
+    decorators: typing.List[ast.expr],
+) -> typing.Optional[
+    typing.Tuple[CallableBotCommandDetails, CommandImplements]
+]:
+    details: typing.Optional[CallableBotCommandDetails] = None
+    implements: typing.Optional[CommandImplements] = None
+    for decorator in decorators:
+        if not isinstance(decorator, ast.Call):
+            continue
+        name = _decorator_name(decorator)
+        if name == "command":
+            details = _command_details(decorator)
+        elif name == "implements" and decorator.args:
+            method = decorator.args[0]
+            if isinstance(method, ast.Attribute):
+                implements = CommandImplements[method.attr]
+            else:
+                implements = CommandImplements(_constant(method))
+    if details is None:
+        return None
+    if implements is None:
+        raise ValueError("Implementation method not specified.")
+    return details, implements
+
+
+def scan_plugin_source(source: str) -> typing.Optional[PluginManifest]:
+    """
+    Read the commands and listeners of a plugin module from its source.
+
+    Only decorators with literal arguments can be read this way. Commands
+    using custom scopes or computed names, and listeners of events which are
+    not referenced by name, make the module unsuitable for lazy loading.
+
+    Parameters
+    ----------
+    source : str
+        The source code of the plugin module.
+
+    Returns
+    -------
+    typing.Optional[PluginManifest]
+        The manifest of the module, None if it has to be imported to be known.
+    """
+    commands: typing.List[
+        typing.Tuple[CallableBotCommandDetails, CommandImplements]
+    ] = []
+    listener_names: typing.Set[str] = set()
+    try:
+        for node in ast.walk(ast.parse(source)):
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            command = _command_manifest(node.decorator_list)
+            if command is not None:
+                commands.append(command)
+            for decorator in node.decorator_list:
+                if (
+                    isinstance(decorator, ast.Call)
+                    and isinstance(decorator.func, ast.Attribute)
+                    and decorator.func.attr == "listen"
+                ):
+                    event = decorator.args[0] if decorator.args else None
+                    if isinstance(event, ast.Attribute):
+                        listener_names.add(event.attr)
+                    elif isinstance(event, ast.Name):
+                        listener_names.add(event.id)
+                    else:
+                        return None
+    except (SyntaxError, ValueError, KeyError, TypeError):
+        return None
+    return PluginManifest(tuple(commands), frozenset(listener_names))
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import collections
+import re
+import typing
+
+TriggerKey = typing.TypeVar("TriggerKey", bound=typing.Hashable)
+
+_SCOPED_FLAGS: typing.Final = (
+    (re.ASCII, "a"),
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+_GLOBAL_FLAGS: typing.Final = re.compile(r"\A(?:\(\?[aiLmsux]+\))+")
+_GROUP_REFERENCES: typing.Final = re.compile(r"\\(?:[1-9]|g<)|\(\?(?:P=|\()")
+
+
+class AhoCorasickAutomaton(typing.Generic[TriggerKey]):
+    """
+    A multi-pattern string matcher.
+
+    Every literal pattern is added to a trie whose nodes are linked to their
+    longest proper suffix, so scanning a text finds every pattern occurring
+    in it in a single pass, whatever the number of patterns.
+
+    Parameters
+    ----------
+    case_sensitive : bool
+        Whether the patterns are matched case sensitively. Defaults to False.
+    """
+
+    def __init__(self, case_sensitive: bool = False) -> None:
+        self.case_sensitive = case_sensitive
+        self._goto: typing.List[typing.Dict[str, int]] = [{}]
+        self._fail: typing.List[int] = [0]
+        self._output: typing.List[typing.Tuple[int, ...]] = [()]
+        self._keys: typing.List[TriggerKey] = []
+        self._built = True
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _normalize(self, text: str) -> str:
+        return text if self.case_sensitive else text.casefold()
+
+    def add(self, pattern: str, key: TriggerKey) -> None:
+        """
+        Add a literal pattern to the automaton.
+
+        Parameters
+        ----------
+        pattern : str
+            The literal to look for, must not be empty.
+        key : TriggerKey
+            The value reported when the pattern is found.
+        """
+        if not pattern:
+            raise ValueError("Trigger patterns can not be empty.")
+        node = 0
+        for char in self._normalize(pattern):
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            node = next_node
+        self._output[node] += (len(self._keys),)
+        self._keys.append(key)
+        self._built = False
+
+    def build(self) -> None:
+        """Compute the suffix links, called lazily before the first scan."""
+        queue: typing.Deque[int] = collections.deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                suffix = self._goto[fallback].get(char, 0)
+                self._fail[child] = suffix if suffix != child else 0
+                self._output[child] = tuple(
+                    dict.fromkeys(
+                        self._output[child] + self._output[self._fail[child]]
+                    )
+                )
+        self._built = True
+
+    def search(self, text: str) -> typing.Set[int]:
+        """
+        Scan the text once and collect the patterns found in it.
+
+        Parameters
+        ----------
+        text : str
+            The text to scan.
+
+        Returns
+        -------
+        typing.Set[int]
+            The registration indexes of the patterns found.
+        """
+        if not self._built:
+            self.build()
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found: typing.Set[int] = set()
+        node = 0
+        for char in self._normalize(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        return found
+
+    def keys(self, indexes: typing.Iterable[int]) -> typing.List[TriggerKey]:
+        """
+        Map registration indexes back to the keys given to `add`.
+
+        Parameters
+        ----------
+        indexes : typing.Iterable[int]
+            The indexes returned by `search`.
+
+        Returns
+        -------
+        typing.List[TriggerKey]
+            The keys, in registration order.
+        """
+        return [self._keys[index] for index in sorted(indexes)]
+
+
+class TextTriggerMatcher(typing.Generic[TriggerKey]):
+    """
+    Matches the text of a message against every registered trigger at once.
+
+    Literal patterns are compiled into one Aho-Corasick automaton and regular
+    expressions into one combined pattern, so each message is scanned once
+    for the literals and once for the expressions, no matter how many
+    triggers are registered.
+
+    The expressions are joined into one alternation, the message is scanned
+    once with it as a lookahead to find the positions where some expression
+    matches. Only at these, every expression is tried as a named, optional
+    lookahead, so expressions whose matches overlap, such as `hello` and
+    `hello world`, are all reported. The flags of each expression are
+    scoped to it. Expressions referring to their own groups, by number or
+    by name, can not be combined and are searched on their own.
+
+    Parameters
+    ----------
+    case_sensitive : bool
+        Whether literal patterns are matched case sensitively. Defaults to False.
+    """
+
+    def __init__(self, case_sensitive: bool = False) -> None:
+        self._literals: AhoCorasickAutomaton[TriggerKey] = AhoCorasickAutomaton(
+            case_sensitive=case_sensitive
+        )
+        self._expressions: typing.List[str] = []
+        self._expression_keys: typing.List[TriggerKey] = []
+        self._combined: typing.Optional[
+            typing.Tuple[re.Pattern[str], re.Pattern[str]]
+        ] = None
+        self._separate: typing.List[
+            typing.Tuple[re.Pattern[str], TriggerKey]
+        ] = []
+        self._order: typing.Dict[TriggerKey, int] = {}
+
+    def __len__(self) -> int:
+        return (
+            len(self._literals) + len(self._expressions) + len(self._separate)
+        )
+
+    def _remember(self, key: TriggerKey) -> None:
+        self._order.setdefault(key, len(self._order))
+
+    def add_literal(self, pattern: str, key: TriggerKey) -> None:
+        """
+        Register a literal trigger.
+
+        Parameters
+        ----------
+        pattern : str
+            The text looked for anywhere in the message.
+        key : TriggerKey
+            The value reported when the trigger matches.
+        """
+        self._remember(key)
+        self._literals.add(pattern, key)
+
+    def add_regex(
+        self, pattern: typing.Union[str, re.Pattern[str]], key: TriggerKey
+    ) -> None:
+        """
+        Register a regular expression trigger.
+
+        Parameters
+        ----------
+        pattern : typing.Union[str, re.Pattern[str]]
+            The expression searched in the message, with its flags, inline
+            ones included. An invalid expression raises `re.error` here.
+        key : TriggerKey
+            The value reported when the trigger matches.
+        """
+        compiled = re.compile(pattern)
+        self._remember(key)
+        if compiled.groupindex or _GROUP_REFERENCES.search(compiled.pattern):
+            self._separate.append((compiled, key))
+            return
+        scoped = "".join(
+            flag for value, flag in _SCOPED_FLAGS if compiled.flags & value
+        )
+        source = _GLOBAL_FLAGS.sub("", compiled.pattern)
+        if compiled.flags & re.VERBOSE:
+            source = f"(?{scoped}:{source}\n)"
+        elif scoped:
+            source = f"(?{scoped}:{source})"
+        self._expressions.append(source)
+        self._expression_keys.append(key)
+        self._combined = None
+
+    def _compile(self) -> typing.Tuple[re.Pattern[str], re.Pattern[str]]:
+        alternation = "|".join(
+            f"(?:{expression})" for expression in self._expressions
+        )
+        branches = "".join(
+            f"(?:(?=(?P<_{index}>{expression}))|)"
+            for index, expression in enumerate(self._expressions)
+        )
+        return re.compile(f"(?=(?:{alternation}))"), re.compile(branches)
+
+    def match(self, text: str) -> typing.List[TriggerKey]:
+        """
+        Find every trigger matching the text.
+
+        Parameters
+        ----------
+        text : str
+            The text of the message.
+
+        Returns
+        -------
+        typing.List[TriggerKey]
+            The keys of the matching triggers, in registration order and
+            without duplicates.
+        """
+        keys: typing.Set[TriggerKey] = set(
+            self._literals.keys(self._literals.search(text))
+        )
+        if self._expressions:
+            if self._combined is None:
+                self._combined = self._compile()
+            positions, branches = self._combined
+            for position in positions.finditer(text):
+                found = typing.cast(
+                    re.Match[str], branches.match(text, position.start())
+                )
+                keys.update(
+                    self._expression_keys[int(name[1:])]
+                    for name, value in found.groupdict().items()
+                    if value is not None
+                )
+        keys.update(
+            key for expression, key in self._separate if expression.search(text)
+        )
+        return sorted(keys, key=self._order.__getitem__)
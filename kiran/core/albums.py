@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+from ..abc.media import InputMediaAudio
+from ..abc.media import InputMediaDocument
+from ..abc.media import InputMediaPhoto
+from ..abc.media import InputMediaVideo
+from ..errors import KiranPollingError
+from .events import AlbumEvent
+
+if typing.TYPE_CHECKING:
+    from ..abc.dependent import Message
+    from ..abc.media import InputMedia
+    from ..impl import KiranBot
+    from .methods import KiranCaller
+
+ChatIdentifier = typing.Union[int, str]
+AlbumKey = typing.Tuple[ChatIdentifier, str]
+
+
+class _PendingAlbum:
+    def __init__(self) -> None:
+        self.items: typing.List["InputMedia"] = []
+        self.futures: typing.List[asyncio.Future["Message"]] = []
+        self.timer: typing.Optional[asyncio.TimerHandle] = None
+
+
+class _IncomingAlbum:
+    def __init__(self, event_id: int) -> None:
+        self.event_id = event_id
+        self.messages: typing.List["Message"] = []
+        self.timer: typing.Optional[asyncio.TimerHandle] = None
+
+
+class AlbumAggregator:
+    """
+    Gathers the messages of incoming albums into single `AlbumEvent`.
+
+    Messages sharing a `media_group_id` are buffered until no other message
+    of the album arrived for `window` seconds, or the album holds the most
+    items an album can, then dispatched to the listeners of `AlbumEvent` of
+    the bot in one event.
+
+    Parameters
+    ----------
+    client : KiranBot
+        The bot dispatching the albums.
+    window : float
+        Seconds to wait for the next message of an album, default is 0.5.
+    """
+
+    def __init__(self, client: "KiranBot", window: float = 0.5) -> None:
+        self.client = client
+        self.window = window
+        self._albums: typing.Dict[typing.Tuple[int, str], _IncomingAlbum] = {}
+        self._dispatching: typing.Set[asyncio.Task[None]] = set()
+        self.albums = 0
+        """Number of albums dispatched."""
+        self.messages = 0
+        """Number of messages gathered into albums."""
+
+    def __repr__(self) -> str:
+        return f"AlbumAggregator(window={self.window}, pending={len(self._albums)}, albums={self.albums}, messages={self.messages})"
+
+    def add(self, update_id: int, message: "Message") -> bool:
+        """
+        Buffer a message if it belongs to an album.
+
+        Parameters
+        ----------
+        update_id : int
+            The id of the update of the message.
+        message : Message
+            The received message.
+
+        Returns
+        -------
+        bool
+            True if the message was buffered, False if it is not in an album.
+        """
+        if message.media_group_id is None:
+            return False
+        key = (message.chat.id, message.media_group_id)
+        album = self._albums.get(key)
+        if album is None:
+            album = _IncomingAlbum(update_id)
+            self._albums[key] = album
+        elif album.timer is not None:
+            album.timer.cancel()
+        album.messages.append(message)
+        self.messages += 1
+        if len(album.messages) >= 10:
+            self._dispatch(key)
+        else:
+            album.timer = asyncio.get_running_loop().call_later(
+                self.window, self._dispatch, key
+            )
+        return True
+
+    def _dispatch(self, key: typing.Tuple[int, str]) -> None:
+        album = self._albums.pop(key, None)
+        if album is None:
+            return
+        if album.timer is not None:
+            album.timer.cancel()
+        self.albums += 1
+        event = AlbumEvent(
+            event_id=album.event_id,
+            media_group_id=key[1],
+            messages=sorted(
+                album.messages, key=lambda message: message.message_id
+            ),
+        )
+        self.client.log(
+            f"Album {key[1]} of {len(album.messages)} messages gathered.",
+            "debug",
+        )
+        task = asyncio.ensure_future(self.client.dispatch(event))
+        self._dispatching.add(task)
+        task.add_done_callback(self._dispatching.discard)
+
+    @staticmethod
+    def _abandon(album: _PendingAlbum, task: asyncio.Future[None]) -> None:
+        if task.cancelled():
+            for future in album.futures:
+                future.cancel()
+
+    async def flush(self) -> None:
+        """Dispatch every buffered album now, and wait for their listeners."""
+        for key in list(self._albums):
+            self._dispatch(key)
+        if self._dispatching:
+            await asyncio.gather(*self._dispatching, return_exceptions=True)
+
+
+class AlbumBatcher:
+    """
+    Groups the media queued for a chat into albums.
+
+    Items queued for the same chat within `window` seconds of the first one
+    are sent together with `sendMediaGroup`, as soon as the window closes or
+    the album is full. Photos and videos are grouped together, documents
+    and audios only with items of their own type, as Telegram requires. An
+    item left alone when its window closes is sent as a single message.
+
+    Parameters
+    ----------
+    caller : KiranCaller
+        The caller sending the albums.
+    window : float
+        Seconds items are collected for after the first one, default is 0.5.
+    max_size : int
+        Most items of an album, default and maximum is 10.
+    """
+
+    def __init__(
+        self,
+        caller: "KiranCaller",
+        window: float = 0.5,
+        max_size: int = 10,
+    ) -> None:
+        if not 2 <= max_size <= 10:
+            raise ValueError("An album holds 2 to 10 items.")
+        self.caller = caller
+        self.window = window
+        self.max_size = max_size
+        self._pending: typing.Dict[AlbumKey, _PendingAlbum] = {}
+        self._sending: typing.Set[asyncio.Task[None]] = set()
+        self.albums = 0
+        """Number of albums sent."""
+        self.singles = 0
+        """Number of items sent alone."""
+
+    def __repr__(self) -> str:
+        return f"AlbumBatcher(window={self.window}, max_size={self.max_size}, pending={len(self._pending)}, albums={self.albums}, singles={self.singles})"
+
+    @staticmethod
+    def _group_of(item: "InputMedia") -> str:
+        if isinstance(item, InputMediaDocument):
+            return "document"
+        if isinstance(item, InputMediaAudio):
+            return "audio"
+        return "visual"
+
+    def add(
+        self, chat_id: ChatIdentifier, item: "InputMedia"
+    ) -> asyncio.Future["Message"]:
+        """
+        Queue an item for a chat.
+
+        Parameters
+        ----------
+        chat_id : ChatIdentifier
+            The chat to send the item to.
+        item : InputMedia
+            The photo, video, audio or document to send.
+
+        Returns
+        -------
+        asyncio.Future[Message]
+            Resolves to the message of the item once its album was sent.
+        """
+        key = (chat_id, self._group_of(item))
+        album = self._pending.get(key)
+        if album is None:
+            album = _PendingAlbum()
+            album.timer = asyncio.get_running_loop().call_later(
+                self.window, self._flush, key
+            )
+            self._pending[key] = album
+        future = asyncio.get_running_loop().create_future()
+        album.items.append(item)
+        album.futures.append(future)
+        if len(album.items) >= self.max_size:
+            self._flush(key)
+        return future
+
+    def _flush(self, key: AlbumKey) -> None:
+        album = self._pending.pop(key, None)
+        if album is None:
+            return
+        if album.timer is not None:
+            album.timer.cancel()
+        task = asyncio.ensure_future(self._send(key[0], album))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+        task.add_done_callback(lambda done: self._abandon(album, done))
+
+    @staticmethod
+    def _abandon(album: _PendingAlbum, task: asyncio.Future[None]) -> None:
+        if task.cancelled():
+            for future in album.futures:
+                future.cancel()
+
+    async def flush(self) -> None:
+        """Send every pending album now, and wait until all were sent."""
+        for key in list(self._pending):
+            self._flush(key)
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
+
+    async def _send(
+        self, chat_id: ChatIdentifier, album: _PendingAlbum
+    ) -> None:
+        try:
+            if len(album.items) == 1:
+                messages = [await self._send_single(chat_id, album.items[0])]
+                self.singles += 1
+            else:
+                messages = await self.caller.send_media_group(
+                    chat_id, album.items
+                )
+                self.albums += 1
+        except Exception as e:
+            for future in album.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for index, future in enumerate(album.futures):
+            if future.done():
+                continue
+            if index < len(messages) and messages[index] is not None:
+                future.set_result(messages[index])
+                continue
+            future.set_exception(
+                KiranPollingError(
+                    message=f"Telegram sent no message for item {index + 1} of {len(album.items)} of the album to {chat_id}.",
+                    client=self.caller.client,
+                )
+            )
+
+    async def _send_single(
+        self, chat_id: ChatIdentifier, item: "InputMedia"
+    ) -> "Message":
+        caller = self.caller
+        shared = {
+            "caption": item.caption,
+            "parse_mode": item.parse_mode,
+            "caption_entities": item.caption_entities,
+        }
+        if isinstance(item, InputMediaPhoto):
+            message = await caller.send_photo(
+                chat_id,
+                item.media,
+                show_caption_above_media=item.show_caption_above_media,
+                has_spoiler=item.has_spoiler,
+                **shared,
+            )
+        elif isinstance(item, InputMediaVideo):
+            message = await caller.send_video(
+                chat_id,
+                item.media,
+                thumbnail=item.thumbnail,
+                width=item.width,
+                height=item.height,
+                duration=item.duration,
+                supports_streaming=item.supports_streaming,
+                has_spoiler=item.has_spoiler,
+                show_caption_above_media=item.show_caption_above_media,
+                **shared,
+            )
+        elif isinstance(item, InputMediaAudio):
+            message = await caller.send_audio(
+                chat_id,
+                item.media,
+                thumbnail=item.thumbnail,
+                duration=item.duration,
+                performer=item.performer,
+                title=item.title,
+                **shared,
+            )
+        else:
+            message = await caller.send_document(
+                chat_id,
+                item.media,
+                thumbnail=item.thumbnail,
+                disable_content_type_detection=item.disable_content_type_detection,
+                **shared,
+            )
+        return typing.cast("Message", message)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import time
+
+from .enums import CircuitState
+
+
+class CircuitBreaker:
+    """
+    Stops calling the Bot API while it keeps failing.
+
+    The breaker opens after `failure_threshold` consecutive attempts failed
+    with a transport error or a server error. While it is open, calls fail
+    fast with `KiranCircuitOpenError` instead of waiting for timeouts and
+    retries, so an outage never piles up pending calls and connections.
+    After `reset_timeout` seconds it turns half-open and lets
+    `half_open_probes` calls through: a success closes it, a failure opens
+    it again for another `reset_timeout`.
+
+    Refusals of Telegram other than server errors, such as a bad request
+    or a flood wait, show that the API is up and count as successes.
+
+    Parameters
+    ----------
+    failure_threshold : int
+        Consecutive failed attempts opening the breaker, default is 5.
+    reset_timeout : float
+        Seconds the breaker stays open before probing, default is 10.
+    half_open_probes : int
+        Calls let through at once while probing, default is 1.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 10.0,
+        half_open_probes: int = 1,
+    ) -> None:
+        if failure_threshold < 1 or half_open_probes < 1:
+            raise ValueError(
+                "A circuit breaker needs a failure threshold and probes of at least 1."
+            )
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self.failures = 0
+        """Number of consecutive failed attempts."""
+        self.trips = 0
+        """Number of times the breaker opened."""
+        self.rejected = 0
+        """Number of calls failed fast while the breaker was open."""
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(state={self.state.value}, failures={self.failures}, trips={self.trips}, rejected={self.rejected})"
+
+    @property
+    def state(self) -> CircuitState:
+        """The state of the breaker, half-open once the reset timeout elapsed."""
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() >= self._opened_at + self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the breaker probes the API, 0 unless it is open."""
+        if self.state is not CircuitState.OPEN:
+            return 0.0
+        return self._opened_at + self.reset_timeout - time.monotonic()
+
+    def allow(self) -> bool:
+        """
+        Take the permission to make an attempt.
+
+        Returns
+        -------
+        bool
+            True if the attempt can be made, then it has to be followed by
+            `record_success`, `record_failure` or `release`.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if (
+            state is CircuitState.HALF_OPEN
+            and self._probes < self.half_open_probes
+        ):
+            self._probes += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def release(self) -> None:
+        """Give back the permission of an attempt which ended without an outcome."""
+        if self._state is CircuitState.HALF_OPEN and self._probes:
+            self._probes -= 1
+
+    def record_success(self) -> bool:
+        """
+        Record an attempt the API answered.
+
+        Returns
+        -------
+        bool
+            True if the breaker closed after probing.
+        """
+        self.failures = 0
+        if self._state is CircuitState.CLOSED:
+            return False
+        self._state = CircuitState.CLOSED
+        return True
+
+    def record_failure(self) -> bool:
+        """
+        Record an attempt which failed with a transport or server error.
+
+        Returns
+        -------
+        bool
+            True if the breaker opened.
+        """
+        self.failures += 1
+        if self._state is CircuitState.OPEN:
+            return False
+        if (
+            self._state is CircuitState.CLOSED
+            and self.failures < self.failure_threshold
+        ):
+            return False
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self.trips += 1
+        return True
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import pathlib
+import time
+import typing
+
+import msgspec
+
+from ..errors import KiranValueError
+from ..errors import TelegramAPIError
+from ..errors import TelegramFloodWaitError
+from ..errors import TelegramForbiddenError
+from .enums import Priority
+from .outbound import priority
+from .payloads import PayloadTemplate
+from .payloads import TemplatePayload
+
+if typing.TYPE_CHECKING:
+    from .methods import KiranCaller
+    from .payloads import Payload
+
+ChatIdentifier = typing.Union[int, str]
+
+
+class BroadcastState(msgspec.Struct):
+    """
+    The progress of a broadcast, as checkpointed to disk.
+
+    Chats are referred to by their index in the list given to the broadcast.
+    Every chat before `position` was handled, along with the chats of `done`,
+    which were handled out of order by concurrent sends.
+    """
+
+    total: int
+    """Number of chats of the broadcast."""
+    position: int = 0
+    """Index of the first chat which may not have been handled yet."""
+    done: typing.List[int] = []
+    """Indexes after `position` which were handled."""
+    sent: int = 0
+    """Number of chats the message was delivered to."""
+    blocked: typing.List[ChatIdentifier] = []
+    """Chats which blocked the bot or removed it."""
+    deactivated: typing.List[ChatIdentifier] = []
+    """Chats whose user account was deleted."""
+    failed: typing.Dict[str, str] = {}
+    """Other chats the message could not be sent to, with the reason."""
+
+    @property
+    def handled(self) -> int:
+        """Number of chats which were handled, successfully or not."""
+        return self.position + len(self.done)
+
+
+class BroadcastProgress(typing.NamedTuple):
+    """A snapshot of a running broadcast."""
+
+    total: int
+    """Number of chats of the broadcast."""
+    handled: int
+    """Number of chats handled, including those of earlier runs."""
+    sent: int
+    """Number of chats the message was delivered to."""
+    blocked: int
+    """Number of chats which blocked the bot."""
+    deactivated: int
+    """Number of deactivated users."""
+    failed: int
+    """Number of chats which failed otherwise."""
+    elapsed: float
+    """Seconds since this run started."""
+    rate: float
+    """Chats handled per second during this run."""
+    eta: typing.Optional[float]
+    """Estimated seconds until completion, None until it can be estimated."""
+
+
+class Broadcaster:
+    """
+    Sends one message to a large list of chats.
+
+    The body of the message is encoded once, only its `chat_id` is
+    substituted for each chat. Sends run concurrently under the rate limiter
+    of the bot, as bulk calls which leave the bot free to reply to users,
+    and the progress is checkpointed to disk so a broadcast interrupted by a
+    crash resumes where it stopped when started again with the same chats
+    and checkpoint file.
+
+    Chats which blocked the bot or were deactivated are recorded apart, so
+    they can be removed from later broadcasts. Chats still flood limited
+    after `max_flood_waits` waits are recorded as failed, so a single chat
+    never stalls the broadcast. Failures of the connection to Telegram stop
+    the broadcast after a last checkpoint, to be resumed later. The sends in
+    flight when it stopped are made again on resume, so a chat may rarely
+    receive the message twice.
+
+    Parameters
+    ----------
+    caller : KiranCaller
+        The caller sending the messages.
+    method : str
+        The Bot API method sending the message, such as `sendMessage`.
+    payload : Payload
+        The parameters of the method, its `chat_id` is ignored.
+    chat_ids : typing.Sequence[ChatIdentifier]
+        The chats to send the message to, in the same order on every run.
+    result_type : typing.Any
+        The type of the result of the method.
+    checkpoint : typing.Optional[typing.Union[str, pathlib.Path]]
+        File the progress is saved to and resumed from, None to not save it.
+    concurrency : int
+        Maximum number of sends in flight, default is 16.
+    checkpoint_interval : float
+        Seconds between two checkpoints, default is 5.
+    on_progress : typing.Optional[typing.Callable[[BroadcastProgress], None]]
+        Called with the progress at every checkpoint.
+    max_flood_waits : int
+        Flood waits sat out for a chat on top of the retries of the caller,
+        before the chat is recorded as failed, default is 3.
+    """
+
+    def __init__(
+        self,
+        caller: "KiranCaller",
+        method: str,
+        payload: "Payload",
+        chat_ids: typing.Sequence[ChatIdentifier],
+        result_type: typing.Any,
+        checkpoint: typing.Optional[typing.Union[str, pathlib.Path]] = None,
+        concurrency: int = 16,
+        checkpoint_interval: float = 5.0,
+        on_progress: typing.Optional[
+            typing.Callable[[BroadcastProgress], None]
+        ] = None,
+        max_flood_waits: int = 3,
+    ) -> None:
+        self.caller = caller
+        self.method = method
+        self.template = PayloadTemplate(payload, caller.encoder)
+        self.chat_ids = chat_ids
+        self.result_type = result_type
+        self.checkpoint = (
+            pathlib.Path(checkpoint) if checkpoint is not None else None
+        )
+        self.concurrency = concurrency
+        self.checkpoint_interval = checkpoint_interval
+        self.on_progress = on_progress
+        self.max_flood_waits = max_flood_waits
+        self.state = self._load()
+        self._done: typing.Set[int] = set(self.state.done)
+        self._resumed_from = self.state.handled
+        self._started = time.monotonic()
+
+    def _load(self) -> BroadcastState:
+        if self.checkpoint is None or not self.checkpoint.exists():
+            return BroadcastState(total=len(self.chat_ids))
+        state = msgspec.json.decode(
+            self.checkpoint.read_bytes(), type=BroadcastState
+        )
+        if state.total != len(self.chat_ids):
+            raise KiranValueError(
+                message=f"Checkpoint {self.checkpoint} was made for {state.total} chats, not {len(self.chat_ids)}.",
+                client=self.caller.client,
+            )
+        return state
+
+    @property
+    def progress(self) -> BroadcastProgress:
+        """The progress of the broadcast."""
+        state = self.state
+        handled = state.position + len(self._done)
+        elapsed = time.monotonic() - self._started
+        rate = (handled - self._resumed_from) / elapsed if elapsed else 0.0
+        return BroadcastProgress(
+            total=state.total,
+            handled=handled,
+            sent=state.sent,
+            blocked=len(state.blocked),
+            deactivated=len(state.deactivated),
+            failed=len(state.failed),
+            elapsed=elapsed,
+            rate=rate,
+            eta=(
+                (state.total - handled) / rate
+                if rate
+                else (0.0 if handled >= state.total else None)
+            ),
+        )
+
+    async def _save(self) -> None:
+        self.state.done = sorted(self._done)
+        progress = self.progress
+        self.caller.client.log(
+            f"Broadcast: {progress.handled}/{progress.total} chats handled, {progress.rate:.1f} chats per second, "
+            + (
+                f"{progress.eta:.0f} seconds left."
+                if progress.eta is not None
+                else "estimating time left."
+            ),
+            "info",
+        )
+        if self.on_progress is not None:
+            self.on_progress(progress)
+        if self.checkpoint is None:
+            return
+        encoded = msgspec.json.encode(self.state)
+        await asyncio.to_thread(self._write, self.checkpoint, encoded)
+
+    @staticmethod
+    def _write(path: pathlib.Path, encoded: bytes) -> None:
+        temporary = path.with_name(f"{path.name}.tmp")
+        temporary.write_bytes(encoded)
+        os.replace(temporary, path)
+
+    def _complete(self, index: int) -> None:
+        self._done.add(index)
+        while self.state.position in self._done:
+            self._done.remove(self.state.position)
+            self.state.position += 1
+
+    def _record_error(
+        self, chat_id: ChatIdentifier, error: TelegramAPIError
+    ) -> None:
+        if isinstance(error, TelegramForbiddenError):
+            if "deactivated" in error.description:
+                self.state.deactivated.append(chat_id)
+            else:
+                self.state.blocked.append(chat_id)
+        else:
+            self.state.failed[str(chat_id)] = error.description
+
+    async def _send(self, chat_id: ChatIdentifier) -> None:
+        for flood_waits in range(self.max_flood_waits + 1):
+            try:
+                await self.caller._make_request(
+                    method=self.method,
+                    payload=TemplatePayload(
+                        chat_id=chat_id, template=self.template
+                    ),
+                    result_type=self.result_type,
+                )
+            except TelegramFloodWaitError as e:
+                if flood_waits == self.max_flood_waits:
+                    self._record_error(chat_id, e)
+                    return
+                await asyncio.sleep(e.retry_after)
+                continue
+            except TelegramAPIError as e:
+                self._record_error(chat_id, e)
+                return
+            self.state.sent += 1
+            return
+
+    async def _worker(self, indexes: typing.Iterator[int]) -> None:
+        for index in indexes:
+            await self._send(self.chat_ids[index])
+            self._complete(index)
+
+    async def _checkpoint_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.checkpoint_interval)
+            await self._save()
+
+    async def run(self) -> BroadcastState:
+        """
+        Send the message to every chat not handled yet.
+
+        Returns
+        -------
+        BroadcastState
+            The final state of the broadcast.
+        """
+        pending = (
+            index
+            for index in range(self.state.position, self.state.total)
+            if index not in self._done
+        )
+        checkpointing = asyncio.create_task(self._checkpoint_periodically())
+        with priority(Priority.BULK):
+            workers = [
+                asyncio.create_task(self._worker(pending))
+                for _ in range(self.concurrency)
+            ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            checkpointing.cancel()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await self._save()
+        return self.state
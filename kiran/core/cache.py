@@ -1,4 +1,364 @@
 from __future__ import annotations
 
+import asyncio
+import collections
+import os
+import pathlib
+import typing
+
+import msgspec
+
+from ..errors import KiranValueError
+
+if typing.TYPE_CHECKING:
+    from ..errors import TelegramAPIError
+    from .uploads import InputFile
+
+UNCACHEABLE_FIELDS: typing.Final = ("thumbnail",)
+"""Upload fields whose files Telegram never lets be sent again by id."""
+
+REJECTED_FILE_ID_HINTS: typing.Final = (
+    "file identifier",
+    "file reference",
+    "file_id",
+)
+"""Fragments of the errors Telegram answers an unusable file id with."""
+
 
 class KiranCache: ...
+
+
+class FileIdCache:
+    """
+    Remembers the file id Telegram gave to the content of uploaded files.
+
+    Files are keyed by the SHA-256 of their content and the upload field
+    they were sent as, since a file id can only be sent again as the same
+    kind of media. Once a file was uploaded, later sends of the same
+    content use its file id and skip the upload. Hashing runs in a thread,
+    and the hash of a local file is kept for as long as its size and
+    modification time do not change, so a file sent over and over is only
+    read once.
+
+    Entries are dropped when Telegram rejects their file id, the send then
+    falls back to uploading the file.
+
+    Parameters
+    ----------
+    path : typing.Optional[typing.Union[str, pathlib.Path]]
+        File the cache is loaded from and saved to, None to keep it in memory.
+    """
+
+    def __init__(
+        self, path: typing.Optional[typing.Union[str, pathlib.Path]] = None
+    ) -> None:
+        self.path = pathlib.Path(path) if path is not None else None
+        self._file_ids: typing.Dict[str, str] = {}
+        if self.path is not None and self.path.exists():
+            self._file_ids = msgspec.json.decode(
+                self.path.read_bytes(), type=typing.Dict[str, str]
+            )
+        self._digests: typing.Dict[
+            typing.Tuple[str, int, int], typing.Optional[str]
+        ] = {}
+        self._lock: typing.Optional[asyncio.Lock] = None
+        self.hits = 0
+        """Number of uploads skipped thanks to the cache."""
+        self.misses = 0
+        """Number of files uploaded for lack of a cached file id."""
+
+    def __len__(self) -> int:
+        return len(self._file_ids)
+
+    def __repr__(self) -> str:
+        return f"FileIdCache(path={self.path!r}, entries={len(self)}, hits={self.hits}, misses={self.misses})"
+
+    @staticmethod
+    def _key(field: str, digest: str) -> str:
+        return f"{field}:{digest}"
+
+    @staticmethod
+    def rejects(error: "TelegramAPIError") -> bool:
+        """
+        Whether an error means Telegram did not accept a file id.
+
+        Parameters
+        ----------
+        error : TelegramAPIError
+            The error of a call sending file ids.
+
+        Returns
+        -------
+        bool
+            True if the file ids of the call have to be uploaded again.
+        """
+        description = error.description.lower()
+        return any(hint in description for hint in REJECTED_FILE_ID_HINTS)
+
+    async def _digest(self, file: "InputFile") -> typing.Optional[str]:
+        source = file.source
+        if not isinstance(source, pathlib.Path):
+            return await asyncio.to_thread(file.digest)
+        stat = source.stat()
+        key = (str(source.resolve()), stat.st_size, stat.st_mtime_ns)
+        if key not in self._digests:
+            self._digests[key] = await asyncio.to_thread(file.digest)
+        return self._digests[key]
+
+    async def digests(
+        self, files: typing.Mapping[str, "InputFile"]
+    ) -> typing.Dict[str, str]:
+        """
+        Hash the files of an upload which can be cached.
+
+        Parameters
+        ----------
+        files : typing.Mapping[str, InputFile]
+            The files, by the name of their field.
+
+        Returns
+        -------
+        typing.Dict[str, str]
+            The hash of the content of each cacheable file, by field.
+        """
+        cacheable = {
+            name: file
+            for name, file in files.items()
+            if name not in UNCACHEABLE_FIELDS and file.replayable
+        }
+        hashed = await asyncio.gather(
+            *(self._digest(file) for file in cacheable.values())
+        )
+        return {
+            name: digest
+            for name, digest in zip(cacheable, hashed)
+            if digest is not None
+        }
+
+    def lookup(
+        self, digests: typing.Mapping[str, str]
+    ) -> typing.Dict[str, str]:
+        """
+        Get the file ids known for the files of an upload.
+
+        Parameters
+        ----------
+        digests : typing.Mapping[str, str]
+            The hash of each file, by field.
+
+        Returns
+        -------
+        typing.Dict[str, str]
+            The file id to send instead of each file which was uploaded before.
+        """
+        file_ids = {
+            name: self._file_ids[self._key(name, digest)]
+            for name, digest in digests.items()
+            if self._key(name, digest) in self._file_ids
+        }
+        self.hits += len(file_ids)
+        self.misses += len(digests) - len(file_ids)
+        return file_ids
+
+    async def remember(
+        self, digests: typing.Mapping[str, str], result: typing.Any
+    ) -> None:
+        """
+        Store the file ids Telegram gave to the files of an upload.
+
+        Parameters
+        ----------
+        digests : typing.Mapping[str, str]
+            The hash of each uploaded file, by field.
+        result : typing.Any
+            The result of the call, the message whose media carry the ids.
+        """
+        changed = False
+        for name, digest in digests.items():
+            media = getattr(result, name, None)
+            if isinstance(media, list):
+                media = media[-1] if media else None
+            file_id = getattr(media, "file_id", None)
+            if isinstance(file_id, str):
+                self._file_ids[self._key(name, digest)] = file_id
+                changed = True
+        if changed:
+            await self.save()
+
+    async def invalidate(self, digests: typing.Mapping[str, str]) -> None:
+        """
+        Forget the file ids of files, after Telegram rejected them.
+
+        Parameters
+        ----------
+        digests : typing.Mapping[str, str]
+            The hash of each file, by field.
+        """
+        for name, digest in digests.items():
+            self._file_ids.pop(self._key(name, digest), None)
+        await self.save()
+
+    async def save(self) -> None:
+        """Write the cache to its file, replacing it atomically."""
+        if self.path is None:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            encoded = msgspec.json.encode(self._file_ids)
+            await asyncio.to_thread(self._write, self.path, encoded)
+
+    @staticmethod
+    def _write(path: pathlib.Path, encoded: bytes) -> None:
+        temporary = path.with_name(f"{path.name}.tmp")
+        temporary.write_bytes(encoded)
+        os.replace(temporary, path)
+
+
+class DownloadCache:
+    """
+    Keeps downloaded files on disk, so a file downloaded again is read locally.
+
+    Files are stored under their `file_unique_id`, which is the same for a
+    file whatever bot or message it is received from. The cache is bounded
+    in size and evicts the least recently used files first. Files are
+    written to a temporary name and moved in place once complete, so a
+    crash never leaves a truncated file in the cache, and the index of the
+    cache is saved as a compact MessagePack list of ids and sizes, ordered
+    from the least to the most recently used.
+
+    Parameters
+    ----------
+    directory : typing.Union[str, pathlib.Path]
+        Directory holding the files and the index, created if missing.
+    max_bytes : int
+        Total size of the cached files, default is 512 MiB.
+    """
+
+    def __init__(
+        self,
+        directory: typing.Union[str, pathlib.Path],
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._index = self.directory / "index.msgpack"
+        self._entries: typing.OrderedDict[str, int] = collections.OrderedDict()
+        if self._index.exists():
+            for unique_id, size in msgspec.msgpack.decode(
+                self._index.read_bytes(),
+                type=typing.List[typing.Tuple[str, int]],
+            ):
+                if self.path_of(unique_id).exists():
+                    self._entries[unique_id] = size
+        self.size = sum(self._entries.values())
+        """Total size of the cached files, in bytes."""
+        self._lock: typing.Optional[asyncio.Lock] = None
+        self.hits = 0
+        """Number of downloads read from the cache."""
+        self.misses = 0
+        """Number of downloads made for lack of a cached file."""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, unique_id: str) -> bool:
+        return unique_id in self._entries
+
+    def __repr__(self) -> str:
+        return f"DownloadCache(directory={self.directory!r}, files={len(self)}, size={self.size}, max_bytes={self.max_bytes}, hits={self.hits}, misses={self.misses})"
+
+    def path_of(self, unique_id: str) -> pathlib.Path:
+        """
+        Get where a file is stored.
+
+        Parameters
+        ----------
+        unique_id : str
+            The `file_unique_id` of the file.
+
+        Returns
+        -------
+        pathlib.Path
+            The path of the file in the cache.
+        """
+        if not unique_id or unique_id.startswith(".") or "/" in unique_id:
+            raise KiranValueError(
+                message=f"{unique_id!r} is not a file unique id."
+            )
+        return self.directory / unique_id
+
+    def get(self, unique_id: str) -> typing.Optional[pathlib.Path]:
+        """
+        Look a file up, marking it as recently used.
+
+        Parameters
+        ----------
+        unique_id : str
+            The `file_unique_id` of the file.
+
+        Returns
+        -------
+        typing.Optional[pathlib.Path]
+            The path of the file, None if it is not cached.
+        """
+        if unique_id not in self._entries:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(unique_id)
+        self.hits += 1
+        return self.path_of(unique_id)
+
+    def temporary(self, unique_id: str) -> pathlib.Path:
+        """
+        Get a path to write a file to before it is stored.
+
+        Parameters
+        ----------
+        unique_id : str
+            The `file_unique_id` of the file.
+
+        Returns
+        -------
+        pathlib.Path
+            A path in the cache directory no other download writes to.
+        """
+        self.path_of(unique_id)
+        return self.directory / f".{unique_id}.{os.urandom(4).hex()}.part"
+
+    async def store(
+        self, unique_id: str, temporary: pathlib.Path, size: int
+    ) -> None:
+        """
+        Move a completely written file into the cache.
+
+        Parameters
+        ----------
+        unique_id : str
+            The `file_unique_id` of the file.
+        temporary : pathlib.Path
+            The path the file was written to, from `temporary`.
+        size : int
+            The size of the file, in bytes.
+        """
+        os.replace(temporary, self.path_of(unique_id))
+        self.size += size - self._entries.get(unique_id, 0)
+        self._entries[unique_id] = size
+        self._entries.move_to_end(unique_id)
+        self._evict()
+        await self.save()
+
+    def _evict(self) -> None:
+        while self.size > self.max_bytes and len(self._entries) > 1:
+            unique_id, size = self._entries.popitem(last=False)
+            self.size -= size
+            self.path_of(unique_id).unlink(missing_ok=True)
+
+    async def save(self) -> None:
+        """Write the index of the cache, replacing it atomically."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            encoded = msgspec.msgpack.encode(list(self._entries.items()))
+            await asyncio.to_thread(FileIdCache._write, self._index, encoded)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import time
+import typing
+
+_deadline: contextvars.ContextVar[typing.Optional[float]] = (
+    contextvars.ContextVar("kiran_deadline", default=None)
+)
+
+
+@contextlib.contextmanager
+def deadline(timeout: float) -> typing.Iterator[float]:
+    """
+    Bound the method calls made within a block to a time budget.
+
+    Every call made by the caller within the block, including in the tasks
+    it starts, has to complete before the deadline: a call is cut short
+    when it runs out of time, and a retry is given up when its backoff
+    would end past the deadline, raising `KiranDeadlineError` either way.
+    Nested blocks can only shorten the deadline of the outer one.
+
+    Parameters
+    ----------
+    timeout : float
+        Seconds the calls of the block have, from now.
+
+    Yields
+    ------
+    float
+        The deadline, in `time.monotonic` seconds.
+    """
+    due = time.monotonic() + timeout
+    outer = _deadline.get()
+    if outer is not None:
+        due = min(due, outer)
+    token = _deadline.set(due)
+    try:
+        yield due
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> typing.Optional[float]:
+    """
+    Get the time left before the deadline of the current block.
+
+    Returns
+    -------
+    typing.Optional[float]
+        Seconds left, negative once the deadline passed, None without one.
+    """
+    due = _deadline.get()
+    return None if due is None else due - time.monotonic()
+
+
+def without_deadline() -> contextvars.Context:
+    """
+    Copy the current context, without the deadline of its block.
+
+    Returns
+    -------
+    contextvars.Context
+        The copy, to run work which must not be bound by the deadline of
+        the caller, such as a call shared with other callers.
+    """
+    context = contextvars.copy_context()
+    context.run(_deadline.set, None)
+    return context
@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import pathlib
+import shutil
+import typing
+
+import httpx
+
+from ..abc.files import File
+from ..errors import KiranPollingError
+from ..errors import TelegramAPIError
+
+if typing.TYPE_CHECKING:
+    from ..abc.media import Animation
+    from ..abc.media import Audio
+    from ..abc.media import Document
+    from ..abc.media import PhotoSize
+    from ..abc.media import Video
+    from ..abc.media import VideoNote
+    from ..abc.media import Voice
+    from .cache import DownloadCache
+    from .methods import KiranCaller
+
+DOWNLOAD_CHUNK_SIZE: typing.Final = 64 * 1024
+"""Bytes handed to the consumer of a download at a time."""
+
+EXPIRED_LINK_STATUSES: typing.Final = (403, 404, 410)
+"""Statuses of the file server answering a `file_path` which expired."""
+
+Downloadable = typing.Union[
+    str,
+    File,
+    "PhotoSize",
+    "Animation",
+    "Audio",
+    "Document",
+    "Video",
+    "VideoNote",
+    "Voice",
+]
+"""A file to download: its file id, or any object carrying one."""
+
+
+def pick_photo_size(
+    sizes: typing.Sequence["PhotoSize"],
+    min_width: int = 0,
+    min_height: int = 0,
+) -> "PhotoSize":
+    """
+    Pick the smallest size of a photo meeting a resolution.
+
+    Parameters
+    ----------
+    sizes : typing.Sequence[PhotoSize]
+        The sizes of the photo, as found in `Message.photo`.
+    min_width : int
+        The smallest acceptable width, default is 0.
+    min_height : int
+        The smallest acceptable height, default is 0.
+
+    Returns
+    -------
+    PhotoSize
+        The smallest size at least that large, or the largest size if none is.
+    """
+    if not sizes:
+        raise ValueError("A photo has at least one size.")
+    large_enough = [
+        size
+        for size in sizes
+        if size.width >= min_width and size.height >= min_height
+    ]
+    if not large_enough:
+        return max(sizes, key=lambda size: size.width * size.height)
+    return min(
+        large_enough,
+        key=lambda size: (size.width * size.height, size.file_size or 0),
+    )
+
+
+class Downloader:
+    """
+    Streams files from the file server of Telegram.
+
+    The `file_path` of a file is resolved with `getFile`, whose identical
+    concurrent calls are coalesced, and content is streamed a chunk at a time
+    instead of loaded into memory. Links which expired are resolved again,
+    and downloads cut by a connection failure resume from the last byte
+    received after a backoff.
+
+    Parameters
+    ----------
+    caller : KiranCaller
+        The caller resolving the files.
+    """
+
+    def __init__(self, caller: "KiranCaller") -> None:
+        self.caller = caller
+        self.client = caller.client
+
+    def __repr__(self) -> str:
+        return f"Downloader(client={self.client!r})"
+
+    def url_of(self, file_path: str) -> httpx.URL:
+        """
+        Get the download link of a file.
+
+        Parameters
+        ----------
+        file_path : str
+            The `file_path` of the file.
+
+        Returns
+        -------
+        httpx.URL
+            The link of the file on the file server of the API endpoint.
+        """
+        base = self.client.session.base_url
+        prefix = httpx.URL(self.client.transport_settings.api_url).path
+        prefix = prefix.rstrip("/")
+        return base.copy_with(
+            path=f"{prefix}/file{base.path[len(prefix) :]}{file_path}"
+        )
+
+    def local_path(self, file: File) -> typing.Optional[pathlib.Path]:
+        """
+        Get where a local Bot API server stored a file.
+
+        Parameters
+        ----------
+        file : File
+            The file, with its `file_path`.
+
+        Returns
+        -------
+        typing.Optional[pathlib.Path]
+            The absolute path of the file, None if it has to be downloaded.
+        """
+        if not self.client.transport_settings.local_mode:
+            return None
+        if file.file_path is None or not os.path.isabs(file.file_path):
+            return None
+        return pathlib.Path(file.file_path)
+
+    async def resolve(self, file: Downloadable) -> File:
+        """
+        Get the `File` of something to download.
+
+        Parameters
+        ----------
+        file : Downloadable
+            The file id, or an object carrying one.
+
+        Returns
+        -------
+        File
+            The file, with its `file_path`.
+        """
+        if isinstance(file, File) and file.file_path is not None:
+            return file
+        file_id = file if isinstance(file, str) else file.file_id
+        resolved = await self.caller.get_file(file_id)
+        if resolved is None or resolved.file_path is None:
+            raise TelegramAPIError.from_response(
+                method="getFile",
+                error_code=400,
+                description=f"Bad Request: file {file_id} cannot be downloaded",
+                client=self.client,
+            )
+        return resolved
+
+    async def stream(
+        self,
+        file: Downloadable,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> typing.AsyncIterator[bytes]:
+        """
+        Stream the content of a file.
+
+        With a download cache, files already downloaded are read from disk,
+        without even a `getFile` call when `file` carries its unique id, and
+        others are written to the cache as they are streamed. In local mode,
+        files are read in place from the path of the Bot API server.
+
+        Parameters
+        ----------
+        file : Downloadable
+            The file id, or an object carrying one.
+        chunk_size : int
+            Bytes yielded at a time, default is 64 KiB.
+
+        Yields
+        ------
+        bytes
+            The next chunk of the file.
+        """
+        cache = self.client.download_cache
+        if self.client.transport_settings.local_mode:
+            resolved = await self.resolve(file)
+            local = self.local_path(resolved)
+            chunks = (
+                self._read(local, chunk_size)
+                if local is not None
+                else self._fetch(resolved, chunk_size)
+            )
+            async for chunk in chunks:
+                yield chunk
+            return
+        if cache is None:
+            async for chunk in self._fetch(
+                await self.resolve(file), chunk_size
+            ):
+                yield chunk
+            return
+        cached, resolved = await self._lookup(cache, file)
+        if cached is not None:
+            try:
+                async for chunk in self._read(cached, chunk_size):
+                    yield chunk
+                return
+            except FileNotFoundError:
+                pass
+        async for chunk in self._fetch_into(
+            cache, resolved or await self.resolve(file), chunk_size
+        ):
+            yield chunk
+
+    @staticmethod
+    async def _read(
+        path: pathlib.Path, chunk_size: int
+    ) -> typing.AsyncIterator[bytes]:
+        with path.open("rb") as content:
+            while chunk := content.read(chunk_size):
+                yield chunk
+
+    async def _lookup(
+        self, cache: DownloadCache, file: Downloadable
+    ) -> typing.Tuple[typing.Optional[pathlib.Path], typing.Optional[File]]:
+        unique_id = getattr(file, "file_unique_id", None)
+        resolved = None
+        if unique_id is None:
+            resolved = await self.resolve(file)
+            unique_id = resolved.file_unique_id
+        return cache.get(unique_id), resolved
+
+    async def _fetch_into(
+        self, cache: DownloadCache, file: File, chunk_size: int
+    ) -> typing.AsyncIterator[bytes]:
+        temporary = cache.temporary(file.file_unique_id)
+        try:
+            received = 0
+            with temporary.open("wb") as output:
+                async for chunk in self._fetch(file, chunk_size):
+                    output.write(chunk)
+                    received += len(chunk)
+                    yield chunk
+            await cache.store(file.file_unique_id, temporary, received)
+        finally:
+            temporary.unlink(missing_ok=True)
+
+    async def _fetch(
+        self, resolved: File, chunk_size: int
+    ) -> typing.AsyncIterator[bytes]:
+        policy = self.client.retry_policy
+        received = 0
+        refreshed = False
+        for attempt in range(policy.attempts):
+            headers = {"Range": f"bytes={received}-"} if received else None
+            try:
+                async with (
+                    self.client.transfer_scheduler.slot(),
+                    (
+                        self.client.session.stream(
+                            "GET",
+                            self.url_of(typing.cast(str, resolved.file_path)),
+                            headers=headers,
+                        )
+                    ) as response,
+                ):
+                    if (
+                        response.status_code in EXPIRED_LINK_STATUSES
+                        and not refreshed
+                    ):
+                        refreshed = True
+                        resolved = await self.resolve(resolved.file_id)
+                        continue
+                    self._raise_for_status(resolved, response)
+                    skip = received if response.status_code != 206 else 0
+                    async for chunk in self._chunks(response, skip, chunk_size):
+                        received += len(chunk)
+                        yield chunk
+                    return
+            except (asyncio.TimeoutError, httpx.TransportError) as e:
+                if attempt == policy.attempts - 1:
+                    raise KiranPollingError(
+                        message=f"Error while downloading {resolved.file_id}.",
+                        client=self.client,
+                    ) from e
+                delay = policy.backoff(attempt)
+                self.client.log(
+                    f"Error while downloading {resolved.file_id} after {received} bytes (attempt {attempt + 1}/{policy.attempts}): {e!r}. Resuming in {delay:.2f} seconds.",
+                    "warning",
+                )
+                await asyncio.sleep(delay)
+        raise KiranPollingError(
+            message=f"Error while downloading {resolved.file_id}.",
+            client=self.client,
+        )
+
+    async def _chunks(
+        self, response: httpx.Response, skip: int, chunk_size: int
+    ) -> typing.AsyncIterator[bytes]:
+        scheduler = self.client.transfer_scheduler
+        async for chunk in response.aiter_bytes(chunk_size):
+            if skip:
+                chunk, skip = chunk[skip:], max(0, skip - len(chunk))
+                if not chunk:
+                    continue
+            await scheduler.download(len(chunk))
+            yield chunk
+
+    def _raise_for_status(self, file: File, response: httpx.Response) -> None:
+        if response.status_code in (200, 206):
+            return
+        error = TelegramAPIError.from_response(
+            method="download",
+            error_code=response.status_code,
+            description=f"{response.reason_phrase}: file {file.file_id}",
+            client=self.client,
+        )
+        self.client.log(error.message, "error")
+        raise error
+
+    async def download(
+        self,
+        file: Downloadable,
+        destination: typing.Union[str, pathlib.Path, typing.BinaryIO],
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> int:
+        """
+        Download a file to disk.
+
+        A path is written through a temporary file moved in place once the
+        download completed, so it never holds a partial file. In local mode,
+        the file of the Bot API server is copied by the kernel instead.
+
+        Parameters
+        ----------
+        file : Downloadable
+            The file id, or an object carrying one.
+        destination : typing.Union[str, pathlib.Path, typing.BinaryIO]
+            The path or binary file object to write the file to.
+        chunk_size : int
+            Bytes written at a time, default is 64 KiB.
+
+        Returns
+        -------
+        int
+            The number of bytes written.
+        """
+        if not isinstance(destination, (str, pathlib.Path)):
+            return await self._write(self.stream(file, chunk_size), destination)
+        path = pathlib.Path(destination)
+        cache = self.client.download_cache
+        if self.client.transport_settings.local_mode:
+            resolved = await self.resolve(file)
+            local = self.local_path(resolved)
+            if local is not None:
+                return await asyncio.to_thread(self._copy, local, path)
+            chunks = self._fetch(resolved, chunk_size)
+        elif cache is None:
+            chunks = self.stream(file, chunk_size)
+        else:
+            cached, resolved = await self._lookup(cache, file)
+            if cached is not None:
+                try:
+                    return await asyncio.to_thread(self._copy, cached, path)
+                except FileNotFoundError:
+                    pass
+            chunks = self._fetch_into(
+                cache, resolved or await self.resolve(file), chunk_size
+            )
+        temporary = path.with_name(f"{path.name}.part")
+        try:
+            with temporary.open("wb") as output:
+                written = await self._write(chunks, output)
+            os.replace(temporary, path)
+        finally:
+            temporary.unlink(missing_ok=True)
+        self.client.log(f"Downloaded {written} bytes to {path}.", "debug")
+        return written
+
+    @staticmethod
+    def _copy(source: pathlib.Path, destination: pathlib.Path) -> int:
+        shutil.copyfile(source, destination)
+        return destination.stat().st_size
+
+    @staticmethod
+    async def _write(
+        chunks: typing.AsyncIterator[bytes], output: typing.BinaryIO
+    ) -> int:
+        written = 0
+        async for chunk in chunks:
+            output.write(chunk)
+            written += len(chunk)
+        return written
+
+    async def download_many(
+        self,
+        files: typing.Mapping[typing.Union[str, pathlib.Path], Downloadable],
+        concurrency: int = 4,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> typing.Dict[typing.Union[str, pathlib.Path], int]:
+        """
+        Download files to disk concurrently.
+
+        Parameters
+        ----------
+        files : typing.Mapping[typing.Union[str, pathlib.Path], Downloadable]
+            The files to download, by the path they are written to.
+        concurrency : int
+            Maximum number of downloads in flight, default is 4.
+        chunk_size : int
+            Bytes written at a time, default is 64 KiB.
+
+        Returns
+        -------
+        typing.Dict[typing.Union[str, pathlib.Path], int]
+            The number of bytes written, by path.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def download(
+            destination: typing.Union[str, pathlib.Path],
+            file: Downloadable,
+        ) -> int:
+            async with semaphore:
+                return await self.download(file, destination, chunk_size)
+
+        sizes = await asyncio.gather(
+            *(download(path, file) for path, file in files.items())
+        )
+        return dict(zip(files, sizes))
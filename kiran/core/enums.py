@@ -160,3 +160,25 @@ class ParseMode(enum.Enum):
     - A valid emoji must be provided as an alternative value for the custom emoji. The emoji will be shown instead of the custom emoji in places where a custom emoji cannot be displayed (e.g., system notifications) or if the message is forwarded by a non-premium user. It is recommended to use the emoji from the emoji field of the custom emoji sticker.
     - Custom emoji entities can only be used by bots that purchased additional usernames on Fragment.
     """
+
+
+class CircuitState(enum.Enum):
+    """Enum representing the state of a circuit breaker."""
+
+    CLOSED = "closed"
+    """Calls go through, failures are counted."""
+    OPEN = "open"
+    """Calls fail fast, until the reset timeout elapsed."""
+    HALF_OPEN = "half_open"
+    """A few probe calls go through to test whether the API recovered."""
+
+
+class Priority(enum.Enum):
+    """Enum representing the priority class of outbound method calls."""
+
+    INTERACTIVE = "interactive"
+    """Replies to users, made by the handlers of updates."""
+    NORMAL = "normal"
+    """Calls made outside of handlers and bulk jobs."""
+    BULK = "bulk"
+    """Background jobs, such as broadcasts, using the capacity left."""
@@ -2,6 +2,11 @@ from __future__ import annotations
 
 import datetime
 import enum
+import typing
+
+if typing.TYPE_CHECKING:
+    from ..abc.dependent import Chat
+    from ..abc.dependent import Message
 
 
 class EventIntents(enum.Enum):
@@ -87,3 +92,48 @@ class KiranEvent:
     ) -> None:
         self.event_id = event_id
         self.event_time = datetime.datetime.now()
+
+
+class AlbumEvent(KiranEvent):
+    """
+    An album received by the bot, dispatched once with all of its messages.
+
+    Telegram delivers one update per item of an album, the polling manager
+    gathers the messages sharing a `media_group_id` and dispatches them
+    together as this event.
+
+    Parameters
+    ----------
+    event_id : int
+        The id of the update of the first message of the album.
+    media_group_id : str
+        The id shared by the messages of the album.
+    messages : typing.List[Message]
+        The messages of the album, in the order they were sent.
+    """
+
+    def __init__(
+        self,
+        event_id: int,
+        media_group_id: str,
+        messages: typing.List["Message"],
+    ) -> None:
+        super().__init__(event_id)
+        self.media_group_id = media_group_id
+        self.messages = messages
+
+    def __repr__(self) -> str:
+        return f"AlbumEvent(event_id={self.event_id}, media_group_id={self.media_group_id!r}, messages={len(self.messages)})"
+
+    @property
+    def chat(self) -> "Chat":
+        """The chat the album was sent to."""
+        return self.messages[0].chat
+
+    @property
+    def caption(self) -> typing.Optional[str]:
+        """The caption of the album, carried by one of its messages."""
+        for message in self.messages:
+            if message.caption is not None:
+                return message.caption
+        return None
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import collections
+import time
+import typing
+
+import httpx
+
+from ..errors import KiranAmbiguousSendError
+from .singleflight import SingleFlight
+
+SendKey = typing.Tuple[typing.Union[int, str, None], str]
+"""The chat a message is sent to, and the idempotency key of the send."""
+
+UNSENT_ERRORS: typing.Final = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+"""Transport failures raised before a request could reach Telegram."""
+
+
+def reached_server(error: BaseException) -> bool:
+    """
+    Whether a failed request may have been received by Telegram.
+
+    Parameters
+    ----------
+    error : BaseException
+        The error the request failed with.
+
+    Returns
+    -------
+    bool
+        False if the request provably never left, True if Telegram may have
+        carried it out, as after a read timeout or a dropped connection.
+    """
+    return not isinstance(error, UNSENT_ERRORS)
+
+
+class SendLedger:
+    """
+    Remembers the outcome of sends made with an idempotency key.
+
+    A send made again with the key of a send to the same chat which
+    succeeded less than `ttl` seconds ago returns the messages of that send
+    instead of sending them again, and a send made while one with the same
+    chat and key is in flight waits for its outcome. Retrying a send, or
+    handling the same update twice, then never duplicates its messages.
+
+    Telegram has no idempotency keys of its own, and no way to look up the
+    messages sent, so the ledger only knows of the sends whose answer
+    arrived. Keyed sends are therefore only repeated after failures which
+    prove the request never reached Telegram. A send failing after it may
+    have reached Telegram, such as on a read timeout, raises
+    `KiranAmbiguousSendError`, which is recorded like a result: a send made
+    again with its key raises it too instead of maybe duplicating the
+    message, until the key expires or is forgotten with `forget`. Sends cut
+    short by a deadline or cancelled are not recorded.
+
+    Parameters
+    ----------
+    ttl : float
+        Seconds the outcome of a send is remembered, default is 600.
+    max_entries : int
+        Most sends remembered, the oldest are forgotten first, default is
+        10000.
+    """
+
+    def __init__(self, ttl: float = 600.0, max_entries: int = 10000) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._results: typing.OrderedDict[
+            SendKey, typing.Tuple[float, typing.Any]
+        ] = collections.OrderedDict()
+        self._inflight: SingleFlight[SendKey, typing.Any] = SingleFlight()
+        self.sends = 0
+        """Number of keyed sends made."""
+        self.duplicates = 0
+        """Number of keyed sends answered without sending again."""
+        self.ambiguous = 0
+        """Number of keyed sends which may or may not have been made."""
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        return f"SendLedger(ttl={self.ttl}, entries={len(self)}, sends={self.sends}, duplicates={self.duplicates}, ambiguous={self.ambiguous})"
+
+    def _prune(self, now: float) -> None:
+        while self._results and (
+            len(self._results) > self.max_entries
+            or next(iter(self._results.values()))[0] <= now
+        ):
+            self._results.popitem(last=False)
+
+    def get(
+        self, chat_id: typing.Union[int, str, None], key: str
+    ) -> typing.Optional[typing.Any]:
+        """
+        Get the outcome of an earlier send.
+
+        Parameters
+        ----------
+        chat_id : typing.Union[int, str, None]
+            The chat the send was made to.
+        key : str
+            The idempotency key of the send.
+
+        Returns
+        -------
+        typing.Optional[typing.Any]
+            The result of the send, None if it is not remembered.
+
+        Raises
+        ------
+        KiranAmbiguousSendError
+            If the send may or may not have been made.
+        """
+        self._prune(time.monotonic())
+        entry = self._results.get((chat_id, key))
+        if entry is None:
+            return None
+        if isinstance(entry[1], KiranAmbiguousSendError):
+            raise entry[1]
+        return entry[1]
+
+    def forget(self, chat_id: typing.Union[int, str, None], key: str) -> None:
+        """
+        Forget the outcome of an earlier send, letting it be made again.
+
+        Parameters
+        ----------
+        chat_id : typing.Union[int, str, None]
+            The chat the send was made to.
+        key : str
+            The idempotency key of the send.
+        """
+        self._results.pop((chat_id, key), None)
+
+    async def do(
+        self,
+        chat_id: typing.Union[int, str, None],
+        key: str,
+        send: typing.Callable[[], typing.Awaitable[typing.Any]],
+    ) -> typing.Any:
+        """
+        Make a send once per chat and key.
+
+        Parameters
+        ----------
+        chat_id : typing.Union[int, str, None]
+            The chat the send is made to.
+        key : str
+            The idempotency key of the send.
+        send : typing.Callable[[], typing.Awaitable[typing.Any]]
+            Makes the send, only called if it was not made already.
+
+        Returns
+        -------
+        typing.Any
+            The result of the send, or of the earlier send with the same key.
+
+        Raises
+        ------
+        KiranAmbiguousSendError
+            If this send, or the earlier send with the same key, may or may
+            not have been made.
+        """
+        try:
+            result = self.get(chat_id, key)
+        except KiranAmbiguousSendError:
+            self.duplicates += 1
+            raise
+        if result is not None:
+            self.duplicates += 1
+            return result
+        if (chat_id, key) in self._inflight:
+            self.duplicates += 1
+        return await self._inflight.do(
+            (chat_id, key), lambda: self._send(chat_id, key, send)
+        )
+
+    async def _send(
+        self,
+        chat_id: typing.Union[int, str, None],
+        key: str,
+        send: typing.Callable[[], typing.Awaitable[typing.Any]],
+    ) -> typing.Any:
+        self.sends += 1
+        try:
+            result = await send()
+        except KiranAmbiguousSendError as e:
+            self.ambiguous += 1
+            self._remember(chat_id, key, e)
+            raise
+        if result is not None:
+            self._remember(chat_id, key, result)
+        return result
+
+    def _remember(
+        self,
+        chat_id: typing.Union[int, str, None],
+        key: str,
+        outcome: typing.Any,
+    ) -> None:
+        self._results[(chat_id, key)] = (time.monotonic() + self.ttl, outcome)
+        self._prune(time.monotonic())
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
-import enum
+import pathlib
 import typing
 
 import httpx
@@ -26,8 +26,85 @@ from ..abc.dependent import MessageEntity
 from ..abc.dependent import ReplyParameters
 from ..abc.dependent import User
 from ..abc.files import File
+from ..abc.media import InputMedia
+from ..abc.media import PhotoSize
+from ..abc.messages import MessageId
 from ..abc.users import UserProfilePhotos
+from ..errors import KiranAmbiguousSendError
+from ..errors import KiranBulkRequestError
+from ..errors import KiranCircuitOpenError
+from ..errors import KiranDeadlineError
 from ..errors import KiranPollingError
+from ..errors import KiranValueError
+from ..errors import TelegramAPIError
+from ..errors import TelegramBadRequestError
+from ..errors import TelegramChatMigratedError
+from .broadcast import Broadcaster
+from .broadcast import BroadcastProgress
+from .broadcast import BroadcastState
+from .cache import FileIdCache
+from .deadlines import deadline
+from .deadlines import remaining
+from .downloads import DOWNLOAD_CHUNK_SIZE
+from .downloads import Downloadable
+from .downloads import Downloader
+from .downloads import pick_photo_size
+from .idempotency import reached_server
+from .outbound import priority
+from .payloads import AnswerCallbackQueryPayload
+from .payloads import BanChatMemberPayload
+from .payloads import ChatPayload
+from .payloads import ChatSenderChatPayload
+from .payloads import ChatUserPayload
+from .payloads import CopyMessagePayload
+from .payloads import CopyMessagesPayload
+from .payloads import CreateChatInviteLinkPayload
+from .payloads import DeleteMessagesPayload
+from .payloads import DeleteMyCommandsPayload
+from .payloads import EditChatInviteLinkPayload
+from .payloads import ForwardMessagePayload
+from .payloads import ForwardMessagesPayload
+from .payloads import GetFilePayload
+from .payloads import GetUserProfilePhotosPayload
+from .payloads import Payload
+from .payloads import PinChatMessagePayload
+from .payloads import PromoteChatMemberPayload
+from .payloads import RestrictChatMemberPayload
+from .payloads import RevokeChatInviteLinkPayload
+from .payloads import SendAnimationPayload
+from .payloads import SendAudioPayload
+from .payloads import SendDicePayload
+from .payloads import SendDocumentPayload
+from .payloads import SendMediaGroupPayload
+from .payloads import SendMessagePayload
+from .payloads import SendPhotoPayload
+from .payloads import SendVideoNotePayload
+from .payloads import SendVideoPayload
+from .payloads import SendVoicePayload
+from .payloads import SetChatAdministratorCustomTitlePayload
+from .payloads import SetChatDescriptionPayload
+from .payloads import SetChatPermissionsPayload
+from .payloads import SetChatPhotoPayload
+from .payloads import SetChatTitlePayload
+from .payloads import SetMessageReactionPayload
+from .payloads import SetMyCommandsPayload
+from .payloads import TemplatePayload
+from .payloads import UnbanChatMemberPayload
+from .payloads import UnpinChatMessagePayload
+from .responses import Response
+from .responses import ResponseDecoders
+from .singleflight import SingleFlight
+from .uploads import InputFile
+from .uploads import MultipartStream
+from .uploads import Upload
+
+_JSON_HEADERS: typing.Final = {"Content-Type": "application/json"}
+
+MAX_BULK_MESSAGE_IDS: typing.Final = 100
+"""Most message ids accepted by one call of the bulk message methods."""
+
+MAX_MEDIA_GROUP_SIZE: typing.Final = 10
+"""Most items of a media group."""
 
 if typing.TYPE_CHECKING:
     from ..abc.misc import LinkPreviewOptions
@@ -39,6 +116,7 @@ if typing.TYPE_CHECKING:
     from ..abc.userinterface import ReplyKeyboardRemove
     from ..components.commands import LanguageCode
     from ..core.enums import ParseMode
+    from ..core.enums import Priority
     from ..impl import KiranBot
 
 
@@ -151,145 +229,597 @@ class KiranCaller:
     def __init__(self, bot: "KiranBot") -> None:
         self.client = bot
         self.encoder = msgspec.json.Encoder()
+        self._buffer = bytearray()
         self.client.log("Caller: JSON Encoder initialized.", "debug")
+        self.decoders = ResponseDecoders()
+        self.client.log("Caller: Response decoder cache initialized.", "debug")
+        self._migrated_chats: typing.Dict[typing.Union[int, str], int] = {}
+        self.inflight: SingleFlight[
+            typing.Tuple[str, typing.Optional[bytes], typing.Any], typing.Any
+        ] = SingleFlight()
+        self.downloader = Downloader(self)
+        self.client.log(
+            "Caller: Read-only call coalescing initialized.", "debug"
+        )
 
-    def _get_bytes(self, resp: httpx.Response) -> bytes:
-        return msgspec.json.encode(resp.json()["result"])
-
-    def build_params(self, **kwargs: typing.Any):
-        params: typing.Dict[str, typing.Any] = {}
-        for name, argument in kwargs.items():
-            if argument is not None:
-                try:
-                    if not isinstance(argument, enum.Enum):
-                        # TODO Find an alternative and fast solution for these processing.
-                        # params.update(
-                        #    {
-                        #        params[name] : self.encoder.encode(argument).decode()
-                        #    }
-                        # )
-                        # this is not doing the '" thing, but is not encoding the arguments properly.
-                        # params[name] = self.encoder.encode(argument).decode() # this is doing the '" thing but is encoding.
-                        # every arguments properly!
-                        encoded_value = (
-                            self.encoder.encode(argument)
-                            .decode()
-                            .strip('"')
-                            .replace("\\n", "\n")
-                        )
-                        params[name] = encoded_value
-                except Exception:
-                    params[name] = (
-                        argument.value
-                        if isinstance(argument, enum.Enum)
-                        else argument
-                    )
-                finally:
-                    if isinstance(argument, enum.Enum):
-                        params[name] = argument.value
+    @staticmethod
+    def deadline(timeout: float) -> typing.ContextManager[float]:
+        """
+        Bound the calls made within a block to a time budget.
+
+        A handler with a few seconds to answer passes them down to the calls
+        it makes, which raise `KiranDeadlineError` instead of running or
+        retrying past the deadline, see `kiran.core.deadlines.deadline`.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds the calls of the block have, from now.
+
+        Returns
+        -------
+        typing.ContextManager[float]
+            The block, yielding the deadline in `time.monotonic` seconds.
+        """
+        return deadline(timeout)
+
+    @staticmethod
+    def priority(level: Priority) -> typing.ContextManager[Priority]:
+        """
+        Set the priority class of the calls made within a block.
+
+        Calls wait for a slot of the outbound queue of the bot in the turn
+        of their class, so bulk jobs run as `Priority.BULK` only use the
+        capacity interactive replies leave, see `OutboundQueue`.
+
+        Parameters
+        ----------
+        level : Priority
+            The priority class of the calls.
+
+        Returns
+        -------
+        typing.ContextManager[Priority]
+            The block, yielding the priority class.
+        """
+        return priority(level)
+
+    def _decode_envelope(
+        self,
+        method: typing.Union[str, TelegramMethodName],
+        response: httpx.Response,
+        result_type: typing.Any,
+    ) -> Response[typing.Any]:
+        self.client.log(
+            f"Caller Response: {method} returned {len(response.content)} bytes.",
+            "debug",
+        )
+        try:
+            return self.decoders.get(result_type).decode(response.content)
+        except msgspec.DecodeError:
+            return Response(
+                ok=False,
+                error_code=response.status_code,
+                description=response.reason_phrase or "Response is not JSON.",
+            )
+
+    def _error_of(
+        self,
+        method: typing.Union[str, TelegramMethodName],
+        envelope: Response[typing.Any],
+    ) -> TelegramAPIError:
+        parameters = envelope.parameters
+        return TelegramAPIError.from_response(
+            method=str(method),
+            error_code=envelope.error_code or 0,
+            description=envelope.description or "",
+            retry_after=parameters.retry_after if parameters else None,
+            migrate_to_chat_id=(
+                parameters.migrate_to_chat_id if parameters else None
+            ),
+            client=self.client,
+        )
+
+    def _follow_migration(
+        self, payload: typing.Optional[Payload]
+    ) -> typing.Optional[Payload]:
+        chat_id = getattr(payload, "chat_id", None)
+        if not isinstance(chat_id, (int, str)):
+            return payload
+        migrated = self._migrated_chats.get(chat_id)
+        if migrated is None:
+            return payload
+        return msgspec.structs.replace(payload, chat_id=migrated)  # type: ignore
+
+    def _record_pace(
+        self,
+        method: typing.Union[str, TelegramMethodName],
+        chat_id: typing.Optional[typing.Union[int, str]],
+        envelope: Response[typing.Any],
+    ) -> None:
+        limiter = self.client.rate_limiter
+        if envelope.ok is True:
+            limiter.record_success(chat_id)
+        elif envelope.error_code == 429:
+            retry_after = (
+                envelope.parameters.retry_after
+                if envelope.parameters is not None
+                else None
+            )
+            limiter.record_flood(chat_id, retry_after)
+            self.client.log(
+                f"Caller: Flood control hit on {method} for chat {chat_id}, pacing down to {limiter.global_bucket.rate:.1f} messages per second.",
+                "warning",
+            )
+
+    def _encode(self, payload: Payload) -> bytes:
+        self.encoder.encode_into(payload, self._buffer)
+        return bytes(self._buffer)
+
+    def _form_fields(
+        self, payload: typing.Optional[Payload]
+    ) -> typing.Dict[str, str]:
+        if payload is None:
+            return {}
+        return {
+            name: value
+            if isinstance(value, str)
+            else self.encoder.encode(value).decode()
+            for name, value in msgspec.to_builtins(payload).items()
+        }
+
+    @staticmethod
+    def _file_reference(file: typing.Optional[Upload]) -> typing.Optional[str]:
+        return file if isinstance(file, str) else None
+
+    def _local_uri(self, file: typing.Optional[Upload]) -> typing.Optional[str]:
+        if not self.client.transport_settings.local_mode:
+            return None
+        if isinstance(file, InputFile):
+            file = file.source
+        if not isinstance(file, pathlib.Path):
+            return None
+        return file.resolve().as_uri()
+
+    def _reference_local_files(
+        self,
+        payload: typing.Optional[Payload],
+        files: typing.Dict[str, InputFile],
+    ) -> typing.Tuple[typing.Optional[Payload], typing.Dict[str, InputFile]]:
+        fields = getattr(payload, "__struct_fields__", ())
+        uris = {
+            name: uri
+            for name, file in files.items()
+            if name in fields and (uri := self._local_uri(file)) is not None
+        }
+        if not uris:
+            return payload, files
+        self.client.log(
+            f"Caller: Sending {len(uris)} local files by path to the local Bot API server.",
+            "debug",
+        )
+        remaining = {
+            name: file for name, file in files.items() if name not in uris
+        }
+        return msgspec.structs.replace(payload, **uris), remaining
+
+    @staticmethod
+    def _uploads(
+        **files: typing.Optional[Upload],
+    ) -> typing.Dict[str, InputFile]:
+        return {
+            name: file if isinstance(file, InputFile) else InputFile(file)
+            for name, file in files.items()
+            if file is not None and not isinstance(file, str)
+        }
+
+    def _build_request(
+        self,
+        method: typing.Union[str, TelegramMethodName],
+        payload: typing.Optional[Payload],
+        files: typing.Optional[typing.Dict[str, InputFile]],
+    ) -> typing.Dict[str, typing.Any]:
+        request: typing.Dict[str, typing.Any] = {}
+        if files:
+            stream = MultipartStream(
+                self._form_fields(payload),
+                files,
+                self.client.transfer_scheduler,
+            )
+            request["content"] = stream
+            request["headers"] = stream.headers
+            self.client.log(
+                f"Caller Request: {method} streaming {len(files)} files, {stream.size} bytes.",
+                "debug",
+            )
+            return request
+        if isinstance(payload, TemplatePayload):
+            request["content"] = payload.template.render(payload.chat_id)
+            request["headers"] = _JSON_HEADERS
+        elif payload is not None:
+            request["content"] = self._encode(payload)
+            request["headers"] = _JSON_HEADERS
+        self.client.log(
+            f"Caller Request: {method} with {len(request.get('content', b''))} bytes of JSON.",
+            "debug",
+        )
+        return request
+
+    @staticmethod
+    def _chunk_message_ids(
+        message_ids: typing.Iterable[int],
+    ) -> typing.List[typing.List[int]]:
+        ordered = sorted(set(message_ids))
+        return [
+            ordered[start : start + MAX_BULK_MESSAGE_IDS]
+            for start in range(0, len(ordered), MAX_BULK_MESSAGE_IDS)
+        ]
+
+    @staticmethod
+    def _message_ids_of(
+        results: typing.List[typing.List[MessageId]],
+    ) -> typing.List[int]:
+        return [message.message_id for result in results for message in result]
 
-        self.client.log("Params:\n" + str(params), "debug")
-        return params
+    async def _make_bulk_request(
+        self,
+        method: typing.Union[str, TelegramMethodName],
+        message_ids: typing.Iterable[int],
+        payload_of: typing.Callable[[typing.List[int]], Payload],
+        result_type: typing.Any,
+        combine: typing.Callable[[typing.List[typing.Any]], typing.Any],
+    ) -> typing.Any:
+        chunks = self._chunk_message_ids(message_ids)
+        self.client.log(f"Sending {method} in {len(chunks)} chunks.", "debug")
+        outcomes = await asyncio.gather(
+            *(
+                self._make_request(
+                    method=method,
+                    payload=payload_of(chunk),
+                    result_type=result_type,
+                )
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        failures = [
+            (chunk, outcome)
+            for chunk, outcome in zip(chunks, outcomes)
+            if isinstance(outcome, BaseException)
+        ]
+        if not failures:
+            return combine(list(outcomes))
+        successes = [
+            (chunk, outcome)
+            for chunk, outcome in zip(chunks, outcomes)
+            if not isinstance(outcome, BaseException)
+        ]
+        self.client.log(
+            f"{method}: {len(failures)} of {len(chunks)} chunks failed.",
+            "error",
+        )
+        raise KiranBulkRequestError(
+            message=f"{len(failures)} of {len(chunks)} chunks of {method} failed.",
+            result=combine([outcome for _, outcome in successes]),
+            done=[id_ for chunk, _ in successes for id_ in chunk],
+            failed=[id_ for chunk, _ in failures for id_ in chunk],
+            errors=[error for _, error in failures],
+            client=self.client,
+        ) from failures[0][1]
+
+    async def _make_request(
+        self,
+        method: typing.Union[str, TelegramMethodName],
+        payload: typing.Optional[Payload] = None,
+        files: typing.Optional[typing.Dict[str, InputFile]] = None,
+        result_type: typing.Any = bool,
+        idempotency_key: typing.Optional[str] = None,
+    ) -> typing.Any:
+        payload = self._follow_migration(payload)
+        if files and self.client.transport_settings.local_mode:
+            payload, files = self._reference_local_files(payload, files)
+        if idempotency_key is not None:
+            return await self._join_flight(
+                method,
+                self.client.send_ledger.do(
+                    getattr(payload, "chat_id", None),
+                    idempotency_key,
+                    lambda: self._dispatch_request(
+                        method, payload, files, result_type, once=True
+                    ),
+                ),
+            )
+        return await self._dispatch_request(method, payload, files, result_type)
+
+    async def _join_flight(
+        self,
+        method: typing.Union[str, TelegramMethodName],
+        flight: typing.Awaitable[typing.Any],
+    ) -> typing.Any:
+        try:
+            return await flight
+        except asyncio.TimeoutError as e:
+            left = remaining()
+            if left is None or left > 0:
+                raise
+            raise self._deadline_error(method) from e
+
+    async def _dispatch_request(
+        self,
+        method: typing.Union[str, TelegramMethodName],
+        payload: typing.Optional[Payload],
+        files: typing.Optional[typing.Dict[str, InputFile]],
+        result_type: typing.Any,
+        once: bool = False,
+    ) -> typing.Any:
+        if files and self.client.file_id_cache is not None:
+            return await self._make_cached_upload(
+                method, payload, files, result_type, once
+            )
+        request = self._build_request(method, payload, files)
+        if files or not self.inflight.coalesces(str(method)):
+            return await self._send_request(
+                method, payload, request, files, result_type, once
+            )
+        return await self._join_flight(
+            method,
+            self.inflight.do(
+                (str(method), request.get("content"), result_type),
+                lambda: self._send_request(
+                    method, payload, request, files, result_type
+                ),
+            ),
+        )
 
-    async def _make_post(
+    async def _make_cached_upload(
         self,
         method: typing.Union[str, TelegramMethodName],
-        content: typing.Optional[typing.Any] = None,
-        file: typing.Optional[typing.Dict[str, typing.BinaryIO]] = None,
-        data: typing.Optional[typing.Dict[str, typing.Any]] = None,
-        json: typing.Optional[typing.Dict[str, typing.Any]] = None,
-        retry_count: int = 3,
-        retry_delay: int = 1,
-    ) -> typing.Optional[httpx.Response]:
-        for attempt in range(retry_count):
+        payload: typing.Optional[Payload],
+        files: typing.Dict[str, InputFile],
+        result_type: typing.Any,
+        once: bool = False,
+    ) -> typing.Any:
+        cache = typing.cast(FileIdCache, self.client.file_id_cache)
+        fields = getattr(payload, "__struct_fields__", ())
+        digests = await cache.digests(
+            {name: file for name, file in files.items() if name in fields}
+        )
+        file_ids = cache.lookup(digests)
+        if file_ids:
+            remaining = {
+                name: file
+                for name, file in files.items()
+                if name not in file_ids
+            }
+            cached = msgspec.structs.replace(payload, **file_ids)
             try:
-                response = await self.client.session.post(
-                    str(method),
-                    data=data,
-                    files=file,
-                    json=json,
-                    content=content,
+                return await self._send_request(
+                    method,
+                    cached,
+                    self._build_request(method, cached, remaining),
+                    remaining,
+                    result_type,
+                    once,
                 )
+            except TelegramBadRequestError as e:
+                if not cache.rejects(e):
+                    raise
                 self.client.log(
-                    f"Caller Response:\n{msgspec.json.format(response.text, indent=4)}",
-                    "debug",
+                    f"Caller: Cached file ids of {method} were rejected, uploading the files again.",
+                    "warning",
                 )
-                return response if response.json()["ok"] is True else None
-            except (asyncio.TimeoutError, httpx.TimeoutException) as e:
-                if attempt < retry_count - 1:
-                    self.client.log(
-                        f"Error while making request to Telegram (attempt {attempt+1}/{retry_count}). Retrying in {retry_delay} seconds.",
-                        "warning",
-                    )
-                    await asyncio.sleep(retry_delay)
-                else:
-                    self.client.log(
-                        f"Error while making request to Telegram (attempt {attempt+1}/{retry_count}). Giving up.",
-                        "error",
-                    )
-                    raise KiranPollingError(
-                        message="Error while making request to Telegram.",
-                        client=self.client,
-                    ) from e
+                await cache.invalidate(
+                    {name: digests[name] for name in file_ids}
+                )
+        result = await self._send_request(
+            method,
+            payload,
+            self._build_request(method, payload, files),
+            files,
+            result_type,
+            once,
+        )
+        await cache.remember(digests, result)
+        return result
+
+    def _deadline_error(
+        self, method: typing.Union[str, TelegramMethodName]
+    ) -> KiranDeadlineError:
+        self.client.log(f"Caller: {method} ran out of its deadline.", "error")
+        return KiranDeadlineError(
+            message=f"{method} ran out of its deadline.", client=self.client
+        )
 
-    async def _make_request(
+    async def _post(
+        self,
+        method: typing.Union[str, TelegramMethodName],
+        request: typing.Dict[str, typing.Any],
+        files: typing.Optional[typing.Dict[str, InputFile]],
+        chat_id: typing.Any = None,
+        paced: bool = False,
+    ) -> httpx.Response:
+        budget = remaining()
+        if budget is not None and budget <= 0:
+            raise self._deadline_error(method)
+        breaker = self.client.circuit_breaker
+        if not breaker.allow():
+            raise KiranCircuitOpenError(
+                message=f"{method} was not sent, the Bot API keeps failing. Retrying in {breaker.retry_in:.2f} seconds.",
+                client=self.client,
+            )
+        try:
+            response = await asyncio.wait_for(
+                self._paced_post(method, request, files, chat_id, paced),
+                budget,
+            )
+        except asyncio.TimeoutError as e:
+            left = remaining()
+            if left is not None and left <= 0:
+                breaker.release()
+                raise self._deadline_error(method) from e
+            self._record_outcome(method, failed=True)
+            raise
+        except httpx.TransportError:
+            self._record_outcome(method, failed=True)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        self._record_outcome(method, failed=response.status_code >= 500)
+        return response
+
+    def _record_outcome(
+        self, method: typing.Union[str, TelegramMethodName], failed: bool
+    ) -> None:
+        breaker = self.client.circuit_breaker
+        if not failed:
+            if breaker.record_success():
+                self.client.log(
+                    f"Caller: {method} went through, the circuit breaker closed.",
+                    "info",
+                )
+            return
+        if breaker.record_failure():
+            self.client.log(
+                f"Caller: {breaker.failures} attempts failed in a row, the circuit breaker opened for {breaker.reset_timeout:.2f} seconds.",
+                "error",
+            )
+
+    async def _paced_post(
+        self,
+        method: typing.Union[str, TelegramMethodName],
+        request: typing.Dict[str, typing.Any],
+        files: typing.Optional[typing.Dict[str, InputFile]],
+        chat_id: typing.Any,
+        paced: bool,
+    ) -> httpx.Response:
+        if paced:
+            await self.client.rate_limiter.acquire(chat_id)
+        if not files:
+            async with self.client.outbound_queue.slot():
+                return await self.client.session.post(str(method), **request)
+        async with (
+            self.client.transfer_scheduler.slot(),
+            self.client.outbound_queue.slot(),
+        ):
+            return await self.client.session.post(str(method), **request)
+
+    async def _backoff(
+        self,
+        method: typing.Union[str, TelegramMethodName],
+        delay: float,
+        error: BaseException,
+    ) -> None:
+        budget = remaining()
+        if budget is not None and delay >= budget:
+            raise self._deadline_error(method) from error
+        await asyncio.sleep(delay)
+
+    def _transport_failure(
+        self,
+        method: typing.Union[str, TelegramMethodName],
+        error: Exception,
+        attempt: int,
+        replayable: bool,
+        once: bool,
+    ) -> typing.Optional[KiranPollingError]:
+        policy = self.client.retry_policy
+        if once and reached_server(error):
+            self.client.log(
+                f"Error after {method} may have reached Telegram: {error!r}. Not repeated, to never send it twice.",
+                "error",
+            )
+            return KiranAmbiguousSendError(
+                message=f"{method} may or may not have been carried out by Telegram.",
+                client=self.client,
+            )
+        if attempt == policy.attempts - 1 or not replayable:
+            self.client.log(
+                f"Error while making request to Telegram (attempt {attempt + 1}/{policy.attempts}). Giving up.",
+                "error",
+            )
+            return KiranPollingError(
+                message="Error while making request to Telegram.",
+                client=self.client,
+            )
+        return None
+
+    async def _send_request(
         self,
         method: typing.Union[str, TelegramMethodName],
-        params: typing.Optional[typing.Dict[str, typing.Any]] = None,
-        retry_count: int = 3,
-        retry_delay: int = 1,
-    ) -> typing.Optional[httpx.Response]:
-        for attempt in range(retry_count):
+        payload: typing.Optional[Payload],
+        request: typing.Dict[str, typing.Any],
+        files: typing.Optional[typing.Dict[str, InputFile]],
+        result_type: typing.Any,
+        once: bool = False,
+    ) -> typing.Any:
+        policy = self.client.retry_policy
+        replayable = all(file.replayable for file in (files or {}).values())
+        paced = self.client.rate_limiter.limits(str(method))
+        for attempt in range(policy.attempts):
+            chat_id = getattr(payload, "chat_id", None) if paced else None
             try:
-                response = await self.client.session.get(
-                    str(method), params=params
+                response = await self._post(
+                    method, request, files, chat_id, paced
                 )
+            except (asyncio.TimeoutError, httpx.TransportError) as e:
+                failure = self._transport_failure(
+                    method, e, attempt, replayable, once
+                )
+                if failure is not None:
+                    raise failure from e
+                delay = policy.backoff(attempt)
                 self.client.log(
-                    f"Caller Response:\n{msgspec.json.format(response.text, indent=4)}",
-                    "debug",
+                    f"Error while making request to Telegram (attempt {attempt + 1}/{policy.attempts}): {e!r}. Retrying in {delay:.2f} seconds.",
+                    "warning",
                 )
-                return response if response.json()["ok"] is True else None
-            except (asyncio.TimeoutError, httpx.TimeoutException) as e:
-                if attempt < retry_count - 1:
-                    self.client.log(
-                        f"Error while making request to Telegram (attempt {attempt+1}/{retry_count}). Retrying in {retry_delay} seconds.",
-                        "warning",
-                    )
-                    await asyncio.sleep(retry_delay)
+                await self._backoff(method, delay, e)
+                continue
+            envelope = self._decode_envelope(method, response, result_type)
+            if paced:
+                self._record_pace(method, chat_id, envelope)
+            if envelope.ok is True:
+                return envelope.result
+            error = self._error_of(method, envelope)
+            delay = policy.delay(error, attempt) if replayable else None
+            if isinstance(error, TelegramChatMigratedError):
+                if not isinstance(
+                    getattr(payload, "chat_id", None), (int, str)
+                ):
+                    delay = None
                 else:
-                    self.client.log(
-                        f"Error while making request to Telegram (attempt {attempt+1}/{retry_count}). Giving up.",
-                        "error",
+                    self._migrated_chats[payload.chat_id] = (  # type: ignore
+                        error.migrate_to_chat_id
                     )
-                    raise KiranPollingError(
-                        message="Error while making request to Telegram.",
-                        client=self.client,
-                    ) from e
+                    payload = self._follow_migration(payload)
+                    request = self._build_request(method, payload, files)
+            if delay is None:
+                self.client.log(error.message, "error")
+                raise error
+            self.client.log(
+                f"{error.message} (attempt {attempt + 1}/{policy.attempts}). Retrying in {delay:.2f} seconds.",
+                "warning",
+            )
+            await self._backoff(method, delay, error)
 
     async def get_me(self) -> typing.Optional[User]:
-        response = await self._make_request(method=TelegramMethodName.GET_ME)
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response),
-                type=User,
-                strict=False,
-            )
-        else:
-            return None
+        return await self._make_request(
+            method=TelegramMethodName.GET_ME, result_type=User
+        )
 
     async def log_out(self) -> None:
-        response = await self._make_request(method=TelegramMethodName.LOG_OUT)
-        if response is not None:
+        result = await self._make_request(method=TelegramMethodName.LOG_OUT)
+        if result is not None:
             self.client.log(
-                f"Log Out Response:\n{response.text}",
+                f"Log Out Response:\n{result}",
                 "debug",
             )
 
     async def close(self) -> None:
-        response = await self._make_request(method=TelegramMethodName.CLOSE)
-        if response is not None:
+        result = await self._make_request(method=TelegramMethodName.CLOSE)
+        if result is not None:
             self.client.log(
-                f"Close Response:\n{response.text}",
+                f"Close Response:\n{result}",
                 "debug",
             )
 
@@ -314,12 +844,13 @@ class KiranCaller:
                 ForceReply,
             ]
         ] = None,
+        idempotency_key: typing.Optional[str] = None,
     ) -> typing.Optional[Message]:
         if isinstance(chat_id, Chat):
             chat_id = chat_id.id
-        response = await self._make_request(
+        return await self._make_request(
             method=TelegramMethodName.SEND_MESSAGE,
-            params=self.build_params(
+            payload=SendMessagePayload(
                 chat_id=chat_id,
                 text=text,
                 business_connection_id=business_connection_id,
@@ -333,16 +864,131 @@ class KiranCaller:
                 reply_parameters=reply_parameters,
                 reply_markup=reply_markup,
             ),
+            result_type=Message,
+            idempotency_key=idempotency_key,
         )
 
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response),
-                type=Message,
-                strict=False,
-            )
-        else:
-            return None
+    async def broadcast(
+        self,
+        method: typing.Union[str, TelegramMethodName],
+        payload: Payload,
+        chat_ids: typing.Sequence[typing.Union[int, str]],
+        result_type: typing.Any = Message,
+        checkpoint: typing.Optional[typing.Union[str, pathlib.Path]] = None,
+        concurrency: int = 16,
+        on_progress: typing.Optional[
+            typing.Callable[[BroadcastProgress], None]
+        ] = None,
+    ) -> BroadcastState:
+        """
+        Call a method once per chat, see `Broadcaster`.
+
+        Parameters
+        ----------
+        method : typing.Union[str, TelegramMethodName]
+            The Bot API method sending the message.
+        payload : Payload
+            The parameters of the method, its `chat_id` is ignored.
+        chat_ids : typing.Sequence[typing.Union[int, str]]
+            The chats to send the message to, in the same order on every run.
+        result_type : typing.Any
+            The type of the result of the method, default is `Message`.
+        checkpoint : typing.Optional[typing.Union[str, pathlib.Path]]
+            File the progress is saved to and resumed from.
+        concurrency : int
+            Maximum number of sends in flight, default is 16.
+        on_progress : typing.Optional[typing.Callable[[BroadcastProgress], None]]
+            Called with the progress at every checkpoint.
+
+        Returns
+        -------
+        BroadcastState
+            The sent, blocked, deactivated and failed chats.
+        """
+        return await Broadcaster(
+            caller=self,
+            method=str(method),
+            payload=payload,
+            chat_ids=chat_ids,
+            result_type=result_type,
+            checkpoint=checkpoint,
+            concurrency=concurrency,
+            on_progress=on_progress,
+        ).run()
+
+    async def broadcast_message(
+        self,
+        chat_ids: typing.Sequence[typing.Union[int, str]],
+        text: str,
+        parse_mode: typing.Optional[ParseMode] = None,
+        entities: typing.Optional[typing.List[MessageEntity]] = None,
+        link_preview_options: typing.Optional[LinkPreviewOptions] = None,
+        disable_notification: typing.Optional[bool] = None,
+        protect_content: typing.Optional[bool] = None,
+        reply_markup: typing.Optional[
+            typing.Union[
+                InlineKeyboardMarkup,
+                ReplyKeyboardMarkup,
+                ReplyKeyboardRemove,
+                ForceReply,
+            ]
+        ] = None,
+        checkpoint: typing.Optional[typing.Union[str, pathlib.Path]] = None,
+        concurrency: int = 16,
+        on_progress: typing.Optional[
+            typing.Callable[[BroadcastProgress], None]
+        ] = None,
+    ) -> BroadcastState:
+        """
+        Send a text message to many chats, see `Broadcaster`.
+
+        Parameters
+        ----------
+        chat_ids : typing.Sequence[typing.Union[int, str]]
+            The chats to send the message to, in the same order on every run.
+        text : str
+            The text of the message.
+        parse_mode : typing.Optional[ParseMode]
+            How the entities of the text are parsed.
+        entities : typing.Optional[typing.List[MessageEntity]]
+            The entities of the text.
+        link_preview_options : typing.Optional[LinkPreviewOptions]
+            How links of the text are previewed.
+        disable_notification : typing.Optional[bool]
+            Whether to send the message silently.
+        protect_content : typing.Optional[bool]
+            Whether to protect the message from forwarding and saving.
+        reply_markup : typing.Optional[typing.Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply]]
+            The keyboard of the message.
+        checkpoint : typing.Optional[typing.Union[str, pathlib.Path]]
+            File the progress is saved to and resumed from.
+        concurrency : int
+            Maximum number of sends in flight, default is 16.
+        on_progress : typing.Optional[typing.Callable[[BroadcastProgress], None]]
+            Called with the progress at every checkpoint.
+
+        Returns
+        -------
+        BroadcastState
+            The sent, blocked, deactivated and failed chats.
+        """
+        return await self.broadcast(
+            method=TelegramMethodName.SEND_MESSAGE,
+            payload=SendMessagePayload(
+                chat_id=0,
+                text=text,
+                parse_mode=parse_mode,
+                entities=entities,
+                link_preview_options=link_preview_options,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                reply_markup=reply_markup,
+            ),
+            chat_ids=chat_ids,
+            checkpoint=checkpoint,
+            concurrency=concurrency,
+            on_progress=on_progress,
+        )
 
     async def forward_message(
         self,
@@ -352,12 +998,13 @@ class KiranCaller:
         message_thread_id: typing.Optional[int] = None,
         disable_notification: typing.Optional[bool] = False,
         protect_content: typing.Optional[bool] = None,
+        idempotency_key: typing.Optional[str] = None,
     ) -> typing.Optional[Message]:
         if isinstance(chat_id, Chat):
             chat_id = chat_id.id
-        response = await self._make_request(
+        return await self._make_request(
             method=TelegramMethodName.FORWARD_MESSAGE,
-            params=self.build_params(
+            payload=ForwardMessagePayload(
                 chat_id=chat_id,
                 from_chat_id=from_chat_id,
                 message_id=message_id,
@@ -365,50 +1012,57 @@ class KiranCaller:
                 disable_notification=disable_notification,
                 protect_content=protect_content,
             ),
+            result_type=Message,
+            idempotency_key=idempotency_key,
         )
 
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response),
-                type=Message,
-                strict=False,
-            )
-        else:
-            return None
-
     async def forward_messages(
         self,
         chat_id: typing.Union[int, str, Chat],
         from_chat_id: typing.Union[int, str, Chat],
-        message_id: typing.List[int],
+        message_ids: typing.Iterable[int],
         message_thread_id: typing.Optional[int] = None,
         disable_notification: typing.Optional[bool] = False,
         protect_content: typing.Optional[bool] = None,
-    ) -> typing.Optional[Message]:
+    ) -> typing.List[int]:
+        """
+        Forward any number of messages, in chunks of up to 100 ids.
+
+        The ids are deduplicated and sorted, and the chunks are sent
+        concurrently under the rate limiter.
+
+        Returns
+        -------
+        typing.List[int]
+            The ids of the forwarded messages, in the order of the sorted ids
+            of the original ones. Messages Telegram could not find or forward
+            are skipped.
+
+        Raises
+        ------
+        KiranBulkRequestError
+            If some chunks failed, with the ids of the messages forwarded by
+            the others as its `result`.
+        """
         if isinstance(chat_id, Chat):
             chat_id = chat_id.id
-
-        response = await self._make_request(
-            method=TelegramMethodName.FORWARD_MESSAGE,
-            params=self.build_params(
+        if isinstance(from_chat_id, Chat):
+            from_chat_id = from_chat_id.id
+        return await self._make_bulk_request(
+            method=TelegramMethodName.FORWARD_MESSAGES,
+            message_ids=message_ids,
+            payload_of=lambda chunk: ForwardMessagesPayload(
                 chat_id=chat_id,
                 from_chat_id=from_chat_id,
-                message_id=message_id,
+                message_ids=chunk,
                 message_thread_id=message_thread_id,
                 disable_notification=disable_notification,
                 protect_content=protect_content,
             ),
+            result_type=typing.List[MessageId],
+            combine=self._message_ids_of,
         )
 
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response),
-                type=Message,
-                strict=False,
-            )
-        else:
-            return None
-
     async def copy_message(
         self,
         chat_id: typing.Union[int, str, Chat],
@@ -430,10 +1084,11 @@ class KiranCaller:
                 ForceReply,
             ]
         ] = None,
+        idempotency_key: typing.Optional[str] = None,
     ) -> typing.Optional[int]:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.COPY_MESSAGE,
-            params=self.build_params(
+            payload=CopyMessagePayload(
                 chat_id=chat_id,
                 from_chat_id=from_chat_id,
                 message_id=message_id,
@@ -447,38 +1102,91 @@ class KiranCaller:
                 reply_parameters=reply_parameters,
                 reply_markup=reply_markup,
             ),
+            result_type=MessageId,
+            idempotency_key=idempotency_key,
         )
-        if response is not None:
-            return int(response.json()["result"]["message_id"])
-        else:
-            return None
+        return result.message_id if result is not None else None
 
     async def copy_messages(
         self,
         chat_id: typing.Union[int, str, Chat],
         from_chat_id: typing.Union[int, str, Chat],
-        message_ids: typing.List[int],
+        message_ids: typing.Iterable[int],
         message_thread_id: typing.Optional[int] = None,
-        remove_caption: typing.Optional[str] = None,
+        remove_caption: typing.Optional[bool] = None,
         disable_notification: typing.Optional[bool] = False,
         protect_content: typing.Optional[bool] = None,
-    ) -> typing.Optional[typing.List[int]]:
-        response = await self._make_request(
+    ) -> typing.List[int]:
+        """
+        Copy any number of messages, in chunks of up to 100 ids.
+
+        The ids are deduplicated and sorted, and the chunks are sent
+        concurrently under the rate limiter.
+
+        Returns
+        -------
+        typing.List[int]
+            The ids of the copied messages, in the order of the sorted ids of
+            the original ones. Messages Telegram could not find or copy are
+            skipped.
+
+        Raises
+        ------
+        KiranBulkRequestError
+            If some chunks failed, with the ids of the messages copied by the
+            others as its `result`.
+        """
+        if isinstance(chat_id, Chat):
+            chat_id = chat_id.id
+        if isinstance(from_chat_id, Chat):
+            from_chat_id = from_chat_id.id
+        return await self._make_bulk_request(
             method=TelegramMethodName.COPY_MESSAGES,
-            params=self.build_params(
+            message_ids=message_ids,
+            payload_of=lambda chunk: CopyMessagesPayload(
                 chat_id=chat_id,
                 from_chat_id=from_chat_id,
-                message_ids=message_ids,
+                message_ids=chunk,
                 message_thread_id=message_thread_id,
                 remove_caption=remove_caption,
                 disable_notification=disable_notification,
                 protect_content=protect_content,
             ),
+            result_type=typing.List[MessageId],
+            combine=self._message_ids_of,
         )
-        return (
-            None
-            if response is None
-            else response.json()["result"]["message_ids"]
+
+    async def delete_messages(
+        self,
+        chat_id: typing.Union[int, str, Chat],
+        message_ids: typing.Iterable[int],
+    ) -> bool:
+        """
+        Delete any number of messages, in chunks of up to 100 ids.
+
+        The ids are deduplicated and sorted, and the chunks are sent
+        concurrently.
+
+        Returns
+        -------
+        bool
+            True if every chunk was deleted.
+
+        Raises
+        ------
+        KiranBulkRequestError
+            If some chunks failed, with the ids of the others as its `done`.
+        """
+        if isinstance(chat_id, Chat):
+            chat_id = chat_id.id
+        return await self._make_bulk_request(
+            method=TelegramMethodName.DELETE_MESSAGES,
+            message_ids=message_ids,
+            payload_of=lambda chunk: DeleteMessagesPayload(
+                chat_id=chat_id, message_ids=chunk
+            ),
+            result_type=bool,
+            combine=lambda results: all(result is True for result in results),
         )
 
     async def set_reaction(
@@ -492,16 +1200,17 @@ class KiranCaller:
         ] = None,
         is_big: typing.Optional[bool] = False,
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.SET_MESSAGE_REACTION,
-            params=self.build_params(
+            payload=SetMessageReactionPayload(
                 chat_id=chat_id,
                 message_id=message_id,
                 reaction=reaction,
                 is_big=is_big,
             ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def get_user_profile_photos(
         self,
@@ -509,32 +1218,121 @@ class KiranCaller:
         offset: typing.Optional[int] = None,
         limit: typing.Optional[int] = None,
     ) -> typing.Optional[UserProfilePhotos]:
-        response = await self._make_request(
+        return await self._make_request(
             method=TelegramMethodName.GET_USER_PROFILE_PHOTOS,
-            params=self.build_params(
+            payload=GetUserProfilePhotosPayload(
                 user_id=user_id, offset=offset, limit=limit
             ),
+            result_type=UserProfilePhotos,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response),
-                type=UserProfilePhotos,
-                strict=False,
-            )
-        else:
-            return None
 
     async def get_file(self, file_id: str) -> typing.Optional[File]:
-        response = await self._make_request(
+        return await self._make_request(
             method=TelegramMethodName.GET_FILE,
-            params=self.build_params(file_id=file_id),
+            payload=GetFilePayload(file_id=file_id),
+            result_type=File,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response), type=File, strict=False
-            )
-        else:
-            return None
+
+    @staticmethod
+    def _pick_file(
+        file: typing.Union[Downloadable, typing.Sequence[PhotoSize]],
+        min_width: int,
+        min_height: int,
+    ) -> Downloadable:
+        if isinstance(file, (list, tuple)):
+            return pick_photo_size(file, min_width, min_height)
+        return typing.cast(Downloadable, file)
+
+    def stream_file(
+        self,
+        file: typing.Union[Downloadable, typing.Sequence[PhotoSize]],
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        min_width: int = 0,
+        min_height: int = 0,
+    ) -> typing.AsyncIterator[bytes]:
+        """
+        Stream the content of a file, see `Downloader.stream`.
+
+        Parameters
+        ----------
+        file : typing.Union[Downloadable, typing.Sequence[PhotoSize]]
+            The file id, or an object carrying one, or the sizes of a photo
+            as found in `Message.photo`.
+        chunk_size : int
+            Bytes yielded at a time, default is 64 KiB.
+        min_width : int
+            The smallest width of the photo size streamed, see
+            `pick_photo_size`, default is 0.
+        min_height : int
+            The smallest height of the photo size streamed, default is 0.
+
+        Returns
+        -------
+        typing.AsyncIterator[bytes]
+            The chunks of the file.
+        """
+        return self.downloader.stream(
+            self._pick_file(file, min_width, min_height), chunk_size
+        )
+
+    async def download_file(
+        self,
+        file: typing.Union[Downloadable, typing.Sequence[PhotoSize]],
+        destination: typing.Union[str, pathlib.Path, typing.BinaryIO],
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        min_width: int = 0,
+        min_height: int = 0,
+    ) -> int:
+        """
+        Download a file to disk, see `Downloader.download`.
+
+        Parameters
+        ----------
+        file : typing.Union[Downloadable, typing.Sequence[PhotoSize]]
+            The file id, or an object carrying one, or the sizes of a photo
+            as found in `Message.photo`.
+        destination : typing.Union[str, pathlib.Path, typing.BinaryIO]
+            The path or binary file object to write the file to.
+        chunk_size : int
+            Bytes written at a time, default is 64 KiB.
+        min_width : int
+            The smallest width of the photo size downloaded, see
+            `pick_photo_size`, default is 0.
+        min_height : int
+            The smallest height of the photo size downloaded, default is 0.
+
+        Returns
+        -------
+        int
+            The number of bytes written.
+        """
+        return await self.downloader.download(
+            self._pick_file(file, min_width, min_height),
+            destination,
+            chunk_size,
+        )
+
+    async def download_files(
+        self,
+        files: typing.Mapping[typing.Union[str, pathlib.Path], Downloadable],
+        concurrency: int = 4,
+    ) -> typing.Dict[typing.Union[str, pathlib.Path], int]:
+        """
+        Download files to disk concurrently, see `Downloader.download_many`.
+
+        Parameters
+        ----------
+        files : typing.Mapping[typing.Union[str, pathlib.Path], Downloadable]
+            The files to download, by the path they are written to.
+        concurrency : int
+            Maximum number of downloads in flight, default is 4.
+
+        Returns
+        -------
+        typing.Dict[typing.Union[str, pathlib.Path], int]
+            The number of bytes written, by path.
+        """
+        return await self.downloader.download_many(files, concurrency)
 
     async def ban_chat_member(
         self,
@@ -543,16 +1341,17 @@ class KiranCaller:
         until_date: typing.Optional[int],
         revoke_messages: typing.Optional[bool],
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.BAN_CHAT_MEMBER,
-            params=self.build_params(
+            payload=BanChatMemberPayload(
                 chat_id=chat_id,
                 user_id=user_id,
                 until_date=until_date,
                 revoke_messages=revoke_messages,
             ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def unban_chat_member(
         self,
@@ -560,13 +1359,14 @@ class KiranCaller:
         user_id: int,
         only_if_banned: typing.Optional[bool] = None,
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.UNBAN_CHAT_MEMBER,
-            params=self.build_params(
+            payload=UnbanChatMemberPayload(
                 chat_id=chat_id, user_id=user_id, only_if_banned=only_if_banned
             ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def restrict_chat_member(
         self,
@@ -576,17 +1376,18 @@ class KiranCaller:
         use_independent_chat_permissions: typing.Optional[bool] = None,
         until_date: typing.Optional[int] = None,
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.RESTRICT_CHAT_MEMBERS,
-            params=self.build_params(
+            payload=RestrictChatMemberPayload(
                 chat_id=chat_id,
                 user_id=user_id,
                 permissions=permissions,
                 use_independent_chat_permissions=use_independent_chat_permissions,
                 until_date=until_date,
             ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def promote_chat_member(
         self,
@@ -608,9 +1409,9 @@ class KiranCaller:
         can_pin_messages: typing.Optional[bool] = None,
         can_manage_topics: typing.Optional[bool] = None,
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.PROMOTE_CHAT_MEMBER,
-            params=self.build_params(
+            payload=PromoteChatMemberPayload(
                 chat_id=chat_id,
                 user_id=user_id,
                 is_anonymous=is_anonymous,
@@ -629,41 +1430,45 @@ class KiranCaller:
                 can_pin_messages=can_pin_messages,
                 can_manage_topics=can_manage_topics,
             ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def set_chat_administrator_custom_title(
         self, chat_id: typing.Union[str, int], user_id: int, custom_title: str
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.SET_CHAT_ADMINISTRATOR_CUSTOM_TITLE,
-            params=self.build_params(
+            payload=SetChatAdministratorCustomTitlePayload(
                 chat_id=chat_id, user_id=user_id, custom_title=custom_title
             ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def ban_chat_sender_chat(
         self, chat_id: typing.Union[str, int], sender_chat_id: int
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.BAN_CHAT_SENDER_CHAT,
-            params=self.build_params(
+            payload=ChatSenderChatPayload(
                 chat_id=chat_id, sender_chat_id=sender_chat_id
             ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def unban_chat_sender_chat(
         self, chat_id: typing.Union[str, int], sender_chat_id: int
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.UNBAN_CHAT_SENDER_CHAT,
-            params=self.build_params(
+            payload=ChatSenderChatPayload(
                 chat_id=chat_id, sender_chat_id=sender_chat_id
             ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def set_chat_permissions(
         self,
@@ -671,24 +1476,25 @@ class KiranCaller:
         permissions: ChatPermissions,
         use_independent_chat_permissions: typing.Optional[bool] = None,
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.SET_CHAT_PERMISSIONS,
-            params=self.build_params(
+            payload=SetChatPermissionsPayload(
                 chat_id=chat_id,
                 permissions=permissions,
                 use_independent_chat_permissions=use_independent_chat_permissions,
             ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def export_chat_invite_link(
         self, chat_id: typing.Union[str, int]
     ) -> typing.Optional[str]:
-        response = await self._make_request(
+        return await self._make_request(
             method=TelegramMethodName.EXPORT_CHAT_INVITE_LINK,
-            params=self.build_params(chat_id=chat_id),
+            payload=ChatPayload(chat_id=chat_id),
+            result_type=str,
         )
-        return response.json()["result"] if response is not None else None
 
     async def create_chat_invite_link(
         self,
@@ -698,22 +1504,17 @@ class KiranCaller:
         member_limit: typing.Optional[int] = None,
         creates_join_request: typing.Optional[bool] = None,
     ) -> typing.Optional[ChatInviteLink]:
-        response = await self._make_request(
+        return await self._make_request(
             method=TelegramMethodName.CREATE_CHAT_INVITE_LINK,
-            params=self.build_params(
+            payload=CreateChatInviteLinkPayload(
                 chat_id=chat_id,
                 name=name,
                 expire_date=expire_date,
                 member_limit=member_limit,
                 creates_join_request=creates_join_request,
             ),
+            result_type=ChatInviteLink,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response), type=ChatInviteLink, strict=False
-            )
-        else:
-            return None
 
     async def edit_chat_invite_link(
         self,
@@ -723,88 +1524,91 @@ class KiranCaller:
         member_limit: typing.Optional[int] = None,
         creates_join_request: typing.Optional[bool] = None,
     ) -> typing.Optional[ChatInviteLink]:
-        response = await self._make_request(
+        return await self._make_request(
             method=TelegramMethodName.EDIT_CHAT_INVITE_LINK,
-            params=self.build_params(
+            payload=EditChatInviteLinkPayload(
                 chat_id=chat_id,
                 invite_link=invite_link,
                 expire_date=expire_date,
                 member_limit=member_limit,
                 creates_join_request=creates_join_request,
             ),
+            result_type=ChatInviteLink,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response), type=ChatInviteLink, strict=False
-            )
-        else:
-            return None
 
     async def revoke_chat_invite_link(
         self, chat_id: typing.Union[str, int], invite_link: str
     ) -> typing.Optional[ChatInviteLink]:
-        response = await self._make_request(
+        return await self._make_request(
             method=TelegramMethodName.REVOKE_CHAT_INVITE_LINK,
-            params=self.build_params(chat_id=chat_id, invite_link=invite_link),
+            payload=RevokeChatInviteLinkPayload(
+                chat_id=chat_id, invite_link=invite_link
+            ),
+            result_type=ChatInviteLink,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response), type=ChatInviteLink, strict=False
-            )
-        else:
-            return None
 
     async def approve_chat_join_request(
         self, chat_id: typing.Union[str, int], user_id: int
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.APPROVE_CHAT_JOIN_REQUEST,
-            params=self.build_params(chat_id=chat_id, user_id=user_id),
+            payload=ChatUserPayload(chat_id=chat_id, user_id=user_id),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def decline_chat_join_request(
         self, chat_id: typing.Union[str, int], user_id: int
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.DECLINE_CHAT_JOIN_REQUEST,
-            params=self.build_params(chat_id=chat_id, user_id=user_id),
+            payload=ChatUserPayload(chat_id=chat_id, user_id=user_id),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def set_chat_photo(
-        self, chat_id: typing.Union[str, int], photo: typing.BinaryIO
+        self,
+        chat_id: typing.Union[str, int],
+        photo: typing.Union[InputFile, pathlib.Path, typing.BinaryIO],
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.SET_CHAT_PHOTO,
-            params=self.build_params(chat_id=chat_id, photo=photo),
+            payload=SetChatPhotoPayload(chat_id=chat_id),
+            files=self._uploads(photo=photo),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def delete_chat_photo(self, chat_id: typing.Union[str, int]) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.DELETE_CHAT_PHOTO,
-            params=self.build_params(chat_id=chat_id),
+            payload=ChatPayload(chat_id=chat_id),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def set_chat_title(
         self, chat_id: typing.Union[str, int], title: str
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.SET_CHAT_TITLE,
-            params=self.build_params(chat_id=chat_id, title=title),
+            payload=SetChatTitlePayload(chat_id=chat_id, title=title),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def set_chat_description(
         self, chat_id: typing.Union[str, int], description: str
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.SET_CHAT_DESCRIPTION,
-            params=self.build_params(chat_id=chat_id, description=description),
+            payload=SetChatDescriptionPayload(
+                chat_id=chat_id, description=description
+            ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def pin_chat_message(
         self,
@@ -812,54 +1616,55 @@ class KiranCaller:
         message_id: int,
         disable_notification: typing.Optional[bool] = None,
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.PIN_CHAT_MESSAGE,
-            params=self.build_params(
+            payload=PinChatMessagePayload(
                 chat_id=chat_id,
                 message_id=message_id,
                 disable_notification=disable_notification,
             ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def unpin_chat_message(
         self, chat_id: typing.Union[str, int], message_id: int
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.UNPIN_CHAT_MESSAGE,
-            params=self.build_params(chat_id=chat_id, message_id=message_id),
+            payload=UnpinChatMessagePayload(
+                chat_id=chat_id, message_id=message_id
+            ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def unpin_all_chat_messages(
         self, chat_id: typing.Union[str, int]
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.UNPIN_ALL_CHAT_MESSAGES,
-            params=self.build_params(chat_id=chat_id),
+            payload=ChatPayload(chat_id=chat_id),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def leave_chat(self, chat_id: typing.Union[str, int]) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.LEAVE_CHAT,
-            params=self.build_params(chat_id=chat_id),
+            payload=ChatPayload(chat_id=chat_id),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
+        return result is True
 
     async def get_chat(
         self, chat_id: typing.Union[str, int]
     ) -> typing.Optional[ChatFullInfo]:
-        response = await self._make_request(
+        return await self._make_request(
             method=TelegramMethodName.GET_CHAT,
-            params=self.build_params(chat_id=chat_id),
+            payload=ChatPayload(chat_id=chat_id),
+            result_type=ChatFullInfo,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response), type=ChatFullInfo, strict=False
-            )
-        else:
-            return None
 
     async def get_chat_administrators(
         self, chat_id: typing.Union[str, int]
@@ -875,36 +1680,28 @@ class KiranCaller:
             ]
         ]
     ]:
-        response = await self._make_request(
+        return await self._make_request(
             method=TelegramMethodName.GET_CHAT_ADMINISTRATORS,
-            params=self.build_params(chat_id=chat_id),
+            payload=ChatPayload(chat_id=chat_id),
+            result_type=typing.Sequence[
+                typing.Union[
+                    ChatMemberRestricted,
+                    ChatMemberAdministrator,
+                    ChatMemberMember,
+                    ChatMemberLeft,
+                    ChatMemberBanned,
+                    ChatMemberOwner,
+                ]
+            ],
         )
-        if response is not None:
-            print(self._get_bytes(response))
-            return msgspec.json.decode(
-                self._get_bytes(response),
-                type=typing.Sequence[
-                    typing.Union[
-                        ChatMemberRestricted,
-                        ChatMemberAdministrator,
-                        ChatMemberMember,
-                        ChatMemberLeft,
-                        ChatMemberBanned,
-                        ChatMemberOwner,
-                    ]
-                ],
-                strict=False,
-            )
-        else:
-            return None
 
     async def send_document(
         self,
         chat_id: typing.Union[str, int],
-        document: typing.Union[typing.BinaryIO, str],
+        document: Upload,
         business_connection_id: typing.Optional[str] = None,
         message_thread_id: typing.Optional[int] = None,
-        thumbnail: typing.Optional[typing.Union[typing.BinaryIO, str]] = None,
+        thumbnail: typing.Optional[Upload] = None,
         caption: typing.Optional[str] = None,
         caption_entities: typing.Optional[
             typing.Sequence[MessageEntity]
@@ -923,10 +1720,11 @@ class KiranCaller:
                 ForceReply,
             ]
         ] = None,
+        idempotency_key: typing.Optional[str] = None,
     ) -> typing.Optional[Message]:
-        response = await self._make_post(
+        return await self._make_request(
             method=TelegramMethodName.SEND_DOCUMENT,
-            data=self.build_params(
+            payload=SendDocumentPayload(
                 business_connection_id=business_connection_id,
                 message_thread_id=message_thread_id,
                 chat_id=chat_id,
@@ -939,20 +1737,18 @@ class KiranCaller:
                 message_effect_id=message_effect_id,
                 reply_to_message_id=reply_to_message_id,
                 reply_markup=reply_markup,
+                document=self._file_reference(document),
+                thumbnail=self._file_reference(thumbnail),
             ),
-            file=self.build_params(document=document, thumbnail=thumbnail),
+            files=self._uploads(document=document, thumbnail=thumbnail),
+            result_type=Message,
+            idempotency_key=idempotency_key,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response), type=Message, strict=False
-            )
-        else:
-            return None
 
     async def send_photo(
         self,
         chat_id: typing.Union[str, int],
-        photo: typing.Union[typing.BinaryIO, str],
+        photo: Upload,
         business_connection_id: typing.Optional[str] = None,
         message_thread_id: typing.Optional[int] = None,
         caption: typing.Optional[str] = None,
@@ -974,10 +1770,11 @@ class KiranCaller:
                 ForceReply,
             ]
         ] = None,
+        idempotency_key: typing.Optional[str] = None,
     ) -> typing.Optional[Message]:
-        response = await self._make_post(
+        return await self._make_request(
             method=TelegramMethodName.SEND_PHOTO,
-            data=self.build_params(
+            payload=SendPhotoPayload(
                 business_connection_id=business_connection_id,
                 message_thread_id=message_thread_id,
                 chat_id=chat_id,
@@ -991,20 +1788,17 @@ class KiranCaller:
                 message_effect_id=message_effect_id,
                 reply_to_message_id=reply_to_message_id,
                 reply_markup=reply_markup,
+                photo=self._file_reference(photo),
             ),
-            file=self.build_params(photo=photo),
+            files=self._uploads(photo=photo),
+            result_type=Message,
+            idempotency_key=idempotency_key,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response), type=Message, strict=False
-            )
-        else:
-            return None
 
     async def send_audio(
         self,
         chat_id: typing.Union[str, int],
-        audio: typing.Union[typing.BinaryIO, str],
+        audio: Upload,
         business_connection_id: typing.Optional[str] = None,
         message_thread_id: typing.Optional[int] = None,
         caption: typing.Optional[str] = None,
@@ -1015,7 +1809,7 @@ class KiranCaller:
         duration: typing.Optional[int] = None,
         performer: typing.Optional[str] = None,
         title: typing.Optional[str] = None,
-        thumbnail: typing.Optional[typing.Union[typing.BinaryIO, str]] = None,
+        thumbnail: typing.Optional[Upload] = None,
         disable_notification: typing.Optional[bool] = None,
         protect_content: typing.Optional[bool] = None,
         message_effect_id: typing.Optional[str] = None,
@@ -1028,10 +1822,11 @@ class KiranCaller:
                 ForceReply,
             ]
         ] = None,
+        idempotency_key: typing.Optional[str] = None,
     ) -> typing.Optional[Message]:
-        response = await self._make_post(
+        return await self._make_request(
             method=TelegramMethodName.SEND_AUDIO,
-            data=self.build_params(
+            payload=SendAudioPayload(
                 business_connection_id=business_connection_id,
                 message_thread_id=message_thread_id,
                 chat_id=chat_id,
@@ -1046,26 +1841,24 @@ class KiranCaller:
                 message_effect_id=message_effect_id,
                 reply_to_message_id=reply_to_message_id,
                 reply_markup=reply_markup,
+                audio=self._file_reference(audio),
+                thumbnail=self._file_reference(thumbnail),
             ),
-            file=self.build_params(audio=audio, thumbnail=thumbnail),
+            files=self._uploads(audio=audio, thumbnail=thumbnail),
+            result_type=Message,
+            idempotency_key=idempotency_key,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response), type=Message, strict=False
-            )
-        else:
-            return None
 
     async def send_video(
         self,
         chat_id: typing.Union[str, int],
-        video: typing.Union[typing.BinaryIO, str],
+        video: Upload,
         business_connection_id: typing.Optional[str] = None,
         message_thread_id: typing.Optional[int] = None,
         duration: typing.Optional[int] = None,
         width: typing.Optional[int] = None,
         height: typing.Optional[int] = None,
-        thumbnail: typing.Optional[typing.Union[typing.BinaryIO, str]] = None,
+        thumbnail: typing.Optional[Upload] = None,
         caption: typing.Optional[str] = None,
         parse_mode: typing.Optional[str] = None,
         caption_entities: typing.Optional[
@@ -1086,10 +1879,11 @@ class KiranCaller:
                 ForceReply,
             ]
         ] = None,
+        idempotency_key: typing.Optional[str] = None,
     ) -> typing.Optional[Message]:
-        response = await self._make_post(
+        return await self._make_request(
             method=TelegramMethodName.SEND_VIDEO,
-            data=self.build_params(
+            payload=SendVideoPayload(
                 business_connection_id=business_connection_id,
                 message_thread_id=message_thread_id,
                 chat_id=chat_id,
@@ -1107,26 +1901,24 @@ class KiranCaller:
                 message_effect_id=message_effect_id,
                 reply_to_message_id=reply_to_message_id,
                 reply_markup=reply_markup,
+                video=self._file_reference(video),
+                thumbnail=self._file_reference(thumbnail),
             ),
-            file=self.build_params(video=video, thumbnail=thumbnail),
+            files=self._uploads(video=video, thumbnail=thumbnail),
+            result_type=Message,
+            idempotency_key=idempotency_key,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response), type=Message, strict=False
-            )
-        else:
-            return None
 
     async def send_animation(
         self,
         chat_id: typing.Union[str, int],
-        animation: typing.Union[typing.BinaryIO, str],
+        animation: Upload,
         business_connection_id: typing.Optional[str] = None,
         message_thread_id: typing.Optional[int] = None,
         duration: typing.Optional[int] = None,
         width: typing.Optional[int] = None,
         height: typing.Optional[int] = None,
-        thumbnail: typing.Optional[typing.Union[typing.BinaryIO, str]] = None,
+        thumbnail: typing.Optional[Upload] = None,
         caption: typing.Optional[str] = None,
         parse_mode: typing.Optional[str] = None,
         caption_entities: typing.Optional[
@@ -1146,10 +1938,11 @@ class KiranCaller:
                 ForceReply,
             ]
         ] = None,
+        idempotency_key: typing.Optional[str] = None,
     ) -> typing.Optional[Message]:
-        response = await self._make_post(
+        return await self._make_request(
             method=TelegramMethodName.SEND_ANIMATION,
-            data=self.build_params(
+            payload=SendAnimationPayload(
                 business_connection_id=business_connection_id,
                 message_thread_id=message_thread_id,
                 chat_id=chat_id,
@@ -1166,20 +1959,18 @@ class KiranCaller:
                 message_effect_id=message_effect_id,
                 reply_to_message_id=reply_to_message_id,
                 reply_markup=reply_markup,
+                animation=self._file_reference(animation),
+                thumbnail=self._file_reference(thumbnail),
             ),
-            file=self.build_params(animation=animation, thumbnail=thumbnail),
+            files=self._uploads(animation=animation, thumbnail=thumbnail),
+            result_type=Message,
+            idempotency_key=idempotency_key,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response), type=Message, strict=False
-            )
-        else:
-            return None
 
     async def send_voice(
         self,
         chat_id: typing.Union[str, int],
-        voice: typing.Union[typing.BinaryIO, str],
+        voice: Upload,
         business_connection_id: typing.Optional[str] = None,
         message_thread_id: typing.Optional[int] = None,
         caption: typing.Optional[str] = None,
@@ -1200,10 +1991,11 @@ class KiranCaller:
                 ForceReply,
             ]
         ] = None,
+        idempotency_key: typing.Optional[str] = None,
     ) -> typing.Optional[Message]:
-        response = await self._make_post(
+        return await self._make_request(
             method=TelegramMethodName.SEND_VOICE,
-            data=self.build_params(
+            payload=SendVoicePayload(
                 business_connection_id=business_connection_id,
                 message_thread_id=message_thread_id,
                 chat_id=chat_id,
@@ -1216,25 +2008,22 @@ class KiranCaller:
                 message_effect_id=message_effect_id,
                 reply_to_message_id=reply_to_message_id,
                 reply_markup=reply_markup,
+                voice=self._file_reference(voice),
             ),
-            file=self.build_params(voice=voice),
+            files=self._uploads(voice=voice),
+            result_type=Message,
+            idempotency_key=idempotency_key,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response), type=Message, strict=False
-            )
-        else:
-            return None
 
     async def send_video_note(
         self,
         chat_id: typing.Union[str, int],
-        video_note: typing.Union[typing.BinaryIO, str],
+        video_note: Upload,
         business_connection_id: typing.Optional[str] = None,
         message_thread_id: typing.Optional[int] = None,
         duration: typing.Optional[int] = None,
         length: typing.Optional[int] = None,
-        thumbnail: typing.Optional[typing.Union[typing.BinaryIO, str]] = None,
+        thumbnail: typing.Optional[Upload] = None,
         disable_notification: typing.Optional[bool] = None,
         protect_content: typing.Optional[bool] = None,
         message_effect_id: typing.Optional[str] = None,
@@ -1247,10 +2036,11 @@ class KiranCaller:
                 ForceReply,
             ]
         ] = None,
+        idempotency_key: typing.Optional[str] = None,
     ) -> typing.Optional[Message]:
-        response = await self._make_post(
+        return await self._make_request(
             method=TelegramMethodName.SEND_VIDEO_NOTE,
-            data=self.build_params(
+            payload=SendVideoNotePayload(
                 business_connection_id=business_connection_id,
                 message_thread_id=message_thread_id,
                 chat_id=chat_id,
@@ -1261,15 +2051,13 @@ class KiranCaller:
                 message_effect_id=message_effect_id,
                 reply_to_message_id=reply_to_message_id,
                 reply_markup=reply_markup,
+                video_note=self._file_reference(video_note),
+                thumbnail=self._file_reference(thumbnail),
             ),
-            file=self.build_params(video_note=video_note, thumbnail=thumbnail),
+            files=self._uploads(video_note=video_note, thumbnail=thumbnail),
+            result_type=Message,
+            idempotency_key=idempotency_key,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response), type=Message, strict=False
-            )
-        else:
-            return None
 
     async def send_dice(
         self,
@@ -1289,10 +2077,11 @@ class KiranCaller:
                 ForceReply,
             ]
         ] = None,
+        idempotency_key: typing.Optional[str] = None,
     ) -> typing.Optional[Message]:
-        response = await self._make_post(
+        return await self._make_request(
             method=TelegramMethodName.SEND_DICE,
-            data=self.build_params(
+            payload=SendDicePayload(
                 business_connection_id=business_connection_id,
                 message_thread_id=message_thread_id,
                 chat_id=chat_id,
@@ -1303,13 +2092,126 @@ class KiranCaller:
                 reply_to_message_id=reply_to_message_id,
                 reply_markup=reply_markup,
             ),
+            result_type=Message,
+            idempotency_key=idempotency_key,
+        )
+
+    async def send_media_group(
+        self,
+        chat_id: typing.Union[str, int],
+        media: typing.Sequence[InputMedia],
+        business_connection_id: typing.Optional[str] = None,
+        message_thread_id: typing.Optional[int] = None,
+        disable_notification: typing.Optional[bool] = None,
+        protect_content: typing.Optional[bool] = None,
+        message_effect_id: typing.Optional[str] = None,
+        reply_to_message_id: typing.Optional[int] = None,
+        idempotency_key: typing.Optional[str] = None,
+    ) -> typing.List[Message]:
+        """
+        Send 2 to 10 photos, videos, audios or documents as an album.
+
+        The files to upload are streamed as attachments of a single
+        multipart request, and the album takes a single rate limit token.
+
+        Parameters
+        ----------
+        chat_id : typing.Union[str, int]
+            The chat to send the album to.
+        media : typing.Sequence[InputMedia]
+            The items of the album. Documents and audios can only be grouped
+            with items of the same type.
+        business_connection_id : typing.Optional[str]
+            The business connection the album is sent on behalf of.
+        message_thread_id : typing.Optional[int]
+            The forum topic to send the album to.
+        disable_notification : typing.Optional[bool]
+            Whether to send the album silently.
+        protect_content : typing.Optional[bool]
+            Whether to protect the album from forwarding and saving.
+        message_effect_id : typing.Optional[str]
+            The effect added to the album.
+        reply_to_message_id : typing.Optional[int]
+            The message the album replies to.
+        idempotency_key : typing.Optional[str]
+            Identifies the album among the sends to the chat, an album sent
+            again with the same key is not duplicated, see `SendLedger`. If
+            the send failed after it may have reached Telegram, sending it
+            again with the key raises `KiranAmbiguousSendError` until the
+            key is forgotten, as Telegram can not be asked whether it
+            arrived.
+
+        Returns
+        -------
+        typing.List[Message]
+            The messages of the album, in the order of the items.
+        """
+        if not 2 <= len(media) <= MAX_MEDIA_GROUP_SIZE:
+            raise KiranValueError(
+                message=f"A media group holds 2 to {MAX_MEDIA_GROUP_SIZE} items, not {len(media)}.",
+                client=self.client,
+            )
+        items, files = self._attach_media(media)
+        return await self._make_request(
+            method=TelegramMethodName.SEND_MEDIA_GROUP,
+            payload=SendMediaGroupPayload(
+                chat_id=chat_id,
+                media=items,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                message_effect_id=message_effect_id,
+                reply_to_message_id=reply_to_message_id,
+            ),
+            files=files,
+            result_type=typing.List[Message],
+            idempotency_key=idempotency_key,
         )
-        if response is not None:
-            return msgspec.json.decode(
-                self._get_bytes(response), type=Message, strict=False
+
+    def _attach_media(
+        self, media: typing.Sequence[InputMedia]
+    ) -> typing.Tuple[typing.List[InputMedia], typing.Dict[str, InputFile]]:
+        items: typing.List[InputMedia] = []
+        files: typing.Dict[str, InputFile] = {}
+        for index, item in enumerate(media):
+            attached: typing.Dict[str, str] = {}
+            for field, prefix in (("media", "file"), ("thumbnail", "thumb")):
+                upload = getattr(item, field, None)
+                if upload is None or isinstance(upload, str):
+                    continue
+                uri = self._local_uri(upload)
+                if uri is not None:
+                    attached[field] = uri
+                    continue
+                name = f"{prefix}{index}"
+                files.update(self._uploads(**{name: upload}))
+                attached[field] = f"attach://{name}"
+            items.append(
+                msgspec.structs.replace(item, **attached) if attached else item
             )
-        else:
-            return None
+        return items, files
+
+    async def answer_callback_query(
+        self,
+        callback_query_id: str,
+        text: typing.Optional[str] = None,
+        show_alert: typing.Optional[bool] = None,
+        url: typing.Optional[str] = None,
+        cache_time: typing.Optional[int] = None,
+    ) -> bool:
+        result = await self._make_request(
+            method=TelegramMethodName.ANSWER_CALLBACK_QUERY,
+            payload=AnswerCallbackQueryPayload(
+                callback_query_id=callback_query_id,
+                text=text,
+                show_alert=show_alert,
+                url=url,
+                cache_time=cache_time,
+            ),
+            result_type=bool,
+        )
+        return result is True
 
     async def set_commands(
         self,
@@ -1321,21 +2223,27 @@ class KiranCaller:
             typing.Union[str, LanguageCode]
         ] = None,
     ) -> bool:
-        response = await self._make_request(
+        result = await self._make_request(
             method=TelegramMethodName.SET_MY_COMMANDS,
-            params=self.build_params(
+            payload=SetMyCommandsPayload(
                 commands=bot_commands,
                 scope=command_scope,
                 language_code=language_code_iso,
             ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
-        
-    async def delete_command(self, scope: BotCommandScope, language_code: typing.Union[LanguageCode, str])->bool:
-        response = await self._make_request(
+        return result is True
+
+    async def delete_command(
+        self,
+        scope: BotCommandScope,
+        language_code: typing.Optional[typing.Union[LanguageCode, str]] = None,
+    ) -> bool:
+        result = await self._make_request(
             method=TelegramMethodName.DELETE_MY_COMMANDS,
-            params=self.build_params(scope=scope, language_code=language_code),
+            payload=DeleteMyCommandsPayload(
+                scope=scope, language_code=language_code
+            ),
+            result_type=bool,
         )
-        return response.json()["result"] if response is not None else False
-
-        
+        return result is True
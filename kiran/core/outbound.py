@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import contextvars
+import typing
+
+from .enums import Priority
+
+DEFAULT_WEIGHTS: typing.Final = {
+    Priority.INTERACTIVE: 16.0,
+    Priority.NORMAL: 4.0,
+    Priority.BULK: 1.0,
+}
+"""Share of the outbound slots each priority class gets while they compete."""
+
+_RANKS: typing.Final = {level: rank for rank, level in enumerate(Priority)}
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "kiran_priority", default=Priority.NORMAL
+)
+
+
+@contextlib.contextmanager
+def priority(level: Priority) -> typing.Iterator[Priority]:
+    """
+    Set the priority class of the method calls made within a block.
+
+    The class applies to every call made by the caller within the block,
+    including in the tasks it starts. Handlers of updates run as
+    `Priority.INTERACTIVE` and broadcasts as `Priority.BULK`, other calls
+    are `Priority.NORMAL` unless set otherwise.
+
+    Parameters
+    ----------
+    level : Priority
+        The priority class of the calls.
+
+    Yields
+    ------
+    Priority
+        The priority class of the calls.
+    """
+    token = _priority.set(level)
+    try:
+        yield level
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    """
+    Get the priority class of the calls made now.
+
+    Returns
+    -------
+    Priority
+        The class set by the innermost `priority` block, NORMAL outside any.
+    """
+    return _priority.get()
+
+
+def raise_priority(context: contextvars.Context, level: Priority) -> None:
+    """
+    Raise the priority class of the calls made in a context.
+
+    Parameters
+    ----------
+    context : contextvars.Context
+        The context, which must not be running.
+    level : Priority
+        The class given to the calls of the context, if it is higher than
+        the one they have.
+    """
+    if _RANKS[level] < _RANKS[context.run(_priority.get)]:
+        context.run(_priority.set, level)
+
+
+class OutboundQueue:
+    """
+    Shares the outbound capacity of the bot between priority classes.
+
+    At most `max_in_flight` method calls are sent at once, so the
+    connection pool is never filled by a single class. A slot is only held
+    while the request is sent: calls wait for the rate limiter and for a
+    transfer slot before queueing, so a call held back by the limits of its
+    chat never delays the calls to other chats. Calls beyond that wait in a
+    queue per class and are let through by start-time fair queueing: while
+    classes compete, each gets slots in proportion to its weight, and a
+    class alone gets every slot. Bulk calls also never hold more than
+    `bulk_share` of the slots, so interactive replies find a free slot.
+
+    Parameters
+    ----------
+    max_in_flight : int
+        Most calls sent at once, default is 16.
+    weights : typing.Optional[typing.Mapping[Priority, float]]
+        Weight of each class, defaults to 16 for interactive calls, 4 for
+        normal calls and 1 for bulk calls.
+    bulk_share : float
+        Fraction of the slots bulk calls can hold, default is a quarter.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 16,
+        weights: typing.Optional[typing.Mapping[Priority, float]] = None,
+        bulk_share: float = 0.25,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("An outbound queue needs at least one slot.")
+        self.max_in_flight = max_in_flight
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.max_bulk = max(1, int(max_in_flight * bulk_share))
+        self._queues: typing.Dict[
+            Priority,
+            typing.Deque[typing.Tuple[float, asyncio.Future[None]]],
+        ] = {level: collections.deque() for level in Priority}
+        self._finish = dict.fromkeys(Priority, 0.0)
+        self._virtual_time = 0.0
+        self.in_flight = dict.fromkeys(Priority, 0)
+        """Number of calls sent, by class."""
+        self.admitted = dict.fromkeys(Priority, 0)
+        """Number of calls let through, by class."""
+
+    def __repr__(self) -> str:
+        in_flight = {
+            level.value: count for level, count in self.in_flight.items()
+        }
+        return f"OutboundQueue(max_in_flight={self.max_in_flight}, in_flight={in_flight}, waiting={self.waiting})"
+
+    @property
+    def waiting(self) -> int:
+        """Number of calls waiting for a slot."""
+        return sum(
+            not future.cancelled()
+            for queue in self._queues.values()
+            for _, future in queue
+        )
+
+    def _admissible(self, level: Priority) -> bool:
+        if sum(self.in_flight.values()) >= self.max_in_flight:
+            return False
+        return level is not Priority.BULK or (
+            self.in_flight[Priority.BULK] < self.max_bulk
+        )
+
+    def _next(self) -> typing.Optional[Priority]:
+        chosen: typing.Optional[Priority] = None
+        for level, queue in self._queues.items():
+            while queue and queue[0][1].cancelled():
+                queue.popleft()
+            if not queue or not self._admissible(level):
+                continue
+            if chosen is None or queue[0][0] < self._queues[chosen][0][0]:
+                chosen = level
+        return chosen
+
+    def _grant(self) -> None:
+        while (level := self._next()) is not None:
+            tag, future = self._queues[level].popleft()
+            self._virtual_time = max(self._virtual_time, tag)
+            self.in_flight[level] += 1
+            self.admitted[level] += 1
+            future.set_result(None)
+
+    def _release(self, level: Priority) -> None:
+        self.in_flight[level] -= 1
+        self._grant()
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, level: typing.Optional[Priority] = None
+    ) -> typing.AsyncIterator[None]:
+        """
+        Hold a slot to send a call, waiting for the turn of its class.
+
+        Parameters
+        ----------
+        level : typing.Optional[Priority]
+            The class of the call, defaults to the one of the current block.
+        """
+        if level is None:
+            level = current_priority()
+        tag = (
+            max(self._virtual_time, self._finish[level])
+            + 1 / self.weights[level]
+        )
+        self._finish[level] = tag
+        future = asyncio.get_running_loop().create_future()
+        self._queues[level].append((tag, future))
+        self._grant()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release(level)
+            else:
+                future.cancel()
+            raise
+        try:
+            yield
+        finally:
+            self._release(level)
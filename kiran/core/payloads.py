@@ -0,0 +1,500 @@
+from __future__ import annotations
+
+import typing
+
+import msgspec
+
+if typing.TYPE_CHECKING:
+    from ..abc.bots import BotCommand
+    from ..abc.bots import BotCommandScope
+    from ..abc.chats import ChatPermissions
+    from ..abc.dependent import ReplyParameters
+    from ..abc.media import InputMedia
+    from ..abc.messages import MessageEntity
+    from ..abc.misc import LinkPreviewOptions
+    from ..abc.reactions import ReactionTypeCustomEmoji
+    from ..abc.reactions import ReactionTypeEmoji
+    from ..abc.userinterface import ForceReply
+    from ..abc.userinterface import InlineKeyboardMarkup
+    from ..abc.userinterface import ReplyKeyboardMarkup
+    from ..abc.userinterface import ReplyKeyboardRemove
+    from ..components.commands import LanguageCode
+    from ..core.enums import ParseMode
+
+    ReplyMarkup = typing.Union[
+        InlineKeyboardMarkup,
+        ReplyKeyboardMarkup,
+        ReplyKeyboardRemove,
+        ForceReply,
+    ]
+
+
+class Payload(msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    The parameters of a Bot API method.
+
+    Payloads are encoded in one pass into the JSON body of the request. Fields
+    left to their default value are omitted, so Telegram applies its own
+    defaults to them.
+    """
+
+
+class ChatPayload(Payload):
+    """
+    Parameters of the methods only taking a chat, such as `getChat`,
+    `leaveChat`, `deleteChatPhoto` or `exportChatInviteLink`.
+    """
+
+    chat_id: typing.Union[int, str]
+
+
+class ChatUserPayload(Payload):
+    """Parameters of `approveChatJoinRequest` and `declineChatJoinRequest`."""
+
+    chat_id: typing.Union[int, str]
+    user_id: int
+
+
+class ChatSenderChatPayload(Payload):
+    """Parameters of `banChatSenderChat` and `unbanChatSenderChat`."""
+
+    chat_id: typing.Union[int, str]
+    sender_chat_id: int
+
+
+class SendMessagePayload(Payload):
+    """Parameters of `sendMessage`."""
+
+    chat_id: typing.Union[int, str]
+    text: str
+    business_connection_id: typing.Optional[str] = None
+    message_thread_id: typing.Optional[int] = None
+    parse_mode: typing.Optional[ParseMode] = None
+    entities: typing.Optional[typing.List[MessageEntity]] = None
+    link_preview_options: typing.Optional[LinkPreviewOptions] = None
+    disable_notification: typing.Optional[bool] = None
+    protect_content: typing.Optional[bool] = None
+    message_effect_id: typing.Optional[str] = None
+    reply_parameters: typing.Optional[ReplyParameters] = None
+    reply_markup: typing.Optional[ReplyMarkup] = None
+
+
+class ForwardMessagePayload(Payload):
+    """Parameters of `forwardMessage`."""
+
+    chat_id: typing.Union[int, str]
+    from_chat_id: typing.Union[int, str]
+    message_id: int
+    message_thread_id: typing.Optional[int] = None
+    disable_notification: typing.Optional[bool] = None
+    protect_content: typing.Optional[bool] = None
+
+
+class ForwardMessagesPayload(Payload):
+    """Parameters of `forwardMessages`."""
+
+    chat_id: typing.Union[int, str]
+    from_chat_id: typing.Union[int, str]
+    message_ids: typing.List[int]
+    message_thread_id: typing.Optional[int] = None
+    disable_notification: typing.Optional[bool] = None
+    protect_content: typing.Optional[bool] = None
+
+
+class CopyMessagePayload(Payload):
+    """Parameters of `copyMessage`."""
+
+    chat_id: typing.Union[int, str]
+    from_chat_id: typing.Union[int, str]
+    message_id: int
+    message_thread_id: typing.Optional[int] = None
+    caption: typing.Optional[str] = None
+    parse_mode: typing.Optional[ParseMode] = None
+    caption_entities: typing.Optional[typing.List[MessageEntity]] = None
+    show_caption_above_media: typing.Optional[bool] = None
+    disable_notification: typing.Optional[bool] = None
+    protect_content: typing.Optional[bool] = None
+    reply_parameters: typing.Optional[ReplyParameters] = None
+    reply_markup: typing.Optional[ReplyMarkup] = None
+
+
+class CopyMessagesPayload(Payload):
+    """Parameters of `copyMessages`."""
+
+    chat_id: typing.Union[int, str]
+    from_chat_id: typing.Union[int, str]
+    message_ids: typing.List[int]
+    message_thread_id: typing.Optional[int] = None
+    disable_notification: typing.Optional[bool] = None
+    protect_content: typing.Optional[bool] = None
+    remove_caption: typing.Optional[bool] = None
+
+
+class DeleteMessagesPayload(Payload):
+    """Parameters of `deleteMessages`."""
+
+    chat_id: typing.Union[int, str]
+    message_ids: typing.List[int]
+
+
+class SetMessageReactionPayload(Payload):
+    """Parameters of `setMessageReaction`."""
+
+    chat_id: typing.Union[int, str]
+    message_id: typing.Optional[int] = None
+    reaction: typing.Optional[
+        typing.List[typing.Union[ReactionTypeCustomEmoji, ReactionTypeEmoji]]
+    ] = None
+    is_big: typing.Optional[bool] = None
+
+
+class GetUserProfilePhotosPayload(Payload):
+    """Parameters of `getUserProfilePhotos`."""
+
+    user_id: int
+    offset: typing.Optional[int] = None
+    limit: typing.Optional[int] = None
+
+
+class GetFilePayload(Payload):
+    """Parameters of `getFile`."""
+
+    file_id: str
+
+
+class BanChatMemberPayload(Payload):
+    """Parameters of `banChatMember`."""
+
+    chat_id: typing.Union[int, str]
+    user_id: int
+    until_date: typing.Optional[int] = None
+    revoke_messages: typing.Optional[bool] = None
+
+
+class UnbanChatMemberPayload(Payload):
+    """Parameters of `unbanChatMember`."""
+
+    chat_id: typing.Union[int, str]
+    user_id: int
+    only_if_banned: typing.Optional[bool] = None
+
+
+class RestrictChatMemberPayload(Payload):
+    """Parameters of `restrictChatMember`."""
+
+    chat_id: typing.Union[int, str]
+    user_id: int
+    permissions: ChatPermissions
+    use_independent_chat_permissions: typing.Optional[bool] = None
+    until_date: typing.Optional[int] = None
+
+
+class PromoteChatMemberPayload(Payload):
+    """Parameters of `promoteChatMember`."""
+
+    chat_id: typing.Union[int, str]
+    user_id: int
+    is_anonymous: typing.Optional[bool] = None
+    can_manage_chat: typing.Optional[bool] = None
+    can_delete_messages: typing.Optional[bool] = None
+    can_manage_video_chats: typing.Optional[bool] = None
+    can_restrict_members: typing.Optional[bool] = None
+    can_promote_members: typing.Optional[bool] = None
+    can_change_info: typing.Optional[bool] = None
+    can_invite_users: typing.Optional[bool] = None
+    can_post_stories: typing.Optional[bool] = None
+    can_edit_stories: typing.Optional[bool] = None
+    can_delete_stories: typing.Optional[bool] = None
+    can_post_messages: typing.Optional[bool] = None
+    can_edit_messages: typing.Optional[bool] = None
+    can_pin_messages: typing.Optional[bool] = None
+    can_manage_topics: typing.Optional[bool] = None
+
+
+class SetChatAdministratorCustomTitlePayload(Payload):
+    """Parameters of `setChatAdministratorCustomTitle`."""
+
+    chat_id: typing.Union[int, str]
+    user_id: int
+    custom_title: str
+
+
+class SetChatPermissionsPayload(Payload):
+    """Parameters of `setChatPermissions`."""
+
+    chat_id: typing.Union[int, str]
+    permissions: ChatPermissions
+    use_independent_chat_permissions: typing.Optional[bool] = None
+
+
+class CreateChatInviteLinkPayload(Payload):
+    """Parameters of `createChatInviteLink`."""
+
+    chat_id: typing.Union[int, str]
+    name: typing.Optional[str] = None
+    expire_date: typing.Optional[int] = None
+    member_limit: typing.Optional[int] = None
+    creates_join_request: typing.Optional[bool] = None
+
+
+class EditChatInviteLinkPayload(Payload):
+    """Parameters of `editChatInviteLink`."""
+
+    chat_id: typing.Union[int, str]
+    invite_link: str
+    expire_date: typing.Optional[int] = None
+    member_limit: typing.Optional[int] = None
+    creates_join_request: typing.Optional[bool] = None
+
+
+class RevokeChatInviteLinkPayload(Payload):
+    """Parameters of `revokeChatInviteLink`."""
+
+    chat_id: typing.Union[int, str]
+    invite_link: str
+
+
+class SetChatTitlePayload(Payload):
+    """Parameters of `setChatTitle`."""
+
+    chat_id: typing.Union[int, str]
+    title: str
+
+
+class SetChatDescriptionPayload(Payload):
+    """Parameters of `setChatDescription`."""
+
+    chat_id: typing.Union[int, str]
+    description: str
+
+
+class PinChatMessagePayload(Payload):
+    """Parameters of `pinChatMessage`."""
+
+    chat_id: typing.Union[int, str]
+    message_id: int
+    disable_notification: typing.Optional[bool] = None
+
+
+class UnpinChatMessagePayload(Payload):
+    """Parameters of `unpinChatMessage`."""
+
+    chat_id: typing.Union[int, str]
+    message_id: typing.Optional[int] = None
+
+
+class AnswerCallbackQueryPayload(Payload):
+    """Parameters of `answerCallbackQuery`."""
+
+    callback_query_id: str
+    text: typing.Optional[str] = None
+    show_alert: typing.Optional[bool] = None
+    url: typing.Optional[str] = None
+    cache_time: typing.Optional[int] = None
+
+
+class SetMyCommandsPayload(Payload):
+    """Parameters of `setMyCommands`."""
+
+    commands: typing.List[BotCommand]
+    scope: typing.Optional[BotCommandScope] = None
+    language_code: typing.Optional[typing.Union[LanguageCode, str]] = None
+
+
+class DeleteMyCommandsPayload(Payload):
+    """Parameters of `deleteMyCommands`."""
+
+    scope: typing.Optional[BotCommandScope] = None
+    language_code: typing.Optional[typing.Union[LanguageCode, str]] = None
+
+
+class SendMediaPayload(Payload):
+    """
+    Parameters shared by the methods sending a single media.
+
+    The media fields of the subclasses hold a file id or an URL. Files which
+    have to be uploaded are sent alongside the payload in a multipart request
+    instead.
+    """
+
+    chat_id: typing.Union[int, str]
+    business_connection_id: typing.Optional[str] = None
+    message_thread_id: typing.Optional[int] = None
+    disable_notification: typing.Optional[bool] = None
+    protect_content: typing.Optional[bool] = None
+    message_effect_id: typing.Optional[str] = None
+    reply_to_message_id: typing.Optional[int] = None
+    reply_markup: typing.Optional[ReplyMarkup] = None
+
+
+class SendDocumentPayload(SendMediaPayload):
+    """Parameters of `sendDocument`."""
+
+    document: typing.Optional[str] = None
+    thumbnail: typing.Optional[str] = None
+    caption: typing.Optional[str] = None
+    parse_mode: typing.Optional[ParseMode] = None
+    caption_entities: typing.Optional[typing.Sequence[MessageEntity]] = None
+    disable_content_type_detection: typing.Optional[bool] = None
+
+
+class SendPhotoPayload(SendMediaPayload):
+    """Parameters of `sendPhoto`."""
+
+    photo: typing.Optional[str] = None
+    caption: typing.Optional[str] = None
+    parse_mode: typing.Optional[ParseMode] = None
+    caption_entities: typing.Optional[typing.Sequence[MessageEntity]] = None
+    show_caption_above_media: typing.Optional[bool] = None
+    has_spoiler: typing.Optional[bool] = None
+
+
+class SendAudioPayload(SendMediaPayload):
+    """Parameters of `sendAudio`."""
+
+    audio: typing.Optional[str] = None
+    thumbnail: typing.Optional[str] = None
+    caption: typing.Optional[str] = None
+    parse_mode: typing.Optional[typing.Union[ParseMode, str]] = None
+    caption_entities: typing.Optional[typing.Sequence[MessageEntity]] = None
+    duration: typing.Optional[int] = None
+    performer: typing.Optional[str] = None
+    title: typing.Optional[str] = None
+
+
+class SendVideoPayload(SendMediaPayload):
+    """Parameters of `sendVideo`."""
+
+    video: typing.Optional[str] = None
+    thumbnail: typing.Optional[str] = None
+    duration: typing.Optional[int] = None
+    width: typing.Optional[int] = None
+    height: typing.Optional[int] = None
+    caption: typing.Optional[str] = None
+    parse_mode: typing.Optional[typing.Union[ParseMode, str]] = None
+    caption_entities: typing.Optional[typing.Sequence[MessageEntity]] = None
+    show_caption_above_media: typing.Optional[bool] = None
+    has_spoiler: typing.Optional[bool] = None
+    supports_streaming: typing.Optional[bool] = None
+
+
+class SendAnimationPayload(SendMediaPayload):
+    """Parameters of `sendAnimation`."""
+
+    animation: typing.Optional[str] = None
+    thumbnail: typing.Optional[str] = None
+    duration: typing.Optional[int] = None
+    width: typing.Optional[int] = None
+    height: typing.Optional[int] = None
+    caption: typing.Optional[str] = None
+    parse_mode: typing.Optional[typing.Union[ParseMode, str]] = None
+    caption_entities: typing.Optional[typing.Sequence[MessageEntity]] = None
+    show_caption_above_media: typing.Optional[bool] = None
+    has_spoiler: typing.Optional[bool] = None
+
+
+class SendVoicePayload(SendMediaPayload):
+    """Parameters of `sendVoice`."""
+
+    voice: typing.Optional[str] = None
+    caption: typing.Optional[str] = None
+    parse_mode: typing.Optional[typing.Union[ParseMode, str]] = None
+    caption_entities: typing.Optional[typing.Sequence[MessageEntity]] = None
+    duration: typing.Optional[int] = None
+
+
+class SendVideoNotePayload(SendMediaPayload):
+    """Parameters of `sendVideoNote`."""
+
+    video_note: typing.Optional[str] = None
+    thumbnail: typing.Optional[str] = None
+    duration: typing.Optional[int] = None
+    length: typing.Optional[int] = None
+
+
+class SendDicePayload(SendMediaPayload):
+    """Parameters of `sendDice`."""
+
+    emoji: typing.Optional[str] = None
+
+
+class SendMediaGroupPayload(Payload):
+    """
+    Parameters of `sendMediaGroup`.
+
+    Files uploaded with the request are referred to as `attach://<name>` in
+    the media items.
+    """
+
+    chat_id: typing.Union[int, str]
+    media: typing.List[InputMedia]
+    business_connection_id: typing.Optional[str] = None
+    message_thread_id: typing.Optional[int] = None
+    disable_notification: typing.Optional[bool] = None
+    protect_content: typing.Optional[bool] = None
+    message_effect_id: typing.Optional[str] = None
+    reply_to_message_id: typing.Optional[int] = None
+
+
+class SetChatPhotoPayload(Payload):
+    """Parameters of `setChatPhoto`, the photo is always uploaded."""
+
+    chat_id: typing.Union[int, str]
+
+
+_CHAT_ID_PLACEHOLDER: typing.Final = "\x00chat_id\x00"
+
+
+class PayloadTemplate:
+    """
+    A payload encoded once, to be sent to many chats.
+
+    The payload is encoded with a placeholder in place of its `chat_id`, and
+    the encoded body is split around it. Rendering the body of a chat then
+    only encodes the chat id and joins three byte strings.
+
+    Parameters
+    ----------
+    payload : Payload
+        The payload to send, its `chat_id` field is ignored.
+    encoder : msgspec.json.Encoder
+        The encoder of the payload.
+    """
+
+    def __init__(self, payload: Payload, encoder: msgspec.json.Encoder) -> None:
+        if "chat_id" not in payload.__struct_fields__:
+            raise ValueError(
+                f"{type(payload).__name__} has no chat_id to substitute."
+            )
+        self.encoder = encoder
+        encoded = encoder.encode(
+            msgspec.structs.replace(payload, chat_id=_CHAT_ID_PLACEHOLDER)
+        )
+        self.prefix, _, self.suffix = encoded.partition(
+            encoder.encode(_CHAT_ID_PLACEHOLDER)
+        )
+
+    def render(self, chat_id: typing.Union[int, str]) -> bytes:
+        """
+        Get the body of the payload sent to a chat.
+
+        Parameters
+        ----------
+        chat_id : typing.Union[int, str]
+            The chat the payload is sent to.
+
+        Returns
+        -------
+        bytes
+            The JSON body of the request.
+        """
+        return b"".join(
+            (self.prefix, self.encoder.encode(chat_id), self.suffix)
+        )
+
+
+class TemplatePayload(Payload):
+    """A `PayloadTemplate` bound to the chat it is sent to."""
+
+    chat_id: typing.Union[int, str]
+    template: PayloadTemplate
@@ -7,10 +7,16 @@ import typing
 
 import msgspec
 
+from ..abc.dependent import CallbackQuery
 from ..abc.dependent import Message
 from ..components.commands import CallableBotCommandDetails
+from ..components.context import CallbackContext
 from ..components.context import CommandContext
+from ..components.context import TriggerContext
 from ..core.enums import MessageEntityType
+from ..core.enums import Priority
+from .albums import AlbumAggregator
+from .outbound import priority
 
 if typing.TYPE_CHECKING:
     from ..impl import KiranBot
@@ -19,6 +25,7 @@ if typing.TYPE_CHECKING:
 class CalledResult(msgspec.Struct):
     update_id: int
     message: typing.Optional[Message] = None
+    callback_query: typing.Optional[CallbackQuery] = None
 
 
 class CallResponse(msgspec.Struct):
@@ -38,13 +45,20 @@ class PollingManager:
     client : KiranBot
         The bot client.
     timeout : typing.Optional[int]
-        The timeout for the polling. Defaults to 100.
+        Seconds Telegram holds a `getUpdates` call open when there is no
+        update. Defaults to the `polling_timeout` of the transport settings
+        of the client.
+    album_window : typing.Optional[float]
+        Seconds to wait for the next message of an album before dispatching
+        it as one `AlbumEvent`, default is 0.5. None handles the messages
+        of albums one by one, like any other message.
     """
 
     def __init__(
         self,
         client: "KiranBot",
-        timeout: int = 999,
+        timeout: typing.Optional[int] = None,
+        album_window: typing.Optional[float] = 0.5,
     ) -> None:
         self.client = client
         self.client.log(
@@ -62,7 +76,7 @@ class PollingManager:
         self.client.log(
             "Polling Manager: Result Binder has been initialized.", "debug"
         )
-        self._session = client.session
+        self._session = client.polling_session
         self.client.log(
             "Polling Manager: Client session has been initialized.", "debug"
         )
@@ -70,7 +84,12 @@ class PollingManager:
         self.client.log(
             "Polling Manager: Start time taken into account.", "debug"
         )
+        if timeout is None:
+            timeout = client.transport_settings.polling_timeout
         self.timeout = timeout
+        self._request_timeout = (
+            client.transport_settings.polling_request_timeout(timeout)
+        )
         self.client.log(
             "Polling Manager: Timeout has been taken into account.", "debug"
         )
@@ -95,6 +114,11 @@ class PollingManager:
         self.client.log(
             "Polling Manager: Common command storage initialized.", "debug"
         )
+        self.album_aggregator = (
+            AlbumAggregator(client, album_window)
+            if album_window is not None
+            else None
+        )
         self.last_event_id: int = 0
         self.client.log(
             "Polling Manager: Last Event ID set to 0, offset taken into account.",
@@ -111,6 +135,25 @@ class PollingManager:
         cmd_name = cmd_name.split("@")[0]
         return cmd_name
 
+    async def _process_update(self, update: CalledResult) -> None:
+        try:
+            with priority(Priority.INTERACTIVE):
+                if update.message is not None and not (
+                    self.album_aggregator is not None
+                    and self.album_aggregator.add(
+                        update.update_id, update.message
+                    )
+                ):
+                    await self._invoke_command(update.message)
+                if update.callback_query is not None:
+                    await self._invoke_callback(update.callback_query)
+        except Exception as e:
+            self.client.log(
+                f"Error while handling update {update.update_id}: {e}",
+                "error",
+            )
+            self.client.log(traceback.format_exc(), "warning")
+
     async def _make_polling_session(
         self,
     ) -> typing.Optional[CallResponse]:
@@ -121,14 +164,14 @@ class PollingManager:
                     "timeout": self.timeout,
                     "offset": self.last_event_id + 1,
                 },
-                timeout=self.timeout,
+                timeout=self._request_timeout,
             )
-            if response.json()["result"] is not None:
+            response_call = self.response_binder.decode(response.read())
+            if response_call.result:
                 self.client.log(
                     f"Polling Response:\n{msgspec.json.format(response.text, indent=4)}",
                     "debug",
                 )
-            response_call = self.response_binder.decode(response.read())
             if response_call.ok is True:
                 updates = response_call.result
                 if updates:  # Check if updates is not empty
@@ -136,8 +179,7 @@ class PollingManager:
                     for update in updates:
                         if update.update_id > max_update_id:
                             max_update_id = update.update_id
-                        if update.message is not None:
-                            await self._invoke_command(update.message)
+                        await self._process_update(update)
                     self.last_event_id = max_update_id  # Update last_event_id after processing all updates
             return response_call
         except Exception as e:
@@ -167,16 +209,74 @@ class PollingManager:
         self._prefix_commands = prefix_commands
         self._common_commands = common_commands
 
+    async def _invoke_triggers(self, obj_msg: Message) -> None:
+        assert obj_msg.text is not None
+        for func in self.client._text_triggers.match(obj_msg.text):
+            await self.client._trigger_handlers[func](
+                TriggerContext(
+                    message=obj_msg,
+                    caller=self.client.caller,
+                    client=self.client,
+                    context_time=datetime.datetime.now(),
+                )
+            )
+
+    async def _invoke_callback(self, query: CallbackQuery) -> None:
+        route = self.client.callback_router.resolve(query.data)
+        context = CallbackContext(
+            query=query,
+            args=route.args if route is not None else (),
+            caller=self.client.caller,
+            client=self.client,
+            context_time=datetime.datetime.now(),
+        )
+        if route is None:
+            self.client.log(
+                f"No callback route for data: {query.data!r}. Acknowledging.",
+                "debug",
+            )
+            await context.answer()
+            return
+        acknowledgement: typing.Optional[asyncio.Task[bool]] = None
+
+        def acknowledge() -> None:
+            nonlocal acknowledgement
+            if not context.answered:
+                acknowledgement = asyncio.ensure_future(context.answer())
+
+        timer = asyncio.get_running_loop().call_later(
+            route.ack_after, acknowledge
+        )
+        try:
+            await self.client._callback_handlers[route.key](context)
+        finally:
+            timer.cancel()
+            if acknowledgement is not None:
+                await acknowledgement
+            elif not context.answered:
+                await context.answer()
+
     async def _invoke_command(self, obj_msg: Message) -> None:
+        if (
+            obj_msg.text is not None
+            and self.client._text_triggers
+            and (
+                obj_msg.entities is None
+                or obj_msg.entities[0].type is not MessageEntityType.BOT_COMMAND
+            )
+        ):
+            await self._invoke_triggers(obj_msg)
         if obj_msg.entities is not None:
             command_pretext = obj_msg.entities[0]
             if command_pretext.type is MessageEntityType.BOT_COMMAND:
                 assert obj_msg.text is not None
-                net_cmds = self._slash_commands | self._common_commands
                 cmd_name = self._extract_command_name(obj_msg.text)
-                for cmd in net_cmds:
-                    if cmd_name == cmd.name:
-                        await net_cmds[cmd](
+                for cmd in self.client._command_routes.get(cmd_name, ()):
+                    handler = self._slash_commands.get(
+                        cmd
+                    ) or self._common_commands.get(cmd)
+                    if handler is not None:
+                        await handler(
                             CommandContext(
                                 name=cmd_name,
                                 description=cmd.description,
@@ -204,8 +304,7 @@ class PollingManager:
                     for update in updates:
                         if update.update_id > self.last_event_id:
                             self.last_event_id = update.update_id
-                            if update.message is not None:
-                                await self._invoke_command(update.message)
+                            await self._process_update(update)
                 await asyncio.sleep(1)
             except Exception as e:
                 self.client.log(
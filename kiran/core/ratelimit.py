@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+
+ChatIdentifier = typing.Union[int, str]
+
+RATE_LIMITED_PREFIXES: typing.Final = ("send", "forward", "copy")
+"""Bot API methods sending messages, which count against the flood limits."""
+
+UNLIMITED_METHODS: typing.Final = frozenset({"sendChatAction"})
+"""Bot API methods matching a limited prefix which send no message."""
+
+
+class TokenBucket:
+    """
+    A token bucket whose rate can be adjusted while in use.
+
+    The bucket is implemented with the virtual scheduling form of the generic
+    cell rate algorithm: instead of counting tokens, it keeps the time the
+    next token is theoretically due, which makes both reserving a token and
+    pausing the bucket a constant time update of a single float.
+
+    Parameters
+    ----------
+    rate : float
+        Tokens added per second, also the maximum rate additive increases go
+        back up to.
+    burst : int
+        Maximum number of tokens the bucket holds, the size of the bursts it
+        lets through.
+    min_rate : typing.Optional[float]
+        The rate multiplicative decreases never go below, defaults to a tenth
+        of `rate`.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: typing.Optional[float] = None,
+    ) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("Token buckets need a positive rate and burst.")
+        self.max_rate = rate
+        self.min_rate = rate / 10 if min_rate is None else min_rate
+        self.rate = rate
+        self.burst = burst
+        self._due = 0.0
+        self._changed = 0.0
+
+    def __repr__(self) -> str:
+        return f"TokenBucket(rate={self.rate:.3f}, max_rate={self.max_rate}, burst={self.burst})"
+
+    def reserve(self, now: float, tokens: float = 1) -> float:
+        """
+        Take tokens, waiting for them if the bucket does not hold enough.
+
+        Parameters
+        ----------
+        now : float
+            The current `time.monotonic` time.
+        tokens : float
+            Number of tokens taken, default is 1.
+
+        Returns
+        -------
+        float
+            Seconds to wait before the tokens may be used.
+        """
+        due = max(self._due, now)
+        self._due = due + tokens / self.rate
+        return max(0.0, due - now - (self.burst - 1) / self.rate)
+
+    def pause(self, seconds: float, now: float) -> None:
+        """
+        Hand out no token for a while, and empty the bucket.
+
+        Parameters
+        ----------
+        seconds : float
+            How long to pause the bucket for.
+        now : float
+            The current `time.monotonic` time.
+        """
+        self._due = max(self._due, now + seconds + (self.burst - 1) / self.rate)
+
+    def idle(self, now: float) -> bool:
+        """
+        Whether the bucket is full again and back to its maximum rate.
+
+        Parameters
+        ----------
+        now : float
+            The current `time.monotonic` time.
+
+        Returns
+        -------
+        bool
+            True if forgetting the bucket changes nothing.
+        """
+        return self._due <= now and self.rate == self.max_rate
+
+    def increase(self, fraction: float, now: float) -> None:
+        """
+        Additively increase the rate, in proportion to the time elapsed.
+
+        Parameters
+        ----------
+        fraction : float
+            Fraction of the maximum rate regained per second since the rate
+            last changed.
+        now : float
+            The current `time.monotonic` time.
+        """
+        if self.rate < self.max_rate:
+            self.rate = min(
+                self.max_rate,
+                self.rate + self.max_rate * fraction * (now - self._changed),
+            )
+        self._changed = now
+
+    def decrease(self, factor: float, now: float) -> None:
+        """
+        Multiplicatively decrease the rate.
+
+        Parameters
+        ----------
+        factor : float
+            The factor applied to the rate, between 0 and 1.
+        now : float
+            The current `time.monotonic` time.
+        """
+        self.rate = max(self.min_rate, self.rate * factor)
+        self._changed = now
+
+
+class RateLimiter:
+    """
+    Paces outbound messages to stay within the flood limits of Telegram.
+
+    Every message goes through up to three token buckets: one shared by all
+    chats, one per chat and, for groups and channels, one per group with a
+    per-minute rate. The rates adapt to the 429 responses of Telegram in an
+    additive increase, multiplicative decrease way: a flood wait halves the
+    rates of the buckets involved and pauses the chat for `retry_after`
+    seconds, then each successful message raises them back towards their
+    maximum.
+
+    Chats are told apart from groups by their identifier, negative ids and
+    usernames being considered groups.
+
+    Parameters
+    ----------
+    global_rate : float
+        Messages per second over all chats, default is 30.
+    global_burst : int
+        Messages sent at once over all chats before pacing starts, default is 30.
+    chat_rate : float
+        Messages per second to a single chat, default is 1.
+    chat_burst : int
+        Messages sent at once to a single chat, default is 1.
+    group_rate : float
+        Messages per minute to a single group, default is 20.
+    group_burst : int
+        Messages sent at once to a single group, default is 1.
+    decrease_factor : float
+        Factor applied to the rates on a flood wait, default is 0.5.
+    increase_rate : float
+        Fraction of the maximum rate regained per second of successful
+        messages, default is 0.05, recovering from a halved rate in 10 seconds.
+    """
+
+    def __init__(
+        self,
+        global_rate: float = 30.0,
+        global_burst: int = 30,
+        chat_rate: float = 1.0,
+        chat_burst: int = 1,
+        group_rate: float = 20.0,
+        group_burst: int = 1,
+        decrease_factor: float = 0.5,
+        increase_rate: float = 0.05,
+    ) -> None:
+        self.global_bucket = TokenBucket(global_rate, global_burst)
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.group_rate = group_rate / 60
+        self.group_burst = group_burst
+        self.decrease_factor = decrease_factor
+        self.increase_rate = increase_rate
+        self.floods = 0
+        self._chat_buckets: typing.Dict[ChatIdentifier, TokenBucket] = {}
+        self._group_buckets: typing.Dict[ChatIdentifier, TokenBucket] = {}
+        self._reservations = 0
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(global={self.global_bucket!r}, chats={len(self._chat_buckets)}, groups={len(self._group_buckets)}, floods={self.floods})"
+
+    @staticmethod
+    def limits(method: str) -> bool:
+        """
+        Whether a Bot API method is paced by the limiter.
+
+        Parameters
+        ----------
+        method : str
+            The name of the method.
+
+        Returns
+        -------
+        bool
+            True for the methods sending messages, chat actions such as the
+            typing indicator excluded.
+        """
+        return (
+            method.startswith(RATE_LIMITED_PREFIXES)
+            and method not in UNLIMITED_METHODS
+        )
+
+    @staticmethod
+    def is_group(chat_id: ChatIdentifier) -> bool:
+        """
+        Whether a chat identifier designates a group or a channel.
+
+        Parameters
+        ----------
+        chat_id : ChatIdentifier
+            The id or username of the chat.
+
+        Returns
+        -------
+        bool
+            True for negative ids and usernames.
+        """
+        return isinstance(chat_id, str) or chat_id < 0
+
+    def _buckets(self, chat_id: ChatIdentifier) -> typing.List[TokenBucket]:
+        buckets = [self._chat_bucket(chat_id)]
+        if self.is_group(chat_id):
+            bucket = self._group_buckets.get(chat_id)
+            if bucket is None:
+                bucket = TokenBucket(self.group_rate, self.group_burst)
+                self._group_buckets[chat_id] = bucket
+            buckets.append(bucket)
+        return buckets
+
+    def _chat_bucket(self, chat_id: ChatIdentifier) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(self.chat_rate, self.chat_burst)
+            self._chat_buckets[chat_id] = bucket
+        return bucket
+
+    def _prune(self, now: float) -> None:
+        for buckets in (self._chat_buckets, self._group_buckets):
+            for chat_id in [
+                chat_id
+                for chat_id, bucket in buckets.items()
+                if bucket.idle(now)
+            ]:
+                del buckets[chat_id]
+
+    async def acquire(self, chat_id: typing.Optional[ChatIdentifier]) -> None:
+        """
+        Wait until a message may be sent.
+
+        The buckets of the chat are waited for before the global one, so a
+        message held back by its chat does not hold a global token meanwhile.
+
+        Parameters
+        ----------
+        chat_id : typing.Optional[ChatIdentifier]
+            The chat the message is sent to, None to only use the global
+            bucket.
+        """
+        self._reservations += 1
+        if self._reservations % 1024 == 0:
+            self._prune(time.monotonic())
+        if chat_id is not None:
+            now = time.monotonic()
+            delay = max(
+                bucket.reserve(now) for bucket in self._buckets(chat_id)
+            )
+            if delay:
+                await asyncio.sleep(delay)
+        delay = self.global_bucket.reserve(time.monotonic())
+        if delay:
+            await asyncio.sleep(delay)
+
+    def record_success(self, chat_id: typing.Optional[ChatIdentifier]) -> None:
+        """
+        Raise the rates after a message was accepted.
+
+        Parameters
+        ----------
+        chat_id : typing.Optional[ChatIdentifier]
+            The chat the message was sent to.
+        """
+        now = time.monotonic()
+        self.global_bucket.increase(self.increase_rate, now)
+        if chat_id is None:
+            return
+        for buckets in (self._chat_buckets, self._group_buckets):
+            bucket = buckets.get(chat_id)
+            if bucket is not None:
+                bucket.increase(self.increase_rate, now)
+
+    def record_flood(
+        self,
+        chat_id: typing.Optional[ChatIdentifier],
+        retry_after: typing.Optional[float] = None,
+    ) -> None:
+        """
+        Lower the rates after Telegram answered with a flood wait.
+
+        Parameters
+        ----------
+        chat_id : typing.Optional[ChatIdentifier]
+            The chat the message was sent to.
+        retry_after : typing.Optional[float]
+            The `retry_after` of the response, the chat is paused that long.
+        """
+        self.floods += 1
+        now = time.monotonic()
+        self.global_bucket.decrease(self.decrease_factor, now)
+        if chat_id is None:
+            if retry_after:
+                self.global_bucket.pause(retry_after, now)
+            return
+        for bucket in self._buckets(chat_id):
+            bucket.decrease(self.decrease_factor, now)
+            if retry_after:
+                bucket.pause(retry_after, now)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import typing
+
+import msgspec
+
+from ..abc.misc import ResponseParameters
+
+ResultT = typing.TypeVar("ResultT")
+
+
+class Response(msgspec.Struct, typing.Generic[ResultT]):
+    """
+    The envelope of every Bot API response.
+
+    Decoding `Response[X]` straight from the body of the HTTP response checks
+    `ok` and converts `result` to `X` in a single pass.
+    """
+
+    ok: bool
+    """
+    True if the request was successful.
+    """
+    result: typing.Optional[ResultT] = None
+    """
+    The result of the request, if it was successful.
+    """
+    description: typing.Optional[str] = None
+    """
+    A human-readable description of the result.
+    """
+    error_code: typing.Optional[int] = None
+    """
+    The error code of an unsuccessful request.
+    """
+    parameters: typing.Optional[ResponseParameters] = None
+    """
+    Why an unsuccessful request failed, and how it can be retried.
+    """
+
+
+class ResponseDecoders:
+    """A cache of one `Response` decoder per result type."""
+
+    def __init__(self) -> None:
+        self._decoders: typing.Dict[
+            typing.Any, msgspec.json.Decoder[Response[typing.Any]]
+        ] = {}
+
+    def __len__(self) -> int:
+        return len(self._decoders)
+
+    def get(
+        self, result_type: typing.Any
+    ) -> msgspec.json.Decoder[Response[typing.Any]]:
+        """
+        Get the decoder of the envelope of a result type.
+
+        Parameters
+        ----------
+        result_type : typing.Any
+            The type of the `result` field, any type supported by msgspec.
+
+        Returns
+        -------
+        msgspec.json.Decoder[Response[typing.Any]]
+            The decoder, built once and reused for every later response.
+        """
+        decoder = self._decoders.get(result_type)
+        if decoder is None:
+            decoder = msgspec.json.Decoder(Response[result_type], strict=False)
+            self._decoders[result_type] = decoder
+        return decoder
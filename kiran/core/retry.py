@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import random
+import typing
+
+from ..errors import TelegramAPIError
+from ..errors import TelegramChatMigratedError
+from ..errors import TelegramFloodWaitError
+from ..errors import TelegramServerError
+
+
+class RetryPolicy:
+    """
+    When and after how long failed method calls are repeated.
+
+    Timeouts, connection failures and server errors are retried with an
+    exponential backoff with full jitter, so a fleet of bots recovering from
+    an incident does not retry in lockstep. Flood waits are retried after
+    exactly `retry_after` seconds, and calls to a group which was migrated to
+    a supergroup are repeated right away with the new chat id. Every other
+    error is raised at once.
+
+    Parameters
+    ----------
+    attempts : int
+        Maximum number of times a call is made, default is 5.
+    base_delay : float
+        Seconds of the first backoff, doubled on every attempt, default is 0.5.
+    max_delay : float
+        Maximum seconds of a backoff, default is 30.
+    max_flood_wait : float
+        Longest `retry_after` waited for, longer flood waits are raised to the
+        caller instead, default is 60.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        max_flood_wait: float = 60.0,
+    ) -> None:
+        if attempts < 1:
+            raise ValueError("A retry policy needs at least one attempt.")
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_flood_wait = max_flood_wait
+
+    def __repr__(self) -> str:
+        return f"RetryPolicy(attempts={self.attempts}, base_delay={self.base_delay}, max_delay={self.max_delay}, max_flood_wait={self.max_flood_wait})"
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get the delay before retrying a transient failure.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of the failed attempt, starting at 0.
+
+        Returns
+        -------
+        float
+            A random delay between 0 and the exponential backoff of the attempt.
+        """
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2**attempt)
+        )
+
+    def delay(
+        self, error: TelegramAPIError, attempt: int
+    ) -> typing.Optional[float]:
+        """
+        Get the delay before retrying a call refused by Telegram.
+
+        Parameters
+        ----------
+        error : TelegramAPIError
+            The error of the failed attempt.
+        attempt : int
+            The number of the failed attempt, starting at 0.
+
+        Returns
+        -------
+        typing.Optional[float]
+            Seconds to wait before the next attempt, None if the error has to
+            be raised.
+        """
+        if attempt >= self.attempts - 1:
+            return None
+        if isinstance(error, TelegramChatMigratedError):
+            return 0.0
+        if isinstance(error, TelegramFloodWaitError):
+            if error.retry_after > self.max_flood_wait:
+                return None
+            return float(error.retry_after)
+        if isinstance(error, TelegramServerError):
+            return self.backoff(attempt)
+        return None
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import typing
+
+from .deadlines import remaining
+from .deadlines import without_deadline
+from .outbound import current_priority
+from .outbound import raise_priority
+
+FlightKey = typing.TypeVar("FlightKey", bound=typing.Hashable)
+FlightResult = typing.TypeVar("FlightResult")
+
+READ_ONLY_PREFIXES: typing.Final = ("get",)
+"""Bot API methods without side effects, whose identical calls are coalesced."""
+
+
+class SingleFlight(typing.Generic[FlightKey, FlightResult]):
+    """
+    Coalesces identical concurrent calls into a single one.
+
+    The first call made for a key runs, every call made for the same key
+    while it is in flight waits for its outcome instead of running again. All
+    of them get the same result, or the same exception. Cancelling one of the
+    waiting calls does not cancel the shared one, unless it was the last
+    call still waiting for it, so its request is not left running for
+    nobody.
+
+    The shared call runs outside of the deadline block of the call which
+    started it, so its deadline never cuts short the calls joining it.
+    Every call waits for the outcome within its own deadline instead, and
+    raises `asyncio.TimeoutError` when it runs out. The shared call keeps
+    the priority class of the call which started it, raised to the class
+    of a call joining it with a higher one, as long as its request is not
+    queued yet.
+
+    Results are shared, not copied, so they must not be mutated by callers.
+    """
+
+    def __init__(self) -> None:
+        self._flights: typing.Dict[FlightKey, asyncio.Future[FlightResult]] = {}
+        self._waiters: typing.Dict[asyncio.Future[FlightResult], int] = {}
+        self._contexts: typing.Dict[
+            asyncio.Future[FlightResult], contextvars.Context
+        ] = {}
+        self.calls = 0
+        """Number of calls which actually ran."""
+        self.coalesced = 0
+        """Number of calls saved by waiting for an identical one in flight."""
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def __contains__(self, key: FlightKey) -> bool:
+        return key in self._flights
+
+    def __repr__(self) -> str:
+        return f"SingleFlight(calls={self.calls}, coalesced={self.coalesced}, in_flight={len(self._flights)})"
+
+    @staticmethod
+    def coalesces(method: str) -> bool:
+        """
+        Whether the calls of a Bot API method are coalesced.
+
+        Parameters
+        ----------
+        method : str
+            The name of the method.
+
+        Returns
+        -------
+        bool
+            True for read-only methods.
+        """
+        return method.startswith(READ_ONLY_PREFIXES)
+
+    async def do(
+        self,
+        key: FlightKey,
+        call: typing.Callable[[], typing.Awaitable[FlightResult]],
+    ) -> FlightResult:
+        """
+        Run a call, or wait for the identical call in flight.
+
+        Parameters
+        ----------
+        key : FlightKey
+            What identifies identical calls.
+        call : typing.Callable[[], typing.Awaitable[FlightResult]]
+            Makes the call, only invoked when no identical call is in flight.
+
+        Returns
+        -------
+        FlightResult
+            The result of the call.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the deadline of this call passed before the outcome arrived.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            self.calls += 1
+            context = without_deadline()
+            flight = asyncio.create_task(call(), context=context)
+            self._flights[key] = flight
+            self._contexts[flight] = context
+            flight.add_done_callback(lambda done: self._land(key, done))
+        else:
+            self.coalesced += 1
+            raise_priority(self._contexts[flight], current_priority())
+        self._waiters[flight] = self._waiters.get(flight, 0) + 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(flight), remaining())
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            if self._waiters.get(flight) == 1:
+                flight.cancel()
+            raise
+        finally:
+            if flight in self._waiters:
+                self._waiters[flight] -= 1
+
+    def _land(
+        self, key: FlightKey, flight: asyncio.Future[FlightResult]
+    ) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        self._waiters.pop(flight, None)
+        self._contexts.pop(flight, None)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+import typing
+
+from .ratelimit import TokenBucket
+
+
+class TransferScheduler:
+    """
+    Shares the bandwidth of the bot between file transfers and API calls.
+
+    Multipart uploads and file downloads each take one of `max_transfers`
+    slots for as long as they run, further transfers waiting for a slot,
+    so bulk media can never hold every connection of the pool. Their bytes
+    go through a token bucket per direction, so they leave headroom on the
+    link for the small API calls, whose latency they would otherwise push
+    up. Plain API calls never wait on the scheduler.
+
+    Parameters
+    ----------
+    max_transfers : int
+        Most uploads and downloads running at once, default is 4.
+    upload_rate : typing.Optional[float]
+        Bytes per second uploaded over all transfers, None for no limit.
+    download_rate : typing.Optional[float]
+        Bytes per second downloaded over all transfers, None for no limit.
+    burst : int
+        Bytes transferred at full speed before pacing starts, default is 1 MiB.
+    """
+
+    def __init__(
+        self,
+        max_transfers: int = 4,
+        upload_rate: typing.Optional[float] = None,
+        download_rate: typing.Optional[float] = None,
+        burst: int = 1024 * 1024,
+    ) -> None:
+        if max_transfers < 1:
+            raise ValueError("A transfer scheduler needs at least one slot.")
+        self.max_transfers = max_transfers
+        self.upload_bucket = (
+            TokenBucket(upload_rate, burst, min_rate=upload_rate)
+            if upload_rate
+            else None
+        )
+        self.download_bucket = (
+            TokenBucket(download_rate, burst, min_rate=download_rate)
+            if download_rate
+            else None
+        )
+        self._slots: typing.Optional[asyncio.Semaphore] = None
+        self.active = 0
+        """Number of transfers running."""
+        self.waiting = 0
+        """Number of transfers waiting for a slot."""
+        self.uploaded = 0
+        """Bytes uploaded."""
+        self.downloaded = 0
+        """Bytes downloaded."""
+
+    def __repr__(self) -> str:
+        return f"TransferScheduler(max_transfers={self.max_transfers}, active={self.active}, waiting={self.waiting}, uploaded={self.uploaded}, downloaded={self.downloaded})"
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> typing.AsyncIterator[None]:
+        """Hold a transfer slot, waiting for one to be free."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_transfers)
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._slots.release()
+
+    @staticmethod
+    async def _pace(bucket: typing.Optional[TokenBucket], size: int) -> None:
+        if bucket is None:
+            return
+        delay = bucket.reserve(time.monotonic(), size)
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def upload(self, size: int) -> None:
+        """
+        Wait until a chunk may be uploaded.
+
+        Parameters
+        ----------
+        size : int
+            The size of the chunk, in bytes.
+        """
+        await self._pace(self.upload_bucket, size)
+        self.uploaded += size
+
+    async def download(self, size: int) -> None:
+        """
+        Wait until a downloaded chunk may be handed over.
+
+        Parameters
+        ----------
+        size : int
+            The size of the chunk, in bytes.
+        """
+        await self._pace(self.download_bucket, size)
+        self.downloaded += size
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import mimetypes
+import mmap
+import os
+import pathlib
+import typing
+
+from ..errors import KiranValueError
+
+if typing.TYPE_CHECKING:
+    from .transfers import TransferScheduler
+
+UPLOAD_CHUNK_SIZE: typing.Final = 64 * 1024
+"""Bytes read from a file at a time while uploading it."""
+
+MMAP_THRESHOLD: typing.Final = 8 * 1024 * 1024
+"""Size from which local files are memory-mapped instead of read."""
+
+MMAP_CHUNK_SIZE: typing.Final = 1024 * 1024
+"""Bytes of a memory-mapped file handed to the connection at a time."""
+
+UploadSource = typing.Union[
+    str,
+    "os.PathLike[str]",
+    typing.BinaryIO,
+    typing.AsyncIterable[bytes],
+]
+
+
+Upload = typing.Union["InputFile", pathlib.Path, typing.BinaryIO, str]
+"""A file to send: an upload, or the file id or URL of a file on Telegram."""
+
+
+class InputFile:
+    """
+    A file uploaded to Telegram, streamed instead of loaded into memory.
+
+    Local files are read a chunk at a time, large ones through a read-only
+    memory map so they are copied out of the page cache without a read call
+    per chunk. Whatever their size, at most a chunk of each upload is held
+    in memory, so many large uploads can run at once.
+
+    Parameters
+    ----------
+    source : UploadSource
+        A path to a local file, a binary file object, or an async iterable
+        of bytes. Plain strings are paths here, as opposed to the upload
+        methods where they are file ids or URLs.
+    filename : typing.Optional[str]
+        Name of the file sent to Telegram, defaults to the name of the path
+        or file object.
+    size : typing.Optional[int]
+        Size of the file in bytes, determined for paths and seekable files.
+        Giving it for async iterables lets the upload be sent with a length
+        instead of chunked.
+    """
+
+    def __init__(
+        self,
+        source: UploadSource,
+        filename: typing.Optional[str] = None,
+        size: typing.Optional[int] = None,
+    ) -> None:
+        if isinstance(source, (str, os.PathLike)):
+            source = pathlib.Path(source)
+        self.source = source
+        self.filename = filename or self._default_filename(source)
+        self._start: typing.Optional[int] = None
+        self._consumed = False
+        if isinstance(source, pathlib.Path):
+            size = source.stat().st_size if size is None else size
+        elif not isinstance(source, typing.AsyncIterable):
+            self._start = self._position(source)
+            if size is None and self._start is not None:
+                size = self._remaining(source, self._start)
+        self.size = size
+
+    def __repr__(self) -> str:
+        return f"InputFile(filename={self.filename!r}, size={self.size})"
+
+    @staticmethod
+    def _default_filename(source: UploadSource) -> str:
+        if isinstance(source, pathlib.Path):
+            return source.name
+        name = getattr(source, "name", None)
+        if isinstance(name, str) and name:
+            return os.path.basename(name)
+        return "file"
+
+    @staticmethod
+    def _position(file: typing.BinaryIO) -> typing.Optional[int]:
+        try:
+            return file.tell() if file.seekable() else None
+        except (io.UnsupportedOperation, OSError):
+            return None
+
+    @staticmethod
+    def _remaining(file: typing.BinaryIO, start: int) -> typing.Optional[int]:
+        try:
+            return os.fstat(file.fileno()).st_size - start
+        except (io.UnsupportedOperation, OSError, AttributeError):
+            pass
+        end = file.seek(0, os.SEEK_END)
+        file.seek(start)
+        return end - start
+
+    @property
+    def content_type(self) -> str:
+        """The MIME type guessed from the file name."""
+        return (
+            mimetypes.guess_type(self.filename)[0] or "application/octet-stream"
+        )
+
+    @property
+    def replayable(self) -> bool:
+        """Whether the file can be sent again, for a retry."""
+        return isinstance(self.source, pathlib.Path) or self._start is not None
+
+    def digest(self) -> typing.Optional[str]:
+        """
+        Hash the content of the file, blocking while it is read.
+
+        Returns
+        -------
+        typing.Optional[str]
+            The hexadecimal SHA-256 of the file, None if it is not replayable.
+        """
+        source = self.source
+        hasher = hashlib.sha256()
+        if isinstance(source, pathlib.Path):
+            with source.open("rb") as file:
+                while chunk := file.read(MMAP_CHUNK_SIZE):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
+        if self._start is None or isinstance(source, typing.AsyncIterable):
+            return None
+        source.seek(self._start)
+        while chunk := source.read(MMAP_CHUNK_SIZE):
+            hasher.update(chunk)
+        source.seek(self._start)
+        return hasher.hexdigest()
+
+    async def chunks(self) -> typing.AsyncIterator[bytes]:
+        """
+        Read the file from its start, a chunk at a time.
+
+        Yields
+        ------
+        bytes
+            The next chunk of the file.
+        """
+        source = self.source
+        if isinstance(source, pathlib.Path):
+            if self.size is not None and self.size >= MMAP_THRESHOLD:
+                async for chunk in self._mapped_chunks(source):
+                    yield chunk
+                return
+            with source.open("rb") as file:
+                while chunk := file.read(UPLOAD_CHUNK_SIZE):
+                    yield chunk
+            return
+        if isinstance(source, typing.AsyncIterable):
+            if self._consumed:
+                raise KiranValueError(
+                    message=f"Upload of {self.filename} was already sent and cannot be replayed.",
+                )
+            self._consumed = True
+            async for chunk in source:
+                yield chunk
+            return
+        if self._start is not None:
+            source.seek(self._start)
+        while chunk := source.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+    @staticmethod
+    async def _mapped_chunks(
+        path: pathlib.Path,
+    ) -> typing.AsyncIterator[bytes]:
+        with path.open("rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        with mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            for offset in range(0, len(mapped), MMAP_CHUNK_SIZE):
+                yield mapped[offset : offset + MMAP_CHUNK_SIZE]
+
+
+def _quote(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', "%22")
+        .replace("\r", "%0D")
+        .replace("\n", "%0A")
+    )
+
+
+class MultipartStream:
+    """
+    A `multipart/form-data` body streamed from its files.
+
+    The body is generated anew every time it is iterated, so a request
+    whose files are all replayable can be retried. Its length is announced
+    when the sizes of all the files are known, otherwise it is sent chunked.
+
+    Parameters
+    ----------
+    fields : typing.Dict[str, str]
+        The form fields, already encoded.
+    files : typing.Dict[str, InputFile]
+        The files, by the name of their field.
+    scheduler : typing.Optional[TransferScheduler]
+        Paces the bytes of the files, None to send them at full speed.
+    """
+
+    def __init__(
+        self,
+        fields: typing.Dict[str, str],
+        files: typing.Dict[str, InputFile],
+        scheduler: typing.Optional["TransferScheduler"] = None,
+    ) -> None:
+        self.boundary = os.urandom(16).hex()
+        self.fields = fields
+        self.files = files
+        self.scheduler = scheduler
+        self._delimiter = f"--{self.boundary}\r\n".encode()
+        self._fields = b"".join(
+            self._delimiter
+            + f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'.encode()
+            + value.encode()
+            + b"\r\n"
+            for name, value in fields.items()
+        )
+        self._file_headers = {
+            name: self._delimiter
+            + (
+                f'Content-Disposition: form-data; name="{_quote(name)}"; filename="{_quote(file.filename)}"\r\n'
+                f"Content-Type: {file.content_type}\r\n\r\n"
+            ).encode()
+            for name, file in files.items()
+        }
+        self._closing = f"--{self.boundary}--\r\n".encode()
+
+    def __repr__(self) -> str:
+        return (
+            f"MultipartStream(fields={len(self.fields)}, files={self.files!r})"
+        )
+
+    @property
+    def size(self) -> typing.Optional[int]:
+        """The length of the body, None if a file has an unknown size."""
+        sizes = [file.size for file in self.files.values()]
+        if any(size is None for size in sizes):
+            return None
+        return (
+            len(self._fields)
+            + sum(len(header) + 2 for header in self._file_headers.values())
+            + sum(typing.cast(typing.List[int], sizes))
+            + len(self._closing)
+        )
+
+    @property
+    def replayable(self) -> bool:
+        """Whether the body can be sent again, for a retry."""
+        return all(file.replayable for file in self.files.values())
+
+    @property
+    def headers(self) -> typing.Dict[str, str]:
+        """The headers describing the body."""
+        headers = {
+            "Content-Type": f"multipart/form-data; boundary={self.boundary}"
+        }
+        size = self.size
+        if size is not None:
+            headers["Content-Length"] = str(size)
+        return headers
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        yield self._fields
+        for name, file in self.files.items():
+            yield self._file_headers[name]
+            async for chunk in file.chunks():
+                if self.scheduler is not None:
+                    await self.scheduler.upload(len(chunk))
+                yield chunk
+            yield b"\r\n"
+        yield self._closing
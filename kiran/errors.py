@@ -53,6 +53,71 @@ class KiranPollingError(KiranBaseException):
         super().__init__(message, client, *args)
 
 
+class KiranDeadlineError(KiranPollingError):
+    """
+    A method call ran out of the time left before its deadline.
+
+    Raised instead of making a call or waiting for a retry which would end
+    past the deadline, see `kiran.core.deadlines.deadline`.
+    """
+
+
+class KiranCircuitOpenError(KiranPollingError):
+    """
+    A method call failed fast, as the Bot API kept failing lately.
+
+    Raised while the circuit breaker of the bot is open, see
+    `kiran.core.breaker.CircuitBreaker`.
+    """
+
+
+class KiranBulkRequestError(KiranPollingError):
+    """
+    Some chunks of a bulk method call failed, the others were carried out.
+
+    Parameters
+    ----------
+    message : str
+        A description of the failure.
+    result : typing.Any
+        What the call returns, for the chunks which were carried out only.
+    done : typing.List[int]
+        The message ids of the chunks which were carried out.
+    failed : typing.List[int]
+        The message ids of the chunks which failed.
+    errors : typing.List[BaseException]
+        The errors of the chunks which failed, in the order of their ids.
+    client : typing.Optional[KiranBot]
+        The bot which made the call.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        result: typing.Any,
+        done: typing.List[int],
+        failed: typing.List[int],
+        errors: typing.List[BaseException],
+        client: typing.Optional["KiranBot"] = None,
+        *args: object,
+    ) -> None:
+        self.result = result
+        self.done = done
+        self.failed = failed
+        self.errors = errors
+        super().__init__(message, client, *args)
+
+
+class KiranAmbiguousSendError(KiranPollingError):
+    """
+    A send failed after its request may have reached Telegram.
+
+    Telegram may or may not have carried it out. Raised for sends made with
+    an idempotency key, which are not repeated blindly, and raised again by
+    a later send with the same key, see `kiran.core.idempotency.SendLedger`.
+    """
+
+
 class KiranUnkownError(KiranBaseException):
     def __init__(
         self,
@@ -81,3 +146,173 @@ class CommandImplementationError(KiranBaseException):
         *args: object,
     ) -> None:
         super().__init__(message, client, *args)
+
+
+class TelegramAPIError(KiranBaseException):
+    """
+    Telegram refused a method call.
+
+    Parameters
+    ----------
+    message : str
+        A description of the failure.
+    method : str
+        The name of the Bot API method which failed.
+    error_code : int
+        The error code of the response, an HTTP status code.
+    description : str
+        The description of the error given by Telegram.
+    client : typing.Optional[KiranBot]
+        The bot which made the call.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        method: str,
+        error_code: int,
+        description: str,
+        client: typing.Optional["KiranBot"] = None,
+        *args: object,
+    ) -> None:
+        self.method = method
+        self.error_code = error_code
+        self.description = description
+        super().__init__(message, client, *args)
+
+    def __str__(self) -> str:
+        return self.message
+
+    @classmethod
+    def from_response(
+        cls,
+        method: str,
+        error_code: int,
+        description: str,
+        retry_after: typing.Optional[int] = None,
+        migrate_to_chat_id: typing.Optional[int] = None,
+        client: typing.Optional["KiranBot"] = None,
+    ) -> "TelegramAPIError":
+        """
+        Build the error matching a failed response.
+
+        Parameters
+        ----------
+        method : str
+            The name of the Bot API method which failed.
+        error_code : int
+            The error code of the response.
+        description : str
+            The description of the error given by Telegram.
+        retry_after : typing.Optional[int]
+            The `retry_after` parameter of the response, if any.
+        migrate_to_chat_id : typing.Optional[int]
+            The `migrate_to_chat_id` parameter of the response, if any.
+        client : typing.Optional[KiranBot]
+            The bot which made the call.
+
+        Returns
+        -------
+        TelegramAPIError
+            The most specific error for the response.
+        """
+        message = (
+            f"Telegram refused {method} with error {error_code}: {description}"
+        )
+        if migrate_to_chat_id is not None:
+            return TelegramChatMigratedError(
+                message,
+                method,
+                error_code,
+                description,
+                migrate_to_chat_id,
+                client,
+            )
+        if error_code == 429:
+            return TelegramFloodWaitError(
+                message,
+                method,
+                error_code,
+                description,
+                retry_after or 1,
+                client,
+            )
+        error_types: typing.Dict[int, typing.Type[TelegramAPIError]] = {
+            400: TelegramBadRequestError,
+            401: TelegramUnauthorizedError,
+            403: TelegramForbiddenError,
+        }
+        error_type = error_types.get(error_code)
+        if error_type is None:
+            error_type = (
+                TelegramServerError if error_code >= 500 else TelegramAPIError
+            )
+        return error_type(message, method, error_code, description, client)
+
+
+class TelegramBadRequestError(TelegramAPIError):
+    """The call was malformed or is not applicable, retrying will not help."""
+
+
+class TelegramUnauthorizedError(TelegramAPIError):
+    """The token of the bot was revoked or is invalid."""
+
+
+class TelegramForbiddenError(TelegramAPIError):
+    """The bot may not act in the chat, it was blocked, kicked or the user is deactivated."""
+
+
+class TelegramServerError(TelegramAPIError):
+    """Telegram failed to handle the call, it may succeed later."""
+
+
+class TelegramFloodWaitError(TelegramAPIError):
+    """
+    The call was refused by the flood control of Telegram.
+
+    Parameters
+    ----------
+    retry_after : int
+        The number of seconds to wait before the call may be repeated.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        method: str,
+        error_code: int,
+        description: str,
+        retry_after: int,
+        client: typing.Optional["KiranBot"] = None,
+        *args: object,
+    ) -> None:
+        self.retry_after = retry_after
+        super().__init__(
+            message, method, error_code, description, client, *args
+        )
+
+
+class TelegramChatMigratedError(TelegramBadRequestError):
+    """
+    The group was upgraded to a supergroup with a new identifier.
+
+    Parameters
+    ----------
+    migrate_to_chat_id : int
+        The identifier of the supergroup.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        method: str,
+        error_code: int,
+        description: str,
+        migrate_to_chat_id: int,
+        client: typing.Optional["KiranBot"] = None,
+        *args: object,
+    ) -> None:
+        self.migrate_to_chat_id = migrate_to_chat_id
+        super().__init__(
+            message, method, error_code, description, client, *args
+        )
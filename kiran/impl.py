@@ -1,35 +1,74 @@
 from __future__ import annotations
 
 import asyncio
+import importlib
+import importlib.util
 import inspect
+import pkgutil
+import re
+import traceback
 import typing
 
-import httpx
-
 from ._about import __banner__
 from .abc.bots import BotCommand
 from .abc.bots import BotCommandScope
 from .abc.bots import BotCommandScopeDefault
+from .components.callbacks import CallbackRouter
 from .components.commands import CallableBotCommandDetails
 from .components.commands import CommandImplements
 from .components.commands import LanguageCode
+from .components.context import CallbackContext
 from .components.context import CommandContext
+from .components.context import TriggerContext
+from .components.middleware import Middleware
+from .components.middleware import compose_middlewares
+from .components.plugins import Plugin
+from .components.plugins import scan_plugin_source
+from .components.triggers import TextTriggerMatcher
+from .core.breaker import CircuitBreaker
+from .core.cache import DownloadCache
+from .core.cache import FileIdCache
 from .core.cache import KiranCache
+from .core.idempotency import SendLedger
 from .core.methods import KiranCaller
+from .core.outbound import OutboundQueue
 from .core.poll import PollingManager
+from .core.ratelimit import RateLimiter
+from .core.retry import RetryPolicy
+from .core.transfers import TransferScheduler
 from .errors import CommandImplementationError
+from .errors import TelegramAPIError
 from .logger import DefaultSettings
 from .logger import KiranLogger
 from .logger import LoggerSettings
+from .transport import HTTP2_AVAILABLE
+from .transport import TELEGRAM_API_URL
+from .transport import DefaultTransportSettings
+from .transport import TransportSettings
 
 CommandFunction = typing.Callable[[CommandContext], typing.Awaitable[None]]
 ImplementationMethod = typing.Union[int, CommandImplements]
 
 if typing.TYPE_CHECKING:
     import datetime
+    import types
 
     from .core.events import KiranEvent
 
+CommandScopeKey = typing.Tuple[typing.Union[str, LanguageCode], BotCommandScope]
+"""The language code and scope a list of commands is synced for with `setMyCommands`."""
+
+
+class _PluginRecord(typing.NamedTuple):
+    commands: typing.Dict[CallableBotCommandDetails, CommandImplements]
+    listeners: typing.List[
+        typing.Tuple[
+            typing.Type["KiranEvent"],
+            typing.Callable[["KiranEvent"], typing.Awaitable[None]],
+        ]
+    ]
+    lazy: bool
+
 
 LoadProxy = typing.Union[
     typing.List[typing.Mapping[str, str]], typing.Mapping[str, str]
@@ -70,6 +109,39 @@ class KiranBot:
 
     logging_settings: typing.Optional[LoggerSettings] = None
         The logger settings for the bot.
+
+    transport_settings: typing.Optional[TransportSettings] = None
+        The connection pools, timeouts and Bot API endpoint of the HTTP
+        clients of the bot, set `api_url` and `local_mode` there to use a
+        self-hosted Bot API server.
+
+    rate_limiter: typing.Optional[RateLimiter] = None
+        The pacing of outbound messages, defaults to the flood limits of Telegram.
+
+    retry_policy: typing.Optional[RetryPolicy] = None
+        When and after how long failed method calls are repeated.
+
+    file_id_cache: typing.Optional[FileIdCache] = None
+        The file ids of uploaded content, sent instead of uploading it again.
+
+    download_cache: typing.Optional[DownloadCache] = None
+        The downloaded files kept on disk, read instead of downloading them again.
+
+    transfer_scheduler: typing.Optional[TransferScheduler] = None
+        The slots and bandwidth of file uploads and downloads, defaults to 4
+        transfers at once without a bandwidth limit.
+
+    send_ledger: typing.Optional[SendLedger] = None
+        The outcomes of sends made with an idempotency key, remembered for
+        10 minutes by default.
+
+    circuit_breaker: typing.Optional[CircuitBreaker] = None
+        When method calls fail fast during an outage of the Bot API,
+        defaults to after 5 failed attempts in a row, for 10 seconds.
+
+    outbound_queue: typing.Optional[OutboundQueue] = None
+        How the method calls sent at once are shared between interactive
+        replies, normal calls and bulk jobs, defaults to 16 calls at once.
     """
 
     def __init__(
@@ -79,6 +151,15 @@ class KiranBot:
         logging_settings: typing.Optional["LoggerSettings"] = None,
         proxy_settings: typing.Optional[LoadProxy] = None,
         polling_manager: typing.Optional["PollingManager"] = None,
+        transport_settings: typing.Optional["TransportSettings"] = None,
+        rate_limiter: typing.Optional["RateLimiter"] = None,
+        retry_policy: typing.Optional["RetryPolicy"] = None,
+        file_id_cache: typing.Optional["FileIdCache"] = None,
+        download_cache: typing.Optional["DownloadCache"] = None,
+        transfer_scheduler: typing.Optional["TransferScheduler"] = None,
+        send_ledger: typing.Optional["SendLedger"] = None,
+        circuit_breaker: typing.Optional["CircuitBreaker"] = None,
+        outbound_queue: typing.Optional["OutboundQueue"] = None,
     ) -> None:
         print(__banner__)
         self.proxy_settings = proxy_settings
@@ -94,13 +175,39 @@ class KiranBot:
                 typing.Callable[["KiranEvent"], typing.Awaitable[None]]
             ],
         ] = {}
+        self._listener_cache: typing.Dict[
+            typing.Type["KiranEvent"],
+            typing.Tuple[
+                typing.Callable[["KiranEvent"], typing.Awaitable[None]], ...
+            ],
+        ] = {}
         self.log("Event subscription storage initialized.", "debug")
-        self.session = httpx.AsyncClient(
-            base_url=f"https://api.telegram.org/bot{token}", timeout=999
+        self.transport_settings = transport_settings or DefaultTransportSettings
+        if self.transport_settings.http2 and not HTTP2_AVAILABLE:
+            self.log(
+                "HTTP/2 was requested but the h2 package is not installed, falling back to HTTP/1.1.",
+                "warning",
+            )
+        if (
+            self.transport_settings.local_mode
+            and self.transport_settings.api_url == TELEGRAM_API_URL
+        ):
+            self.log(
+                "Local mode was requested against the Bot API hosted by Telegram, set api_url to the local Bot API server.",
+                "warning",
+            )
+        self.session = self.transport_settings.build_client(
+            self.transport_settings.bot_url(token)
         )
         self.log("Httpx session initialized.", "debug")
+        self.polling_session = self.transport_settings.build_polling_client(
+            self.transport_settings.bot_url(token)
+        )
+        self.log("Httpx polling session initialized.", "debug")
         if polling_manager is None:
-            polling_manager = PollingManager(client=self, timeout=999)
+            polling_manager = PollingManager(
+                client=self, timeout=self.transport_settings.polling_timeout
+            )
             self.log(
                 "Polling manager has been created. Was not defined by the developer.",
                 "debug",
@@ -125,6 +232,36 @@ class KiranBot:
             typing.Callable[["CommandContext"], typing.Awaitable[None]],
         ] = {}
         self.log("Common command subscription storage initialized.", "debug")
+        self._raw_commands: typing.Dict[
+            CallableBotCommandDetails,
+            typing.Callable[["CommandContext"], typing.Awaitable[None]],
+        ] = {}
+        self._command_routes: typing.Dict[
+            str, typing.List[CallableBotCommandDetails]
+        ] = {}
+        self._middlewares: typing.List[Middleware] = []
+        self.log("Middleware storage initialized.", "debug")
+        self._text_triggers: TextTriggerMatcher[
+            typing.Callable[["TriggerContext"], typing.Awaitable[None]]
+        ] = TextTriggerMatcher()
+        self._trigger_handlers: typing.Dict[
+            typing.Callable[["TriggerContext"], typing.Awaitable[None]],
+            typing.Callable[["TriggerContext"], typing.Awaitable[None]],
+        ] = {}
+        self.log("Text trigger storage initialized.", "debug")
+        self.callback_router: CallbackRouter[
+            typing.Callable[["CallbackContext"], typing.Awaitable[None]]
+        ] = CallbackRouter()
+        self._callback_handlers: typing.Dict[
+            typing.Callable[["CallbackContext"], typing.Awaitable[None]],
+            typing.Callable[["CallbackContext"], typing.Awaitable[None]],
+        ] = {}
+        self.log("Callback query router initialized.", "debug")
+        self._plugins: typing.Dict[str, _PluginRecord] = {}
+        self._lazy_listeners: typing.Dict[str, typing.Set[str]] = {}
+        self._commands_synced = False
+        self._background_tasks: typing.Set[asyncio.Task[None]] = set()
+        self.log("Plugin storage initialized.", "debug")
         self.polling_manager = polling_manager
         self.log("Polling manager has been initialized.", "debug")
         self._datetime_task: typing.Dict[
@@ -139,6 +276,30 @@ class KiranBot:
         self.log("Token has been taken into account.", "debug")
         self._prefix = prefix
         self.log("Prefix has been taken into account.", "debug")
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.log("Outbound rate limiter has been initialized.", "debug")
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.log("Retry policy has been initialized.", "debug")
+        self.file_id_cache = file_id_cache
+        if file_id_cache is not None:
+            self.log(
+                f"File id cache has been loaded with {len(file_id_cache)} files.",
+                "debug",
+            )
+        self.download_cache = download_cache
+        if download_cache is not None:
+            self.log(
+                f"Download cache has been loaded with {len(download_cache)} files.",
+                "debug",
+            )
+        self.transfer_scheduler = transfer_scheduler or TransferScheduler()
+        self.log("Transfer scheduler has been initialized.", "debug")
+        self.send_ledger = send_ledger or SendLedger()
+        self.log("Send ledger has been initialized.", "debug")
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.log("Circuit breaker has been initialized.", "debug")
+        self.outbound_queue = outbound_queue or OutboundQueue()
+        self.log("Outbound queue has been initialized.", "debug")
         self.caller = KiranCaller(bot=self)
         self.log("Caller has been initialised for call jobs.", "debug")
         self.event_loop = asyncio.new_event_loop()
@@ -162,45 +323,16 @@ class KiranBot:
             func: typing.Callable[[CommandContext], typing.Awaitable[None]],
         ) -> typing.Callable[[CommandContext], typing.Awaitable[None]]:
             if hasattr(func, "__implements__"):
-                if func.__implements__ == CommandImplements.GENERAL_COMMAND:  # type: ignore
-                    self.log(
-                        f"Command: {name} has been registered as a common command.",
-                        "debug",
-                    )
-                    self._common_commands[
-                        CallableBotCommandDetails(
-                            name=name,
-                            description=description,
-                            scope=scopes,
-                            language_code=language_code,
-                        )
-                    ] = func
-                if func.__implements__ == CommandImplements.SLASH_COMMAND:  # type: ignore
-                    self.log(
-                        f"Command: {name} has been registered as a slash command.",
-                        "debug",
-                    )
-                    self._slash_commands[
-                        CallableBotCommandDetails(
-                            name=name,
-                            description=description,
-                            scope=scopes,
-                            language_code=language_code,
-                        )
-                    ] = func
-                if func.__implements__ == CommandImplements.PREFIX_COMMAND:  # type: ignore
-                    self.log(
-                        f"Command: {name} has been registered as a prefix command.",
-                        "debug",
-                    )
-                    self._prefix_commands[
-                        CallableBotCommandDetails(
-                            name=name,
-                            description=description,
-                            scope=scopes,
-                            language_code=language_code,
-                        )
-                    ] = func
+                self._add_command(
+                    CallableBotCommandDetails(
+                        name=name,
+                        description=description,
+                        scope=scopes,
+                        language_code=language_code,
+                    ),
+                    func.__implements__,  # type: ignore
+                    func,
+                )
             else:
                 raise CommandImplementationError(
                     message=f"Implementation method not specified. Command: {name}",
@@ -210,49 +342,266 @@ class KiranBot:
 
         return decorator
 
+    def _add_command(
+        self,
+        details: CallableBotCommandDetails,
+        implements: ImplementationMethod,
+        func: typing.Callable[[CommandContext], typing.Awaitable[None]],
+    ) -> None:
+        if implements == CommandImplements.GENERAL_COMMAND:
+            self.log(
+                f"Command: {details.name} has been registered as a common command.",
+                "debug",
+            )
+            storage = self._common_commands
+        elif implements == CommandImplements.SLASH_COMMAND:
+            self.log(
+                f"Command: {details.name} has been registered as a slash command.",
+                "debug",
+            )
+            storage = self._slash_commands
+        elif implements == CommandImplements.PREFIX_COMMAND:
+            self.log(
+                f"Command: {details.name} has been registered as a prefix command.",
+                "debug",
+            )
+            storage = self._prefix_commands
+        else:
+            return
+        self._remove_command(details)
+        self._raw_commands[details] = func
+        storage[details] = self._wrap_handler(func)
+        if storage is not self._prefix_commands:
+            self._command_routes.setdefault(details.name, []).append(details)
+
+    def _remove_command(self, details: CallableBotCommandDetails) -> None:
+        self._raw_commands.pop(details, None)
+        for storage in (
+            self._slash_commands,
+            self._prefix_commands,
+            self._common_commands,
+        ):
+            storage.pop(details, None)
+        routes = self._command_routes.get(details.name)
+        if routes is not None and details in routes:
+            routes.remove(details)
+            if not routes:
+                del self._command_routes[details.name]
+
+    def _wrap_handler(
+        self,
+        func: typing.Callable[[CommandContext], typing.Awaitable[None]],
+    ) -> typing.Callable[[CommandContext], typing.Awaitable[None]]:
+        return compose_middlewares(func, self._middlewares)
+
+    def add_middleware(self, middleware: Middleware) -> Middleware:
+        """
+        Register a middleware around every command handler.
+
+        Middlewares are composed into one callable per handler when the
+        handler is registered, the first registered middleware being the
+        outermost layer. Handlers registered before the middleware are
+        recomposed right away.
+
+        Parameters
+        ----------
+        middleware : Middleware
+            A coroutine function taking the next layer and the context as
+            `middleware(call_next, context)`. Not awaiting `call_next`
+            short-circuits the handler.
+
+        Returns
+        -------
+        Middleware
+            The same middleware, so the method can be used as a decorator.
+        """
+        self._middlewares.append(middleware)
+        for commands in (
+            self._slash_commands,
+            self._prefix_commands,
+            self._common_commands,
+        ):
+            for details in commands:
+                commands[details] = self._wrap_handler(
+                    self._raw_commands[details]
+                )
+        for handlers in (self._trigger_handlers, self._callback_handlers):
+            for func in handlers:
+                handlers[func] = self._wrap_handler(func)
+        self.log(
+            f"Middleware: {getattr(middleware, '__name__', middleware)} has been registered.",
+            "debug",
+        )
+        return middleware
+
+    def middleware(self, middleware: Middleware) -> Middleware:
+        """
+        Decorator form of `add_middleware`.
+
+        Parameters
+        ----------
+        middleware : Middleware
+            The middleware to register.
+
+        Returns
+        -------
+        Middleware
+            The same middleware.
+        """
+        return self.add_middleware(middleware)
+
+    def trigger(
+        self,
+        *patterns: typing.Union[str, re.Pattern[str]],
+        regex: bool = False,
+    ) -> typing.Callable[
+        [typing.Callable[["TriggerContext"], typing.Awaitable[None]]],
+        typing.Callable[["TriggerContext"], typing.Awaitable[None]],
+    ]:
+        """
+        Register a handler for plain messages whose text matches a pattern.
+
+        All the triggers of the bot are compiled into a single matcher, so the
+        text of each message is scanned once however many triggers exist.
+        Every trigger matching invokes its handler, even when its match
+        overlaps the match of another one.
+
+        Parameters
+        ----------
+        *patterns : typing.Union[str, re.Pattern[str]]
+            The patterns invoking the handler. Literal patterns match case
+            insensitively anywhere in the text.
+        regex : bool
+            Whether the patterns are regular expressions. Compiled patterns
+            are always treated as regular expressions. Defaults to False.
+        """
+
+        def decorator(
+            func: typing.Callable[[TriggerContext], typing.Awaitable[None]],
+        ) -> typing.Callable[[TriggerContext], typing.Awaitable[None]]:
+            if not patterns:
+                raise CommandImplementationError(
+                    message=f"No pattern specified for trigger: {func.__name__}",
+                    client=self,
+                )
+            for pattern in patterns:
+                if regex or isinstance(pattern, re.Pattern):
+                    self._text_triggers.add_regex(pattern, func)
+                else:
+                    self._text_triggers.add_literal(pattern, func)
+            self._trigger_handlers[func] = self._wrap_handler(func)
+            self.log(
+                f"Trigger: {func.__name__} has been registered with {len(patterns)} pattern(s).",
+                "debug",
+            )
+            return func
+
+        return decorator
+
+    def callback(
+        self,
+        prefix: str,
+        ack_after: typing.Optional[float] = None,
+    ) -> typing.Callable[
+        [typing.Callable[["CallbackContext"], typing.Awaitable[None]]],
+        typing.Callable[["CallbackContext"], typing.Awaitable[None]],
+    ]:
+        """
+        Register a handler for callback queries whose data starts with a prefix.
+
+        The data is split on the separator of `callback_router`, the longest
+        registered prefix is routed and the remaining segments are available
+        as `CallbackContext.args`. Use `callback_router.pack` to build the data
+        of the buttons.
+
+        Parameters
+        ----------
+        prefix : str
+            The leading segments of the callback data, for example `vote`.
+        ack_after : typing.Optional[float]
+            Grace period in seconds given to the handler to answer the query
+            itself before Kiran acknowledges it. Defaults to the router value,
+            half a second.
+        """
+
+        def decorator(
+            func: typing.Callable[[CallbackContext], typing.Awaitable[None]],
+        ) -> typing.Callable[[CallbackContext], typing.Awaitable[None]]:
+            self.callback_router.add(prefix, func, ack_after)
+            self._callback_handlers[func] = self._wrap_handler(func)
+            self.log(
+                f"Callback: {func.__name__} has been registered for prefix {prefix!r}.",
+                "debug",
+            )
+            return func
+
+        return decorator
+
     async def _poll(self):
         await self.polling_manager.poll()
 
-    async def _register_slash_commands(self) -> None:
+    def _command_scope_key(
+        self, details: CallableBotCommandDetails
+    ) -> CommandScopeKey:
+        return (
+            details.language_code or "default",
+            details.scope or BotCommandScopeDefault(),
+        )
+
+    async def _sync_command_scopes(
+        self, keys: typing.Optional[typing.Iterable[CommandScopeKey]] = None
+    ) -> None:
         sorted_commands: typing.Dict[
-            typing.Union[str, LanguageCode],
-            typing.Dict[
-                BotCommandScope, typing.List[CallableBotCommandDetails]
-            ],
+            CommandScopeKey, typing.List[CallableBotCommandDetails]
         ] = {}
         for command in self._slash_commands | self._common_commands:
-            language_code = command.language_code or "default"
-            command_scope = command.scope or BotCommandScopeDefault()
-
-            if language_code not in sorted_commands:
-                sorted_commands[language_code] = {}
-
-            if command_scope not in sorted_commands[language_code]:
-                sorted_commands[language_code][command_scope] = []
-
-            sorted_commands[language_code][command_scope].append(command)
-
-        for language_code, scopes in sorted_commands.items():
-            for scope, commands in scopes.items():
-                bot_commands = [
-                    BotCommand(
-                        command=cmd.name,
-                        description=cmd.description,
-                    )
-                    for cmd in commands
-                ]
-                if language_code == "default":
+            sorted_commands.setdefault(
+                self._command_scope_key(command), []
+            ).append(command)
+
+        for key in sorted_commands if keys is None else keys:
+            language_code, scope = key
+            language_code_iso = (
+                None if language_code == "default" else language_code
+            )
+            commands = sorted_commands.get(key)
+            try:
+                if commands:
                     await self.caller.set_commands(
-                        bot_commands=bot_commands,
+                        bot_commands=[
+                            BotCommand(
+                                command=cmd.name,
+                                description=cmd.description,
+                            )
+                            for cmd in commands
+                        ],
                         command_scope=scope,
-                        language_code_iso=None,
+                        language_code_iso=language_code_iso,
                     )
                 else:
-                    await self.caller.set_commands(
-                        bot_commands=bot_commands,
-                        command_scope=scope,
-                        language_code_iso=language_code,
+                    await self.caller.delete_command(
+                        scope=scope, language_code=language_code_iso
                     )
+            except TelegramAPIError as e:
+                self.log(
+                    f"Could not sync commands for scope: {scope}, language: {language_code}. {e}",
+                    "error",
+                )
+                continue
+            self.log(
+                f"Synced {len(commands or ())} commands for scope: {scope}, language: {language_code}.",
+                "debug",
+            )
+
+    def _schedule_scope_sync(self, keys: typing.Set[CommandScopeKey]) -> None:
+        if not keys or not self._commands_synced:
+            return
+        task = self.event_loop.create_task(self._sync_command_scopes(keys))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _register_slash_commands(self) -> None:
+        await self._sync_command_scopes()
         self.log(
             f"Populated {len(self._slash_commands)} slash commands to the bot.",
             "info",
@@ -270,6 +619,7 @@ class KiranBot:
             prefix_commands=self._prefix_commands,
             common_commands=self._common_commands,
         )
+        self._commands_synced = True
 
     async def _main_frame(self) -> None:
         try:
@@ -292,22 +642,281 @@ class KiranBot:
         def decorator(
             func: typing.Callable[[KiranEvent], typing.Awaitable[None]],
         ) -> typing.Callable[[KiranEvent], typing.Awaitable[None]]:
-            if event_type not in self._subscribed_events:
-                self._subscribed_events[event_type] = []
-            self._subscribed_events[event_type].append(func)
+            self._subscribe(event_type, func)
             return func
 
         return decorator
 
+    def _subscribe(
+        self,
+        event_type: typing.Type["KiranEvent"],
+        func: typing.Callable[["KiranEvent"], typing.Awaitable[None]],
+    ) -> None:
+        if event_type not in self._subscribed_events:
+            self._subscribed_events[event_type] = []
+        self._subscribed_events[event_type].append(func)
+        self._listener_cache.clear()
+
+    def _unsubscribe(
+        self,
+        event_type: typing.Type["KiranEvent"],
+        func: typing.Callable[["KiranEvent"], typing.Awaitable[None]],
+    ) -> None:
+        listeners = self._subscribed_events.get(event_type, [])
+        if func in listeners:
+            listeners.remove(func)
+        self._listener_cache.clear()
+
+    def _register_plugin(
+        self, module_name: str, module: "types.ModuleType"
+    ) -> typing.Set[CommandScopeKey]:
+        previous = self._plugins.pop(module_name, None)
+        old_commands = previous.commands if previous is not None else {}
+        if previous is not None:
+            for details in previous.commands:
+                self._remove_command(details)
+            for event_type, func in previous.listeners:
+                self._unsubscribe(event_type, func)
+        record = _PluginRecord(commands={}, listeners=[], lazy=False)
+        for plugin in vars(module).values():
+            if not isinstance(plugin, Plugin):
+                continue
+            for details, (implements, func) in plugin.commands.items():
+                self._add_command(details, implements, func)
+                record.commands[details] = implements
+            for event_type, func in plugin.listeners:
+                self._subscribe(event_type, func)
+                record.listeners.append((event_type, func))
+        self._plugins[module_name] = record
+        changed = old_commands.items() ^ record.commands.items()
+        return {
+            self._command_scope_key(details)
+            for details, implements in changed
+            if implements != CommandImplements.PREFIX_COMMAND
+        }
+
+    def _lazy_command(
+        self, module_name: str, details: CallableBotCommandDetails
+    ) -> typing.Callable[[CommandContext], typing.Awaitable[None]]:
+        async def lazy_command(context: CommandContext) -> None:
+            self._load_lazy_plugin(module_name)
+            func = self._raw_commands.get(details)
+            if func is None or func is lazy_command:
+                self.log(
+                    f"Command: {details.name} was not registered by plugin {module_name}.",
+                    "error",
+                )
+                return
+            await func(context)
+
+        return lazy_command
+
+    def _load_lazy_plugin(self, module_name: str) -> None:
+        record = self._plugins.get(module_name)
+        if record is None or not record.lazy:
+            return
+        for modules in self._lazy_listeners.values():
+            modules.discard(module_name)
+        self.log(f"Plugin: {module_name} is used, importing it.", "debug")
+        self._schedule_scope_sync(
+            self._register_plugin(
+                module_name, importlib.import_module(module_name)
+            )
+        )
+
+    def load_plugin(self, module_name: str) -> None:
+        """
+        Import a plugin module and register the commands and listeners of its plugins.
+
+        When the bot is already running, only the `setMyCommands` scopes
+        affected by the plugin are synced again.
+
+        Parameters
+        ----------
+        module_name : str
+            The importable name of the module, for example `bot.plugins.admin`.
+        """
+        self._schedule_scope_sync(
+            self._register_plugin(
+                module_name, importlib.import_module(module_name)
+            )
+        )
+        self.log(f"Plugin: {module_name} has been loaded.", "debug")
+
+    def reload_plugin(self, module_name: str) -> None:
+        """
+        Reload a plugin module, swapping its handlers without restarting the bot.
+
+        Only the routes of the module are replaced and only the
+        `setMyCommands` scopes whose commands changed are synced again. A lazy
+        plugin which was never used is simply imported.
+
+        Parameters
+        ----------
+        module_name : str
+            The name the plugin was loaded with.
+        """
+        record = self._plugins.get(module_name)
+        if record is not None and record.lazy:
+            self._load_lazy_plugin(module_name)
+            return
+        module = importlib.import_module(module_name)
+        self._schedule_scope_sync(
+            self._register_plugin(module_name, importlib.reload(module))
+        )
+        self.log(f"Plugin: {module_name} has been reloaded.", "debug")
+
+    def unload_plugin(self, module_name: str) -> None:
+        """
+        Remove the commands and listeners registered by a plugin module.
+
+        Parameters
+        ----------
+        module_name : str
+            The name the plugin was loaded with.
+        """
+        record = self._plugins.pop(module_name, None)
+        if record is None:
+            return
+        for modules in self._lazy_listeners.values():
+            modules.discard(module_name)
+        for details in record.commands:
+            self._remove_command(details)
+        for event_type, func in record.listeners:
+            self._unsubscribe(event_type, func)
+        self._schedule_scope_sync(
+            {
+                self._command_scope_key(details)
+                for details, implements in record.commands.items()
+                if implements != CommandImplements.PREFIX_COMMAND
+            }
+        )
+        self.log(f"Plugin: {module_name} has been unloaded.", "debug")
+
+    def discover_plugins(
+        self, package: str, lazy: bool = True
+    ) -> typing.List[str]:
+        """
+        Find the plugin modules of a package and load them.
+
+        With lazy loading, the commands and listeners of a module are read
+        from its source and the module is only imported when one of its
+        commands is invoked or one of its events is dispatched, which keeps
+        the cold start fast. Modules whose decorators can not be read without
+        running them are imported right away.
+
+        Parameters
+        ----------
+        package : str
+            The importable name of the package holding the plugin modules.
+        lazy : bool
+            Whether the modules are imported on first use. Defaults to True.
+
+        Returns
+        -------
+        typing.List[str]
+            The names of the discovered modules.
+        """
+        spec = importlib.util.find_spec(package)
+        if spec is None or spec.submodule_search_locations is None:
+            raise ValueError(f"Plugin package not found: {package}")
+        discovered: typing.List[str] = []
+        for module_info in pkgutil.iter_modules(
+            spec.submodule_search_locations, prefix=f"{package}."
+        ):
+            module_name = module_info.name
+            discovered.append(module_name)
+            manifest = None
+            if lazy:
+                module_spec = importlib.util.find_spec(module_name)
+                if module_spec is not None and module_spec.loader is not None:
+                    source = module_spec.loader.get_source(module_name)  # type: ignore
+                    if source is not None:
+                        manifest = scan_plugin_source(source)
+            if manifest is None:
+                self.load_plugin(module_name)
+                continue
+            self.unload_plugin(module_name)
+            record = _PluginRecord(commands={}, listeners=[], lazy=True)
+            for details, implements in manifest.commands:
+                self._add_command(
+                    details,
+                    implements,
+                    self._lazy_command(module_name, details),
+                )
+                record.commands[details] = implements
+            for event_name in manifest.listener_names:
+                self._lazy_listeners.setdefault(event_name, set()).add(
+                    module_name
+                )
+            self._plugins[module_name] = record
+            self.log(
+                f"Plugin: {module_name} has been discovered, it will be imported on first use.",
+                "debug",
+            )
+        return discovered
+
     def task(
         self,
         task_type: typing.Literal["datetime", "loop"],
         time: typing.Union[datetime.datetime, int],
     ): ...
 
+    def _resolve_listeners(
+        self, event_type: typing.Type["KiranEvent"]
+    ) -> typing.Tuple[
+        typing.Callable[["KiranEvent"], typing.Awaitable[None]], ...
+    ]:
+        listeners = self._listener_cache.get(event_type)
+        if listeners is None:
+            for base in event_type.__mro__:
+                for module_name in tuple(
+                    self._lazy_listeners.get(base.__name__, ())
+                ):
+                    self._load_lazy_plugin(module_name)
+            listeners = tuple(
+                listener
+                for base in event_type.__mro__
+                for listener in self._subscribed_events.get(base, ())
+            )
+            self._listener_cache[event_type] = listeners
+        return listeners
+
+    async def _run_listener(
+        self,
+        listener: typing.Callable[["KiranEvent"], typing.Awaitable[None]],
+        event: "KiranEvent",
+    ) -> None:
+        try:
+            await listener(event)
+        except Exception as e:
+            self.log(
+                f"Listener {getattr(listener, '__name__', listener)} failed while handling {type(event).__name__}: {e}",
+                "error",
+            )
+            self.log(traceback.format_exc(), "warning")
+
     async def dispatch(self, event: "KiranEvent") -> None:
-        for handler in self._subscribed_events.get(type(event), []):
-            await handler(event)
+        """
+        Dispatch an event to its listeners.
+
+        Listeners of the event class and of every base class are resolved once
+        per concrete event class and cached until `listen` adds a subscription.
+        They run concurrently, and an exception raised by one of them is logged
+        without affecting the others.
+
+        Parameters
+        ----------
+        event : KiranEvent
+            The event to dispatch.
+        """
+        listeners = self._resolve_listeners(type(event))
+        if len(listeners) == 1:
+            await self._run_listener(listeners[0], event)
+        elif listeners:
+            await asyncio.gather(
+                *(self._run_listener(listener, event) for listener in listeners)
+            )
 
     def shutdown(self) -> None:
         self.log("The shutdown event has been dispatched.", "debug")
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import importlib.util
+import typing
+
+import httpx
+
+TELEGRAM_API_URL: typing.Final = "https://api.telegram.org"
+"""The endpoint of the Bot API hosted by Telegram."""
+
+HTTP2_AVAILABLE: typing.Final = importlib.util.find_spec("h2") is not None
+"""
+Whether the `h2` package is installed, HTTP/2 can only be enabled when it is.
+Install it with `pip install httpx[http2]`.
+"""
+
+
+class TransportSettings:
+    """
+    HTTP transport settings of the bot.
+
+    The bot keeps two connection pools. The API pool serves every outbound
+    method call and is sized for concurrency, the polling pool only serves the
+    long-poll `getUpdates` so a slow update never waits behind API calls, and
+    a hung API call never waits for the long-poll timeout.
+
+    Both pools talk to `api_url`, which can point to a self-hosted Bot API
+    server. Started with `--local`, such a server lifts the size limits of
+    files, and in `local_mode` files are exchanged through the file system
+    it shares with the bot: `getFile` answers with absolute paths, read in
+    place, and local files are sent as `file://` URIs instead of uploaded.
+
+    Parameters
+    ----------
+    max_connections : int
+        Maximum number of concurrent connections of the API pool, default is 100.
+    max_keepalive_connections : int
+        Maximum number of idle connections kept alive in the API pool, default is 20.
+    keepalive_expiry : float
+        Seconds an idle connection is kept alive, default is 30.
+    http2 : bool
+        Whether to multiplex API calls over HTTP/2 connections, default is False.
+        Ignored with a warning when the `h2` package is not installed.
+    connect_timeout : float
+        Seconds to wait for a connection to be established, default is 5.
+    read_timeout : float
+        Seconds to wait for a chunk of the response of an API call, default is 30.
+    write_timeout : float
+        Seconds to wait for a chunk of the request to be sent, default is 30.
+    pool_timeout : float
+        Seconds to wait for a free connection of the pool, default is 10.
+    polling_timeout : int
+        Seconds Telegram holds a `getUpdates` call open when there is no
+        update, default is 30. The read timeout of the polling pool is this
+        value plus `read_timeout`.
+    api_url : str
+        The endpoint of the Bot API, default is the one hosted by Telegram.
+    local_mode : bool
+        Whether `api_url` is a Bot API server started with `--local`, on the
+        same file system as the bot, default is False.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        write_timeout: float = 30.0,
+        pool_timeout: float = 10.0,
+        polling_timeout: int = 30,
+        api_url: str = TELEGRAM_API_URL,
+        local_mode: bool = False,
+    ) -> None:
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.write_timeout = write_timeout
+        self.pool_timeout = pool_timeout
+        self.polling_timeout = polling_timeout
+        self.api_url = api_url.rstrip("/")
+        self.local_mode = local_mode
+
+    def __repr__(self) -> str:
+        return f"\nMax Connections: {self.max_connections}\nMax Keepalive Connections: {self.max_keepalive_connections}\nKeepalive Expiry: {self.keepalive_expiry}\nHTTP/2: {self.http2}\nTimeouts: connect={self.connect_timeout} read={self.read_timeout} write={self.write_timeout} pool={self.pool_timeout}\nPolling Timeout: {self.polling_timeout}\nAPI URL: {self.api_url}\nLocal Mode: {self.local_mode}"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    @property
+    def uses_http2(self) -> bool:
+        """Whether HTTP/2 is both requested and available."""
+        return self.http2 and HTTP2_AVAILABLE
+
+    def bot_url(self, token: str) -> str:
+        """
+        Get the URL the methods of a bot are called on.
+
+        Parameters
+        ----------
+        token : str
+            The token of the bot.
+
+        Returns
+        -------
+        str
+            The URL, method names are resolved against it.
+        """
+        return f"{self.api_url}/bot{token}"
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        """The timeouts of API calls."""
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def polling_request_timeout(
+        self, polling_timeout: typing.Optional[int] = None
+    ) -> httpx.Timeout:
+        """
+        Get the timeouts of `getUpdates`, leaving room for the long poll.
+
+        Parameters
+        ----------
+        polling_timeout : typing.Optional[int]
+            The long-poll timeout of the call, defaults to `polling_timeout`.
+
+        Returns
+        -------
+        httpx.Timeout
+            The timeouts, reading for the long poll plus `read_timeout`.
+        """
+        if polling_timeout is None:
+            polling_timeout = self.polling_timeout
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=polling_timeout + self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def build_client(self, base_url: str) -> httpx.AsyncClient:
+        """
+        Build the client of API calls.
+
+        Parameters
+        ----------
+        base_url : str
+            The URL every method name is resolved against.
+
+        Returns
+        -------
+        httpx.AsyncClient
+            The client, pooling connections as configured.
+        """
+        return httpx.AsyncClient(
+            base_url=base_url,
+            http2=self.uses_http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            timeout=self.timeout,
+        )
+
+    def build_polling_client(self, base_url: str) -> httpx.AsyncClient:
+        """
+        Build the client of the long-poll `getUpdates`.
+
+        A single kept-alive HTTP/1.1 connection is enough, as only one
+        `getUpdates` call is in flight at a time.
+
+        Parameters
+        ----------
+        base_url : str
+            The URL `getUpdates` is resolved against.
+
+        Returns
+        -------
+        httpx.AsyncClient
+            The client, with a single connection.
+        """
+        return httpx.AsyncClient(
+            base_url=base_url,
+            limits=httpx.Limits(
+                max_connections=1,
+                max_keepalive_connections=1,
+                keepalive_expiry=self.polling_timeout + self.keepalive_expiry,
+            ),
+            timeout=self.polling_request_timeout(),
+        )
+
+
+DefaultTransportSettings = TransportSettings()
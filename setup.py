@@ -19,6 +19,7 @@ setup(
     packages=find_namespace_packages(include=["kiran*"]),
     entry_points={"console_scripts": ["kiran = kiran.cli:version"]},
     install_requires=["httpx", "requests", "msgspec", "colorama"],
+    extras_require={"http2": ["httpx[http2]"]},
     classifiers=[
         "Environment :: Console",
         "Intended Audience :: Developers",